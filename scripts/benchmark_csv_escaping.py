@@ -0,0 +1,94 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the escaping of CSV exports against CSV injection, comparing the
+vectorized escaping of `df_to_escaped_csv` to escaping every cell in Python.
+
+    python scripts/benchmark_csv_escaping.py --rows 1000000 --columns 5
+    python scripts/benchmark_csv_escaping.py --rows 10000 --columns 500
+"""
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.utils import csv
+
+
+def escape_cells(df: pd.DataFrame, **kwargs: Any) -> Any:
+    """
+    Escape the values of a DataFrame one cell at a time, as it used to be done.
+    """
+    df = df.copy()
+    for name, column in df.items():
+        if column.dtype == np.dtype(object):
+            for idx, value in enumerate(column.values):
+                if isinstance(value, str):
+                    df.at[idx, name] = csv.escape_value(value)
+    return df.to_csv(**kwargs)
+
+
+def generate_df(rows: int, columns: int, ratio: float) -> pd.DataFrame:
+    """
+    Generate string columns where a `ratio` of the values need escaping.
+    """
+    rng = np.random.default_rng(42)
+    data = {}
+    for idx in range(columns):
+        values = np.array([f"value {i}" for i in range(rows)], dtype=object)
+        values[rng.random(rows) < ratio] = "=cmd|' /C calc'!A0"
+        data[f"col_{idx}"] = values
+    return pd.DataFrame(data)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@click.command()
+@click.option("--rows", default=100000, help="Number of rows.")
+@click.option("--columns", default=10, help="Number of string columns.")
+@click.option("--ratio", default=0.01, help="Ratio of values needing escaping.")
+@click.option("--repeat", default=3, help="Number of runs, the best is kept.")
+def main(rows: int, columns: int, ratio: float, repeat: int) -> None:
+    df = generate_df(rows, columns, ratio)
+    arrow_df = df.astype("string[pyarrow]")
+
+    if escape_cells(df, index=False) != csv.df_to_escaped_csv(df, index=False):
+        raise click.ClickException("The vectorized escaping output differs")
+
+    print(f"Escaping {rows} rows x {columns} columns (best of {repeat}):")
+    per_cell = measure(lambda: escape_cells(df, index=False), repeat)
+    print(f"  per cell:          {per_cell:.3f}s")
+    vectorized = measure(lambda: csv.df_to_escaped_csv(df, index=False), repeat)
+    print(f"  vectorized:        {vectorized:.3f}s ({per_cell / vectorized:.1f}x)")
+    arrow = measure(lambda: csv.df_to_escaped_csv(arrow_df, index=False), repeat)
+    print(f"  vectorized, Arrow: {arrow:.3f}s ({per_cell / arrow:.1f}x)")
+    to_csv = measure(lambda: df.to_csv(index=False), repeat)
+    print(f"  to_csv only:       {to_csv:.3f}s")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
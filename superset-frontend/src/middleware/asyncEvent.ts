@@ -62,6 +62,7 @@ const RETRY_DELAY = 100;
 let config: AppConfig;
 let transport: string;
 let pollingDelayMs: number;
+let longPollingTimeoutMs: number;
 let pollingTimeoutId: number;
 let listenersByJobId: Record<string, ListenerFn>;
 let retriesByJobId: Record<string, number>;
@@ -124,7 +125,7 @@ export const waitForAsyncData = async (asyncResponse: AsyncEvent) =>
   });
 
 const fetchEvents = makeApi<
-  { last_id?: string | null },
+  { last_id?: string | null; timeout?: number },
   { result: AsyncEvent[] }
 >({
   method: 'GET',
@@ -167,18 +168,25 @@ export const processEvents = async (events: AsyncEvent[]) => {
 };
 
 const loadEventsFromApi = async () => {
-  const eventArgs = lastReceivedEventId ? { last_id: lastReceivedEventId } : {};
+  const eventArgs = {
+    ...(lastReceivedEventId ? { last_id: lastReceivedEventId } : {}),
+    ...(longPollingTimeoutMs ? { timeout: longPollingTimeoutMs } : {}),
+  };
+  // with long polling, the server waits for new events before responding, so
+  // the next request can be sent right away
+  let delayMs = pollingDelayMs;
   if (Object.keys(listenersByJobId).length) {
     try {
       const { result: events } = await fetchEvents(eventArgs);
       if (events?.length) await processEvents(events);
+      if (longPollingTimeoutMs) delayMs = 0;
     } catch (err) {
       logging.warn(err);
     }
   }
 
   if (transport === TRANSPORT_POLLING) {
-    pollingTimeoutId = window.setTimeout(loadEventsFromApi, pollingDelayMs);
+    pollingTimeoutId = window.setTimeout(loadEventsFromApi, delayMs);
   }
 };
 
@@ -252,6 +260,7 @@ export const init = (appConfig?: AppConfig) => {
   }
   transport = config.GLOBAL_ASYNC_QUERIES_TRANSPORT || TRANSPORT_POLLING;
   pollingDelayMs = config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY || 500;
+  longPollingTimeoutMs = config.GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT || 0;
 
   try {
     lastReceivedEventId = localStorage.getItem(LOCALSTORAGE_KEY);
@@ -16,7 +16,7 @@
 # under the License.
 import logging
 
-from flask import request, Response
+from flask import current_app, request, Response
 from flask_appbuilder import expose
 from flask_appbuilder.api import BaseApi, safe
 from flask_appbuilder.security.decorators import permission_name, protect
@@ -54,6 +54,14 @@ class AsyncEventsRestApi(BaseApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Time to wait for new events when there are none yet, in
+              milliseconds. Capped by GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT,
+              long polling being disabled when it is 0
+            schema:
+                type: integer
           responses:
             200:
               description: Async event results
@@ -93,7 +101,13 @@ class AsyncEventsRestApi(BaseApi):
                 "channel"
             ]
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            block_ms = min(
+                request.args.get("timeout", 0, type=int),
+                current_app.config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"],
+            )
+            events = async_query_manager.read_events(
+                async_channel_id, last_event_id, block_ms=max(block_ms, 0)
+            )
 
         except AsyncQueryTokenException:
             return self.response_401()
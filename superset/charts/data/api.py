@@ -42,11 +42,12 @@ from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.connectors.base.models import BaseDatasource
 from superset.dao.exceptions import DatasourceNotFound
+from superset.dataframe import set_arrow_ipc_metadata
 from superset.exceptions import QueryObjectValidationError
 from superset.extensions import event_logger
 from superset.utils.async_query_manager import AsyncQueryTokenException
 from superset.utils.core import create_zip, get_user_id, json_int_dttm_ser
-from superset.views.base import CsvResponse, generate_download_headers
+from superset.views.base import generate_download_headers, stream_csv_response
 from superset.views.base_api import statsd_metrics
 
 if TYPE_CHECKING:
@@ -54,6 +55,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+# metadata of the query results attached to the schema of Arrow IPC streams
+ARROW_METADATA_KEYS = ("colnames", "rowcount", "status", "is_cached", "rollup")
+
+# result formats that can be loaded asynchronously with GLOBAL_ASYNC_QUERIES
+ASYNC_RESULT_FORMATS = {
+    ChartDataResultFormat.ARROW,
+    ChartDataResultFormat.COLUMNAR,
+    ChartDataResultFormat.JSON,
+}
+
 
 class ChartDataRestApi(ChartRestApi):
     include_route_methods = {"get_data", "data", "data_from_cache"}
@@ -153,10 +165,10 @@ class ChartDataRestApi(ChartRestApi):
                 )
             )
 
-        # TODO: support CSV, SQL query and other non-JSON types
+        # TODO: support CSV, SQL query and other result types
         if (
             is_feature_enabled("GLOBAL_ASYNC_QUERIES")
-            and query_context.result_format == ChartDataResultFormat.JSON
+            and query_context.result_format in ASYNC_RESULT_FORMATS
             and query_context.result_type == ChartDataResultType.FULL
         ):
             return self._run_async(json_body, command)
@@ -243,10 +255,10 @@ class ChartDataRestApi(ChartRestApi):
                 )
             )
 
-        # TODO: support CSV, SQL query and other non-JSON types
+        # TODO: support CSV, SQL query and other result types
         if (
             is_feature_enabled("GLOBAL_ASYNC_QUERIES")
-            and query_context.result_format == ChartDataResultFormat.JSON
+            and query_context.result_format in ASYNC_RESULT_FORMATS
             and query_context.result_type == ChartDataResultType.FULL
         ):
             return self._run_async(json_body, command)
@@ -364,7 +376,10 @@ class ChartDataRestApi(ChartRestApi):
             if len(result["queries"]) == 1:
                 # return single query results csv format
                 data = result["queries"][0]["data"]
-                return CsvResponse(data, headers=generate_download_headers("csv"))
+                return stream_csv_response(
+                    [data] if isinstance(data, str) else data,
+                    headers=generate_download_headers("csv"),
+                )
 
             # return multi-query csv results bundled as a zip file
             encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
@@ -378,7 +393,32 @@ class ChartDataRestApi(ChartRestApi):
                 mimetype="application/zip",
             )
 
-        if result_format == ChartDataResultFormat.JSON:
+        if result_format == ChartDataResultFormat.ARROW:
+            # the metadata of the results is carried by the schema of each stream
+            streams = [
+                set_arrow_ipc_metadata(
+                    query["data"], {key: query.get(key) for key in ARROW_METADATA_KEYS}
+                )
+                for query in result["queries"]
+            ]
+            if len(streams) == 1:
+                # return single query results as an Arrow IPC stream
+                return Response(streams[0], mimetype=ARROW_STREAM_MIMETYPE)
+
+            # return multi-query results bundled as a zip file of Arrow IPC streams
+            files = {
+                f"query_{idx + 1}.arrows": stream for idx, stream in enumerate(streams)
+            }
+            return Response(
+                create_zip(files),
+                headers=generate_download_headers("zip"),
+                mimetype="application/zip",
+            )
+
+        if result_format in {
+            ChartDataResultFormat.COLUMNAR,
+            ChartDataResultFormat.JSON,
+        }:
             response_data = simplejson.dumps(
                 {"result": result["queries"]},
                 default=json_int_dttm_ser,
@@ -398,7 +438,7 @@ class ChartDataRestApi(ChartRestApi):
         datasource: Optional[BaseDatasource] = None,
     ) -> Response:
         try:
-            result = command.run(force_cached=force_cached)
+            result = command.run(force_cached=force_cached, stream_csv=True)
         except ChartDataCacheLoadError as exc:
             return self.response_422(message=exc.message)
         except ChartDataQueryFailedError as exc:
@@ -22,6 +22,7 @@ from superset.charts.commands.exceptions import (
     ChartDataQueryFailedError,
 )
 from superset.commands.base import BaseCommand
+from superset.common.chart_data import ChartDataResultFormat
 from superset.common.query_context import QueryContext
 from superset.exceptions import CacheLoadError
 
@@ -39,6 +40,12 @@ class ChartDataCommand(BaseCommand):
         # (also evals `force` property)
         cache_query_context = kwargs.get("cache", False)
         force_cached = kwargs.get("force_cached", False)
+        # the CSV of a single query is returned as chunks, streamed to the client
+        self._query_context.stream_csv = (
+            kwargs.get("stream_csv", False)
+            and self._query_context.result_format == ChartDataResultFormat.CSV
+            and len(self._query_context.queries) == 1
+        )
         try:
             payload = self._query_context.get_payload(
                 cache_query_context=cache_query_context, force_cached=force_cached
@@ -32,12 +32,19 @@ from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import pandas as pd
 
 from superset.common.chart_data import ChartDataResultFormat
+from superset.dataframe import (
+    arrow_ipc_to_df,
+    columnar_to_df,
+    df_to_arrow_ipc,
+    df_to_columnar,
+)
 from superset.utils.core import (
     DTTM_ALIAS,
     extract_dataframe_dtypes,
     get_column_names,
     get_metric_names,
 )
+from superset.utils.csv import join_csv_chunks
 
 if TYPE_CHECKING:
     from superset.connectors.base.models import BaseDatasource
@@ -327,6 +334,9 @@ def apply_post_process(
         if query["result_format"] not in (rf.value for rf in ChartDataResultFormat):
             raise Exception(f"Result format {query['result_format']} not supported")
 
+        if query["result_format"] == ChartDataResultFormat.CSV and query["data"]:
+            query["data"] = join_csv_chunks(query["data"])
+
         if not query["data"]:
             # do not try to process empty data
             continue
@@ -335,6 +345,10 @@ def apply_post_process(
             df = pd.DataFrame.from_dict(query["data"])
         elif query["result_format"] == ChartDataResultFormat.CSV:
             df = pd.read_csv(StringIO(query["data"]))
+        elif query["result_format"] == ChartDataResultFormat.COLUMNAR:
+            df = columnar_to_df(query["data"])
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            df = arrow_ipc_to_df(query["data"])
 
         # convert all columns to verbose (label) name
         if datasource:
@@ -365,6 +379,10 @@ def apply_post_process(
 
         if query["result_format"] == ChartDataResultFormat.JSON:
             query["data"] = processed_df.to_dict()
+        elif query["result_format"] == ChartDataResultFormat.COLUMNAR:
+            query["data"] = df_to_columnar(processed_df)
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            query["data"] = df_to_arrow_ipc(processed_df.reset_index())
         elif query["result_format"] == ChartDataResultFormat.CSV:
             buf = StringIO()
             processed_df.to_csv(buf)
@@ -1277,6 +1277,15 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    rollup = fields.String(
+        description="The rollup table the query was routed to, if any",
+        allow_none=True,
+    )
+    is_stale = fields.Boolean(
+        description="Is the result served from the cache past its cache timeout, "
+        "while being refreshed in the background",
+        allow_none=None,
+    )
     query = fields.String(
         description="The executed query statement",
         required=True,
@@ -1305,7 +1314,25 @@ class ChartDataResponseResult(Schema):
         description="Amount of rows in result set",
         allow_none=False,
     )
-    data = fields.List(fields.Dict(), description="A list with results")
+    data = fields.Raw(
+        # TODO: add correct union type once supported by Marshmallow
+        description="A list with results. With the `columnar` result format, an "
+        "object with the list of `columns` and the list of values of each column "
+        "in `data`",
+        oneOf=[
+            {"type": "array", "items": {"type": "object"}},
+            {
+                "type": "object",
+                "properties": {
+                    "columns": {"type": "array", "items": {"type": "string"}},
+                    "data": {
+                        "type": "object",
+                        "additionalProperties": {"type": "array", "items": {}},
+                    },
+                },
+            },
+        ],
+    )
     colnames = fields.List(fields.String(), description="A list of column names")
     coltypes = fields.List(
         fields.Integer(), description="A list of generic data types of each column"
@@ -22,6 +22,8 @@ class ChartDataResultFormat(str, Enum):
     Chart data response format
     """
 
+    ARROW = "arrow"
+    COLUMNAR = "columnar"
     CSV = "csv"
     JSON = "json"
 
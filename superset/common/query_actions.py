@@ -109,7 +109,10 @@ def _get_full(
         payload["colnames"] = list(df.columns)
         payload["indexnames"] = list(df.index)
         payload["coltypes"] = extract_dataframe_dtypes(df, datasource)
-        payload["data"] = query_context.get_data(df)
+        if query_context.stream_csv:
+            payload["data"] = query_context.get_csv_chunks(df)
+        else:
+            payload["data"] = query_context.get_data(df)
         payload["result_format"] = query_context.result_format
     del payload["df"]
 
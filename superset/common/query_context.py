@@ -17,7 +17,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, ClassVar, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, TYPE_CHECKING, Union
 
 import pandas as pd
 
@@ -54,6 +54,8 @@ class QueryContext:
     result_format: ChartDataResultFormat
     force: bool
     custom_cache_timeout: Optional[int]
+    # whether the CSV data of the query is returned as chunks to stream
+    stream_csv: bool = False
 
     cache_values: Dict[str, Any]
 
@@ -88,9 +90,12 @@ class QueryContext:
     def get_data(
         self,
         df: pd.DataFrame,
-    ) -> Union[str, List[Dict[str, Any]]]:
+    ) -> Union[str, bytes, Dict[str, Any], List[Dict[str, Any]]]:
         return self._processor.get_data(df)
 
+    def get_csv_chunks(self, df: pd.DataFrame) -> Iterator[str]:
+        return self._processor.get_csv_chunks(df)
+
     def get_payload(
         self,
         cache_query_context: Optional[bool] = False,
@@ -110,6 +115,25 @@ class QueryContext:
             return self.datasource.database.cache_timeout
         return None
 
+    def get_cache_stale_timeout(self) -> Optional[int]:
+        if (
+            hasattr(self.datasource, "extra_dict")
+            and (stale_timeout := self.datasource.extra_dict.get("cache_stale_timeout"))
+            is not None
+        ):
+            return stale_timeout
+        if (
+            hasattr(self.datasource, "database")
+            and (
+                stale_timeout := self.datasource.database.get_extra().get(
+                    "cache_stale_timeout"
+                )
+            )
+            is not None
+        ):
+            return stale_timeout
+        return None
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> Optional[str]:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
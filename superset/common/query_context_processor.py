@@ -19,10 +19,24 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from typing import Any, ClassVar, Dict, List, Optional, TYPE_CHECKING, Union
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
+import sqlalchemy as sa
 from flask_babel import _
 from pandas import DateOffset
 from typing_extensions import TypedDict
@@ -35,9 +49,16 @@ from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
 from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.common.utils.time_bucket_utils import (
+    get_orderby_labels,
+    get_time_buckets,
+    is_aligned_bucket_size,
+    split_df_by_time_buckets,
+)
 from superset.common.utils.time_range_utils import get_since_until_from_query_object
 from superset.connectors.base.models import BaseDatasource
 from superset.constants import CacheRegion
+from superset.dataframe import df_to_arrow_ipc, df_to_columnar
 from superset.exceptions import (
     InvalidPostProcessingError,
     QueryObjectValidationError,
@@ -48,16 +69,22 @@ from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
 from superset.utils import csv
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import map_concurrently
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
     DTTM_ALIAS,
     error_msg_from_exception,
+    FilterOperator,
     get_base_axis_labels,
+    get_column_name,
     get_column_names_from_columns,
     get_column_names_from_metrics,
     get_metric_names,
+    get_user_id,
     get_xaxis_label,
+    is_adhoc_column,
+    memoize_datasource_queries,
     normalize_dttm_col,
     TIME_COMPARISON,
 )
@@ -101,6 +128,7 @@ class QueryContextProcessor:
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
 
+    @memoize_datasource_queries()
     def get_df_payload(
         self, query_obj: QueryObject, force_cached: Optional[bool] = False
     ) -> Dict[str, Any]:
@@ -114,39 +142,18 @@ class QueryContextProcessor:
         )
 
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                invalid_columns = [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]
-
-                if invalid_columns:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
-                        )
-                    )
-
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=self._query_context.force,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+            with QueryCacheManager.single_flight(
+                None if self._query_context.force else cache_key, CacheRegion.DATA
+            ) as should_query:
+                if not should_query:
+                    # another request loaded the data while we were waiting
+                    cache = QueryCacheManager.get(cache_key, CacheRegion.DATA)
+                if not cache.is_loaded:
+                    self._load_query_result(query_obj, cache_key, cache)
+        elif cache.is_stale and QueryCacheManager.claim_refresh(
+            cache_key, CacheRegion.DATA, (cache.cache_value or {}).get("expires")
+        ):
+            self._refresh_stale_cache()
 
         # the N-dimensional DataFrame has converteds into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -168,6 +175,8 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": cache.is_stale,
+            "rollup": cache.rollup,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -177,6 +186,56 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    def _load_query_result(
+        self, query_obj: QueryObject, cache_key: str, cache: QueryCacheManager
+    ) -> None:
+        """Runs the query of a QueryObject and caches its result"""
+        try:
+            invalid_columns = [
+                col
+                for col in get_column_names_from_columns(query_obj.columns)
+                + get_column_names_from_metrics(query_obj.metrics or [])
+                if (col not in self._qc_datasource.column_names and col != DTTM_ALIAS)
+            ]
+
+            if invalid_columns:
+                raise QueryObjectValidationError(
+                    _(
+                        "Columns missing in dataset: %(invalid_columns)s",
+                        invalid_columns=invalid_columns,
+                    )
+                )
+
+            query_result = self.get_query_result(query_obj)
+            annotation_data = self.get_annotation_data(query_obj)
+            cache.set_query_result(
+                key=cache_key,
+                query_result=query_result,
+                annotation_data=annotation_data,
+                force_query=self._query_context.force,
+                timeout=self.get_cache_timeout(),
+                datasource_uid=self._qc_datasource.uid,
+                region=CacheRegion.DATA,
+                stale_timeout=self.get_cache_stale_timeout(),
+            )
+        except QueryObjectValidationError as ex:
+            cache.error_message = str(ex)
+            cache.status = QueryStatus.FAILED
+
+    def _refresh_stale_cache(self) -> None:
+        """Reloads the cached data of the query context in a Celery task"""
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        refresh_chart_data_cache.delay(
+            get_user_id(),
+            {
+                **self._query_context.cache_values,
+                "form_data": self._query_context.form_data,
+                "custom_cache_timeout": self._query_context.custom_cache_timeout,
+            },
+        )
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> Optional[str]:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -209,7 +268,9 @@ class QueryContextProcessor:
             # todo(hugh): add logic to manage all sip68 models here
             result = query_context.datasource.exc_query(query_object.to_dict())
         else:
-            result = query_context.datasource.query(query_object.to_dict())
+            result = self.get_query_result_by_time_bucket(
+                query_object
+            ) or query_context.datasource.query(query_object.to_dict())
             query = result.query + ";\n\n"
 
         df = result.df
@@ -241,6 +302,185 @@ class QueryContextProcessor:
         result.to_dttm = query_object.to_dttm
         return result
 
+    def get_time_bucket_size(self, query_object: QueryObject) -> Optional[timedelta]:
+        """
+        Returns the size of the time buckets the results of a query object can be
+        cached by, if any. Only aggregated queries on a time grain that has buckets
+        configured in `TIMESERIES_CACHE_BUCKETS`, without limits applying to the
+        whole time range, qualify.
+        """
+        if (
+            isinstance(self._qc_datasource, Query)
+            or not query_object.metrics
+            or query_object.series_limit
+            or query_object.is_rowcount
+            or query_object.row_offset
+        ):
+            return None
+
+        if xaxis_label := get_xaxis_label(query_object.columns):
+            if xaxis_label not in self._qc_datasource.dttm_cols:
+                return None
+            time_grain = next(
+                (
+                    col.get("timeGrain")
+                    for col in query_object.columns
+                    if is_adhoc_column(col) and get_column_name(col) == xaxis_label
+                ),
+                None,
+            )
+        elif query_object.is_timeseries and query_object.granularity:
+            time_grain = query_object.extras.get("time_grain_sqla")
+        else:
+            return None
+
+        # the merged buckets can only be sorted by the columns and metrics they hold
+        labels = {
+            *get_column_names_from_columns(query_object.columns),
+            *get_metric_names(query_object.metrics),
+        }
+        if not all(label in labels for label, _ in get_orderby_labels(query_object)):
+            return None
+
+        bucket_size = config["TIMESERIES_CACHE_BUCKETS"].get(time_grain)
+        if bucket_size and not is_aligned_bucket_size(time_grain, bucket_size):
+            logger.warning(
+                "Not caching results by time bucket for the time grain %s, "
+                "whose periods aren't aligned to buckets of %s",
+                time_grain,
+                bucket_size,
+            )
+            return None
+        return bucket_size
+
+    # pylint: disable=too-many-locals
+    def get_query_result_by_time_bucket(
+        self, query_object: QueryObject
+    ) -> Optional[QueryResult]:
+        """
+        Runs the query of a timeseries query object bucket by bucket, only querying
+        the buckets missing from the cache and merging them back in time order.
+
+        Returns `None` when the query object doesn't qualify, or when a limit was
+        reached, in which case the whole time range has to be queried at once.
+        """
+        if not (bucket_size := self.get_time_bucket_size(query_object)):
+            return None
+        from_dttm, to_dttm = get_since_until_from_query_object(query_object)
+        if (
+            not from_dttm
+            or not to_dttm
+            or (to_dttm - from_dttm) / bucket_size
+            > config["TIMESERIES_CACHE_MAX_BUCKETS"]
+        ):
+            return None
+
+        xaxis_label = get_xaxis_label(query_object.columns)
+        query_object_clone = copy.copy(query_object)
+        query_object_clone.granularity = query_object.granularity or xaxis_label
+        query_object_clone.filter = [
+            flt
+            for flt in query_object.filter
+            if not (
+                flt.get("col") == xaxis_label
+                and flt.get("op") == FilterOperator.TEMPORAL_RANGE.value
+            )
+        ]
+        query_object_clone.time_range = None
+        query_object_clone.time_offsets = []
+        query_object_clone.post_processing = []
+
+        buckets = get_time_buckets(from_dttm, to_dttm, bucket_size, datetime.now())
+        cache_keys = [
+            self.query_cache_key(
+                query_object_clone,
+                time_bucket=[bucket.start.isoformat(), bucket.end.isoformat()],
+            )
+            if bucket.is_cacheable
+            else None
+            for bucket in buckets
+        ]
+        dfs: List[Optional[pd.DataFrame]] = []
+        queries: List[str] = []
+        applied_template_filters: List[str] = []
+        duration = timedelta(0)
+        rollup: Optional[str] = None
+        for cache_key in cache_keys:
+            cache = QueryCacheManager.get(
+                cache_key, CacheRegion.DATA, self._query_context.force
+            )
+            dfs.append(cache.df if cache.is_loaded else None)
+            if cache.is_loaded:
+                queries.append(cache.query)
+
+        # query each run of contiguous buckets that are missing from the cache at once
+        idx = 0
+        while idx < len(buckets):
+            if dfs[idx] is not None:
+                idx += 1
+                continue
+            end_idx = idx
+            while end_idx + 1 < len(buckets) and dfs[end_idx + 1] is None:
+                end_idx += 1
+
+            query_object_clone.from_dttm = buckets[idx].start
+            query_object_clone.to_dttm = buckets[end_idx].end
+            result = self._qc_datasource.query(query_object_clone.to_dict())
+            if result.status == QueryStatus.FAILED:
+                return result
+            if query_object.row_limit and len(result.df) >= query_object.row_limit:
+                return None
+            queries.append(result.query)
+            applied_template_filters.extend(result.applied_template_filters)
+            duration += result.duration
+            rollup = rollup or result.rollup
+
+            run_dfs = split_df_by_time_buckets(
+                result.df,
+                xaxis_label or DTTM_ALIAS,
+                buckets[idx : end_idx + 1],
+            )
+            if run_dfs is None:
+                # rows can't be assigned to buckets, keep them without caching them
+                dfs[idx : end_idx + 1] = [result.df] + [result.df.iloc[:0]] * (
+                    end_idx - idx
+                )
+            else:
+                dfs[idx : end_idx + 1] = run_dfs
+                for cache_key, df in zip(cache_keys[idx : end_idx + 1], run_dfs):
+                    QueryCacheManager.set(
+                        key=cache_key,
+                        value={"df": df, "query": result.query},
+                        timeout=self.get_cache_timeout(),
+                        datasource_uid=self._qc_datasource.uid,
+                        region=CacheRegion.DATA,
+                    )
+            idx = end_idx + 1
+
+        df = pd.concat(dfs, ignore_index=True)
+        if query_object.row_limit and len(df) > query_object.row_limit:
+            return None
+        if orderby := get_orderby_labels(query_object):
+            # the buckets are in time order, restore the order of the query, the
+            # stable sort keeping the rows that tie in time order
+            if not all(label in df.columns for label, _ in orderby):
+                return None
+            df = df.sort_values(
+                by=[label for label, _ in orderby],
+                ascending=[ascending for _, ascending in orderby],
+                kind="mergesort",
+                ignore_index=True,
+            )
+        return QueryResult(
+            df=df,
+            query=";\n\n".join(dict.fromkeys(queries)),
+            duration=duration,
+            applied_template_filters=list(dict.fromkeys(applied_template_filters)),
+            from_dttm=from_dttm,
+            to_dttm=to_dttm,
+            rollup=rollup,
+        )
+
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
         # todo: should support "python_date_format" and "get_column" in each datasource
         def _get_timestamp_format(
@@ -303,18 +543,11 @@ class QueryContextProcessor:
 
         return df
 
-    def processing_time_offsets(  # pylint: disable=too-many-locals,too-many-statements
+    def processing_time_offsets(
         self,
         df: pd.DataFrame,
         query_object: QueryObject,
     ) -> CachedTimeOffset:
-        query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
-        queries: List[str] = []
-        cache_keys: List[Optional[str]] = []
-        rv_dfs: List[pd.DataFrame] = [df]
-
         time_offsets = query_object.time_offsets
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -324,140 +557,210 @@ class QueryContextProcessor:
                     "when using a Time Comparison."
                 )
             )
-        for offset in time_offsets:
-            try:
-                # pylint: disable=line-too-long
-                # Since the xaxis is also a column name for the time filter, xaxis_label will be set as granularity
-                # these query object are equivalent:
-                # 1) { granularity: 'dttm_col', time_range: '2020 : 2021', time_offsets: ['1 year ago']}
-                # 2) { columns: [
-                #        {label: 'dttm_col', sqlExpression: 'dttm_col', "columnType": "BASE_AXIS" }
-                #      ],
-                #      time_offsets: ['1 year ago'],
-                #      filters: [{col: 'dttm_col', op: 'TEMPORAL_RANGE', val: '2020 : 2021'}],
-                #    }
-                query_object_clone.from_dttm = get_past_or_future(
-                    offset,
-                    outer_from_dttm,
-                )
-                query_object_clone.to_dttm = get_past_or_future(offset, outer_to_dttm)
 
-                xaxis_label = get_xaxis_label(query_object.columns)
-                query_object_clone.granularity = (
-                    query_object_clone.granularity or xaxis_label
-                )
-            except ValueError as ex:
-                raise QueryObjectValidationError(str(ex)) from ex
-            # make sure subquery use main query where clause
-            query_object_clone.inner_from_dttm = outer_from_dttm
-            query_object_clone.inner_to_dttm = outer_to_dttm
-            query_object_clone.time_offsets = []
-            query_object_clone.post_processing = []
-            query_object_clone.filter = [
-                flt
-                for flt in query_object_clone.filter
-                if flt.get("col") != xaxis_label
-            ]
+        # offset queries are independent of each other, and run concurrently
+        results = self._map_concurrently(
+            lambda offset: self._processing_time_offset(
+                df, query_object, offset, outer_from_dttm, outer_to_dttm
+            ),
+            time_offsets,
+        )
+        offset_dfs, queries, cache_keys = (
+            [list(values) for values in zip(*results)] if results else ([], [], [])
+        )
+        rv_dfs: List[pd.DataFrame] = [df, *offset_dfs]
 
-            # `offset` is added to the hash function
-            cache_key = self.query_cache_key(query_object_clone, time_offset=offset)
-            cache = QueryCacheManager.get(
-                cache_key, CacheRegion.DATA, query_context.force
+        rv_df = pd.concat(rv_dfs, axis=1, copy=False) if time_offsets else df
+        return CachedTimeOffset(df=rv_df, queries=queries, cache_keys=cache_keys)
+
+    def _processing_time_offset(  # pylint: disable=too-many-locals,too-many-arguments
+        self,
+        df: pd.DataFrame,
+        query_object: QueryObject,
+        offset: str,
+        outer_from_dttm: datetime,
+        outer_to_dttm: datetime,
+    ) -> Tuple[pd.DataFrame, str, Optional[str]]:
+        """
+        Returns the metrics of a query object shifted by a time offset, along with
+        the query that was executed and its cache key if it was loaded from the cache
+        """
+        query_context = self._query_context
+        # ensure query_object is immutable
+        query_object_clone = copy.copy(query_object)
+        try:
+            # pylint: disable=line-too-long
+            # Since the xaxis is also a column name for the time filter, xaxis_label will be set as granularity
+            # these query object are equivalent:
+            # 1) { granularity: 'dttm_col', time_range: '2020 : 2021', time_offsets: ['1 year ago']}
+            # 2) { columns: [
+            #        {label: 'dttm_col', sqlExpression: 'dttm_col', "columnType": "BASE_AXIS" }
+            #      ],
+            #      time_offsets: ['1 year ago'],
+            #      filters: [{col: 'dttm_col', op: 'TEMPORAL_RANGE', val: '2020 : 2021'}],
+            #    }
+            query_object_clone.from_dttm = get_past_or_future(
+                offset,
+                outer_from_dttm,
             )
-            # whether hit on the cache
-            if cache.is_loaded:
-                rv_dfs.append(cache.df)
-                queries.append(cache.query)
-                cache_keys.append(cache_key)
-                continue
+            query_object_clone.to_dttm = get_past_or_future(offset, outer_to_dttm)
 
-            query_object_clone_dct = query_object_clone.to_dict()
-            # rename metrics: SUM(value) => SUM(value) 1 year ago
-            metrics_mapping = {
-                metric: TIME_COMPARISON.join([metric, offset])
-                for metric in get_metric_names(
-                    query_object_clone_dct.get("metrics", [])
-                )
-            }
-            join_keys = [col for col in df.columns if col not in metrics_mapping.keys()]
+            xaxis_label = get_xaxis_label(query_object.columns)
+            query_object_clone.granularity = (
+                query_object_clone.granularity or xaxis_label
+            )
+        except ValueError as ex:
+            raise QueryObjectValidationError(str(ex)) from ex
+        # make sure subquery use main query where clause
+        query_object_clone.inner_from_dttm = outer_from_dttm
+        query_object_clone.inner_to_dttm = outer_to_dttm
+        query_object_clone.time_offsets = []
+        query_object_clone.post_processing = []
+        query_object_clone.filter = [
+            flt for flt in query_object_clone.filter if flt.get("col") != xaxis_label
+        ]
 
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
+        # `offset` is added to the hash function
+        cache_key = self.query_cache_key(query_object_clone, time_offset=offset)
+        cache = QueryCacheManager.get(cache_key, CacheRegion.DATA, query_context.force)
+        # whether hit on the cache
+        if cache.is_loaded:
+            return cache.df, cache.query, cache_key
+
+        query_object_clone_dct = query_object_clone.to_dict()
+        # rename metrics: SUM(value) => SUM(value) 1 year ago
+        metrics_mapping = {
+            metric: TIME_COMPARISON.join([metric, offset])
+            for metric in get_metric_names(query_object_clone_dct.get("metrics", []))
+        }
+        join_keys = [col for col in df.columns if col not in metrics_mapping.keys()]
 
-            queries.append(result.query)
-            cache_keys.append(None)
-
-            offset_metrics_df = result.df
-            if offset_metrics_df.empty:
-                offset_metrics_df = pd.DataFrame(
-                    {
-                        col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
-                    }
-                )
-            else:
-                # 1. normalize df, set dttm column
-                offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
-                )
+        if isinstance(self._qc_datasource, Query):
+            result = self._qc_datasource.exc_query(query_object_clone_dct)
+        else:
+            result = self._qc_datasource.query(query_object_clone_dct)
 
-                # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
-
-                # 3. set time offset for index
-                index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
-                if not dataframe_utils.is_datetime_series(offset_metrics_df.get(index)):
-                    raise QueryObjectValidationError(
-                        _(
-                            "A time column must be specified "
-                            "when using a Time Comparison."
-                        )
-                    )
+        offset_metrics_df = result.df
+        if offset_metrics_df.empty:
+            offset_metrics_df = pd.DataFrame(
+                {col: [np.NaN] for col in join_keys + list(metrics_mapping.values())}
+            )
+        else:
+            # 1. normalize df, set dttm column
+            offset_metrics_df = self.normalize_df(
+                offset_metrics_df, query_object_clone
+            )
 
-                offset_metrics_df[index] = offset_metrics_df[index] - DateOffset(
-                    **normalize_time_delta(offset)
+            # 2. rename extra query columns
+            offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+
+            # 3. set time offset for index
+            index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+            if not dataframe_utils.is_datetime_series(offset_metrics_df.get(index)):
+                raise QueryObjectValidationError(
+                    _("A time column must be specified when using a Time Comparison.")
                 )
 
-            # df left join `offset_metrics_df`
-            offset_df = dataframe_utils.left_join_df(
-                left_df=df,
-                right_df=offset_metrics_df,
-                join_keys=join_keys,
+            offset_metrics_df[index] = offset_metrics_df[index] - DateOffset(
+                **normalize_time_delta(offset)
             )
-            offset_slice = offset_df[metrics_mapping.values()]
-
-            # set offset_slice to cache and stack.
-            value = {
-                "df": offset_slice,
-                "query": result.query,
-            }
-            cache.set(
-                key=cache_key,
-                value=value,
-                timeout=self.get_cache_timeout(),
-                datasource_uid=query_context.datasource.uid,
-                region=CacheRegion.DATA,
-            )
-            rv_dfs.append(offset_slice)
 
-        rv_df = pd.concat(rv_dfs, axis=1, copy=False) if time_offsets else df
-        return CachedTimeOffset(df=rv_df, queries=queries, cache_keys=cache_keys)
+        # df left join `offset_metrics_df`
+        offset_df = dataframe_utils.left_join_df(
+            left_df=df,
+            right_df=offset_metrics_df,
+            join_keys=join_keys,
+        )
+        offset_slice = offset_df[metrics_mapping.values()]
 
-    def get_data(self, df: pd.DataFrame) -> Union[str, List[Dict[str, Any]]]:
+        # set offset_slice to cache
+        value = {
+            "df": offset_slice,
+            "query": result.query,
+        }
+        cache.set(
+            key=cache_key,
+            value=value,
+            timeout=self.get_cache_timeout(),
+            datasource_uid=query_context.datasource.uid,
+            region=CacheRegion.DATA,
+        )
+        return offset_slice, result.query, None
+
+    def get_data(
+        self, df: pd.DataFrame
+    ) -> Union[str, bytes, Dict[str, Any], List[Dict[str, Any]]]:
         if self._query_context.result_format == ChartDataResultFormat.CSV:
-            include_index = not isinstance(df.index, pd.RangeIndex)
-            columns = list(df.columns)
-            verbose_map = self._qc_datasource.data.get("verbose_map", {})
-            if verbose_map:
-                df.columns = [verbose_map.get(column, column) for column in columns]
+            return "".join(self.get_csv_chunks(df))
+
+        if self._query_context.result_format == ChartDataResultFormat.COLUMNAR:
+            return df_to_columnar(df)
+
+        if self._query_context.result_format == ChartDataResultFormat.ARROW:
+            return df_to_arrow_ipc(df)
+
+        return df.to_dict(orient="records")
+
+    def get_csv_chunks(self, df: pd.DataFrame) -> Iterator[str]:
+        """
+        Convert the data to CSV lazily, so that it can be streamed to the client.
+        """
+        include_index = not isinstance(df.index, pd.RangeIndex)
+        columns = list(df.columns)
+        verbose_map = self._qc_datasource.data.get("verbose_map", {})
+        if verbose_map:
+            df.columns = [verbose_map.get(column, column) for column in columns]
+        if include_index:
             result = csv.df_to_escaped_csv(
                 df, index=include_index, **config["CSV_EXPORT"]
             )
-            return result or ""
+            yield result or ""
+            return
+
+        # escape and convert the rows in batches, to bound the memory used by the
+        # escaped copies of the data
+        for chunk in csv.df_to_escaped_csv_chunks(
+            csv.iter_df_batches(df, config["CSV_EXPORT_BATCH_SIZE"]),
+            index=False,
+            **config["CSV_EXPORT"],
+        ):
+            yield chunk or ""
+
+    def _map_concurrently(
+        self, func: Callable[[Any], Any], items: Iterable[Any]
+    ) -> List[Any]:
+        """
+        Apply a function running queries to items, up to
+        `CHART_DATA_QUERY_CONCURRENCY` of them at a time.
 
-        return df.to_dict(orient="records")
+        The datasource belongs to the session of the current thread, which isn't
+        thread-safe, so the attributes and relationships used by the queries are
+        loaded before fanning out rather than lazily from the worker threads.
+        """
+        items = list(items)
+        max_workers = config["CHART_DATA_QUERY_CONCURRENCY"]
+        if max_workers > 1 and len(items) > 1:
+            self._load_datasource()
+        return map_concurrently(func, items, max_workers)
+
+    def _load_datasource(self) -> None:
+        datasource = self._qc_datasource
+        state = sa.inspect(datasource, raiseerr=False)
+        if state is None or state.session is None:
+            return
+
+        objects = [datasource]
+        for name in ("columns", "metrics", "database"):
+            if name in state.mapper.relationships:
+                related = getattr(datasource, name)
+                objects.extend(related if isinstance(related, list) else [related])
+
+        for obj in objects:
+            obj_state = sa.inspect(obj, raiseerr=False)
+            if obj_state is not None and obj_state.expired_attributes:
+                state.session.refresh(
+                    obj, attribute_names=list(obj_state.expired_attributes)
+                )
 
     def get_payload(
         self,
@@ -466,16 +769,16 @@ class QueryContextProcessor:
     ) -> Dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
-        # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
+        # Get all the payloads from the QueryObjects, which run concurrently
+        query_results = self._map_concurrently(
+            lambda query_obj: get_query_results(
                 query_obj.result_type or self._query_context.result_type,
                 self._query_context,
                 query_obj,
                 force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+            ),
+            self._query_context.queries,
+        )
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -502,6 +805,12 @@ class QueryContextProcessor:
             return data_cache_timeout
         return config["CACHE_DEFAULT_TIMEOUT"]
 
+    def get_cache_stale_timeout(self) -> Optional[int]:
+        stale_timeout = self._query_context.get_cache_stale_timeout()
+        if stale_timeout is not None:
+            return stale_timeout
+        return config["DATA_CACHE_STALE_TIMEOUT"]
+
     def cache_key(self, **extra: Any) -> str:
         """
         The QueryContext cache key is made out of the key/values from
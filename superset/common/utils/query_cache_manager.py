@@ -17,7 +17,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 from flask_caching import Cache
 from pandas import DataFrame
@@ -61,6 +64,8 @@ class QueryCacheManager:
         is_cached: Optional[bool] = None,
         cache_dttm: Optional[str] = None,
         cache_value: Optional[Dict[str, Any]] = None,
+        is_stale: bool = False,
+        rollup: Optional[str] = None,
     ) -> None:
         self.df = df
         self.query = query
@@ -74,6 +79,8 @@ class QueryCacheManager:
         self.is_cached = is_cached
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
+        self.is_stale = is_stale
+        self.rollup = rollup
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -85,9 +92,13 @@ class QueryCacheManager:
         timeout: Optional[int] = None,
         datasource_uid: Optional[str] = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        stale_timeout: Optional[int] = None,
     ) -> None:
         """
         Set dataframe of query-result to specific cache region
+
+        When `stale_timeout` is set, the entry is kept in the cache for
+        `stale_timeout` seconds past `timeout`, during which it is served as stale.
         """
         try:
             self.status = query_result.status
@@ -95,6 +106,7 @@ class QueryCacheManager:
             self.applied_template_filters = query_result.applied_template_filters
             self.error_message = query_result.error_message
             self.df = query_result.df
+            self.rollup = query_result.rollup
             self.annotation_data = {} if annotation_data is None else annotation_data
 
             if self.status != QueryStatus.FAILED:
@@ -108,7 +120,11 @@ class QueryCacheManager:
                 "query": self.query,
                 "applied_template_filters": self.applied_template_filters,
                 "annotation_data": self.annotation_data,
+                "rollup": self.rollup,
             }
+            if stale_timeout and timeout:
+                value["expires"] = time.time() + timeout
+                timeout += stale_timeout
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
                     key=key,
@@ -150,6 +166,7 @@ class QueryCacheManager:
                 query_cache.applied_template_filters = cache_value.get(
                     "applied_template_filters", []
                 )
+                query_cache.rollup = cache_value.get("rollup")
                 query_cache.status = QueryStatus.SUCCESS
                 query_cache.is_loaded = True
                 query_cache.is_cached = cache_value is not None
@@ -157,7 +174,12 @@ class QueryCacheManager:
                     cache_value["dttm"] if cache_value is not None else None
                 )
                 query_cache.cache_value = cache_value
+                query_cache.is_stale = time.time() > cache_value.get(
+                    "expires", float("inf")
+                )
                 stats_logger.incr("loaded_from_cache")
+                if query_cache.is_stale:
+                    stats_logger.incr("loaded_from_cache_stale")
             except KeyError as ex:
                 logger.exception(ex)
                 logger.error(
@@ -202,3 +224,79 @@ class QueryCacheManager:
         region: CacheRegion = CacheRegion.DEFAULT,
     ) -> bool:
         return bool(_cache[region].get(key)) if key else False
+
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"{key}-lock"
+
+    @staticmethod
+    def claim_refresh(
+        key: Optional[str],
+        region: CacheRegion = CacheRegion.DEFAULT,
+        expires: Optional[float] = None,
+    ) -> bool:
+        """
+        Claim the background refresh of a stale cache key, returning ``False`` when
+        a refresh has already been claimed by another request.
+
+        The claim is specific to the ``expires`` timestamp of the stale entry, so
+        that once refreshed, the entry can be claimed again as soon as it is stale
+        again, while a failed refresh is only retried once the claim times out.
+        """
+        if not key:
+            return False
+        return bool(
+            _cache[region].add(
+                f"{key}-refresh-{expires}",
+                True,
+                timeout=config["DATA_CACHE_LOCK_TIMEOUT"],
+            )
+        )
+
+    @classmethod
+    @contextmanager
+    def single_flight(
+        cls,
+        key: Optional[str],
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> Iterator[bool]:
+        """
+        Coalesce concurrent computations of the value of a cache key.
+
+        Yields ``True`` when the caller should compute and cache the value itself,
+        either because it acquired the lock on the key or because single-flight is
+        disabled, and ``False`` when the value was cached by another request while
+        waiting for the lock, in which case it should be read from the cache again.
+        """
+        cache = _cache[region]
+        if not key or not config["DATA_CACHE_SINGLE_FLIGHT"]:
+            yield True
+            return
+
+        lock_key = cls._lock_key(key)
+        token = str(uuid.uuid4())
+        deadline = time.monotonic() + config["DATA_CACHE_LOCK_WAIT_TIMEOUT"]
+        start = time.monotonic()
+        acquired = coalesced = False
+        while True:
+            if cache.add(lock_key, token, timeout=config["DATA_CACHE_LOCK_TIMEOUT"]):
+                acquired = True
+                stats_logger.incr("single_flight.acquired")
+                break
+            if cache.has(key):
+                coalesced = True
+                stats_logger.incr("single_flight.coalesced")
+                break
+            if time.monotonic() >= deadline:
+                logger.warning("Timed out waiting for the lock on cache key %s", key)
+                stats_logger.incr("single_flight.timeout")
+                break
+            time.sleep(config["DATA_CACHE_LOCK_POLL_INTERVAL"])
+
+        stats_logger.timing("single_flight.wait", (time.monotonic() - start) * 1000)
+        try:
+            yield not coalesced
+        finally:
+            # only release the lock if it hasn't expired and been taken over
+            if acquired and cache.get(lock_key) == token:
+                cache.delete(lock_key)
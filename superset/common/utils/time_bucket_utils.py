@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from superset.utils.core import get_column_name, get_metric_name, is_adhoc_metric
+
+if TYPE_CHECKING:
+    from superset.common.query_object import QueryObject
+
+EPOCH = datetime(1970, 1, 1)
+
+# time grains of a fixed duration dividing a day, whose periods are aligned to the
+# epoch like the time buckets. Weeks aren't, as the epoch was a Thursday, nor are
+# months, quarters or years, which don't have a fixed duration
+EPOCH_ALIGNED_TIME_GRAINS: Dict[str, timedelta] = {
+    "PT1S": timedelta(seconds=1),
+    "PT5S": timedelta(seconds=5),
+    "PT30S": timedelta(seconds=30),
+    "PT1M": timedelta(minutes=1),
+    "PT5M": timedelta(minutes=5),
+    "PT10M": timedelta(minutes=10),
+    "PT15M": timedelta(minutes=15),
+    "PT30M": timedelta(minutes=30),
+    "PT1H": timedelta(hours=1),
+    "PT6H": timedelta(hours=6),
+    "P1D": timedelta(days=1),
+}
+
+
+class TimeBucket(NamedTuple):
+    start: datetime
+    end: datetime
+    # only complete buckets, that are entirely in the past, can be cached
+    is_cacheable: bool
+
+
+def floor_dttm(dttm: datetime, bucket_size: timedelta) -> datetime:
+    return EPOCH + (dttm - EPOCH) // bucket_size * bucket_size
+
+
+def is_aligned_bucket_size(time_grain: Optional[str], bucket_size: timedelta) -> bool:
+    """
+    Whether the periods of a time grain never span two time buckets of the given
+    size, which are aligned to multiples of `bucket_size` since the epoch.
+    """
+    grain_size = EPOCH_ALIGNED_TIME_GRAINS.get(time_grain or "")
+    return (
+        grain_size is not None
+        and bucket_size > timedelta(0)
+        and bucket_size % grain_size == timedelta(0)
+    )
+
+
+def get_time_buckets(
+    from_dttm: datetime,
+    to_dttm: datetime,
+    bucket_size: timedelta,
+    now: datetime,
+) -> List[TimeBucket]:
+    """
+    Split the [from_dttm, to_dttm) time range into buckets aligned to multiples of
+    `bucket_size` since the epoch. The buckets at both ends of the range are only
+    partially covered when the range is not aligned, and are never cacheable.
+    """
+    buckets: List[TimeBucket] = []
+    start = from_dttm
+    while start < to_dttm:
+        end = min(floor_dttm(start, bucket_size) + bucket_size, to_dttm)
+        is_complete = end - start == bucket_size
+        buckets.append(TimeBucket(start, end, is_complete and end <= now))
+        start = end
+    return buckets
+
+
+def split_df_by_time_buckets(
+    df: pd.DataFrame,
+    column: str,
+    buckets: List[TimeBucket],
+) -> Optional[List[pd.DataFrame]]:
+    """
+    Split the rows of a DataFrame across contiguous time buckets, based on the
+    values of a time column. Returns `None` when the column doesn't hold naive
+    datetimes, in which case the rows can't be assigned to a bucket.
+    """
+    series = df.get(column)
+    if series is None or not pd.api.types.is_datetime64_dtype(series):
+        return None
+
+    boundaries = np.array([bucket.start for bucket in buckets[1:]], dtype="M8[ns]")
+    positions = np.searchsorted(boundaries, series.to_numpy(), side="right")
+    return [df[positions == idx] for idx in range(len(buckets))]
+
+
+def get_orderby_labels(query_object: QueryObject) -> List[Tuple[str, bool]]:
+    """
+    Returns the labels of the columns and metrics a query object is ordered by,
+    along with whether they are sorted in ascending order.
+    """
+    return [
+        (
+            get_metric_name(col) if is_adhoc_metric(col) else get_column_name(col),
+            ascending,
+        )
+        for col, ascending in query_object.orderby
+    ]
@@ -81,6 +81,10 @@ if TYPE_CHECKING:
 # Realtime stats logger, a StatsD implementation exists
 STATS_LOGGER = DummyStatsLogger()
 EVENT_LOGGER = DBEventLogger()
+# To write the event logs to the database in batches from a background thread,
+# rather than within the requests being logged:
+# from superset.utils.log import BatchedDBEventLogger
+# EVENT_LOGGER = BatchedDBEventLogger(max_queue_size=10000, batch_size=500)
 
 SUPERSET_LOG_VIEW = True
 
@@ -672,9 +676,77 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
 }
 
+# Cache for the latest partitions of Presto, Trino and Hive tables, as looked up by
+# the `latest_partition` and `latest_sub_partition` macros and `select_star`. When
+# configured, the partitions are kept per database, schema and table, entries older
+# than `LATEST_PARTITION_REFRESH_INTERVAL` seconds being served while they are
+# refreshed in the background by the `partitions.refresh` Celery task. The
+# partitions of the tables referenced by dashboards can be primed periodically by
+# scheduling the `partitions.prime_dashboards` task in `CeleryConfig.beat_schedule`:
+#
+#    "partitions.prime_dashboards": {
+#        "task": "partitions.prime_dashboards",
+#        "schedule": crontab(minute="*/10", hour="*"),
+#    },
+#
+# Defaults to `NullCache`, the latest partitions being memoized for 60 seconds in
+# `DATA_CACHE_CONFIG` instead.
+PARTITION_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
+LATEST_PARTITION_REFRESH_INTERVAL = int(timedelta(minutes=10).total_seconds())
+
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Row level security filters are resolved once per request for a given set of roles
+# and dataset. They can also be shared across requests through `CACHE_CONFIG` for
+# `RLS_FILTERS_CACHE_TIMEOUT` seconds, the cache being invalidated whenever the
+# change of a row level security filter or a role is committed. Disabled when `None`.
+RLS_FILTERS_CACHE_TIMEOUT: Optional[int] = None
+
+# Resolve the permissions granted to a set of roles once per request, as a set of
+# (permission, view menu) pairs checked by `can_access` and `raise_for_access`,
+# rather than querying the metadata database for every check. They can also be
+# shared across requests through `CACHE_CONFIG` for `PERMISSIONS_CACHE_TIMEOUT`
+# seconds, the cache being invalidated whenever the change of a role, a permission
+# or a view menu is committed. Disabled when `None`.
+PERMISSIONS_CACHE = False
+PERMISSIONS_CACHE_TIMEOUT: Optional[int] = None
+
+# Coalesce concurrent requests for identical chart data queries: on a cache miss, a
+# single request (holding a lock stored in the data cache) runs the query, while the
+# others wait for its result to be cached. The lock expires after
+# `DATA_CACHE_LOCK_TIMEOUT` seconds, and waiting requests give up and run the query
+# themselves after `DATA_CACHE_LOCK_WAIT_TIMEOUT` seconds.
+DATA_CACHE_SINGLE_FLIGHT = False
+DATA_CACHE_LOCK_TIMEOUT = int(timedelta(minutes=5).total_seconds())
+DATA_CACHE_LOCK_WAIT_TIMEOUT = int(timedelta(minutes=1).total_seconds())
+DATA_CACHE_LOCK_POLL_INTERVAL = 0.1
+
+# Serve chart data for up to `DATA_CACHE_STALE_TIMEOUT` seconds after its cache
+# timeout has passed, flagged with `is_stale`, while a Celery task refreshes it in the
+# background. It can be overridden per dataset or database by setting
+# `cache_stale_timeout` in their `extra` JSON. Disabled when `None`.
+DATA_CACHE_STALE_TIMEOUT: Optional[int] = None
+
+# Maximum number of queries of a single chart data request (query objects and time
+# comparison offsets) that run concurrently against the database, each one in its
+# own thread and database connection. Set to 1 to run them serially.
+CHART_DATA_QUERY_CONCURRENCY = 1
+
+# Cache the results of timeseries chart queries per time bucket, so that only the
+# buckets missing from the data cache (usually the most recent ones) are queried when a
+# relative time range like "Last week" shifts. Maps time grains to the size of their
+# buckets, which must be a multiple of the grain, e.g.
+# TIMESERIES_CACHE_BUCKETS = {"PT1H": timedelta(days=1), "P1D": timedelta(days=1)}
+# Buckets are aligned to multiples of their size since the Unix epoch (in the time
+# zone of the time column), so only grains of a fixed duration up to a day (PT1S to
+# P1D) are supported. Weeks, which started on a Thursday at the epoch, months,
+# quarters and years are ignored, with a warning.
+# Buckets that are not complete or not entirely in the past are never cached, and
+# time ranges spanning more than `TIMESERIES_CACHE_MAX_BUCKETS` are queried at once.
+TIMESERIES_CACHE_BUCKETS: Dict[str, timedelta] = {}
+TIMESERIES_CACHE_MAX_BUCKETS = 400
+
 # CORS Options
 ENABLE_CORS = False
 CORS_OPTIONS: Dict[Any, Any] = {}
@@ -719,6 +791,17 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# Number of rows converted to CSV at a time when exporting SQL Lab results and chart
+# data, which are streamed to the client so that the whole file is never held in
+# memory. Note that SQL Lab results that aren't in the results backend are fetched
+# from the database while they are streamed, holding a database connection open for
+# the whole download.
+CSV_EXPORT_BATCH_SIZE = 10000
+
+# Compress CSV exports with gzip while they are streamed, when the client accepts
+# it. Useful when Superset is not served behind a proxy compressing responses.
+CSV_EXPORT_GZIP = False
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -978,6 +1061,17 @@ RESULTS_BACKEND: Optional[BaseCache] = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Codec used to compress the buffers of results stored in the Arrow IPC format
+# (when RESULTS_BACKEND_USE_MSGPACK is enabled): "zstd", "lz4" or None.
+RESULTS_BACKEND_COMPRESSION: Optional[str] = "zstd"
+
+# When set, asynchronous SQL Lab queries fetch their results in batches of this many
+# rows and write each batch to the results backend as a separate compressed Arrow
+# chunk as soon as it is fetched, so that the memory used by Celery workers is
+# bounded by the batch size rather than by SQL_MAX_ROW. Requires
+# RESULTS_BACKEND_USE_MSGPACK.
+SQLLAB_RESULTS_BATCH_SIZE: Optional[int] = None
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1036,6 +1130,15 @@ JINJA_CONTEXT_ADDONS: Dict[str, Callable[..., Any]] = {}
 # basis. Example value = `{"presto": CustomPrestoTemplateProcessor}`
 CUSTOM_TEMPLATE_PROCESSORS: Dict[str, Type[BaseTemplateProcessor]] = {}
 
+# Maximum number of compiled Jinja templates (dataset SQL, metric expressions,
+# filters...) kept in an LRU cache of the app, keyed by engine and template source,
+# rather than compiling them every time they are rendered. The template processors
+# of an engine then share a single sandboxed environment, which custom template
+# processors must not alter with request specific filters. Hits, misses and
+# evictions are reported to the stats logger as `jinja_template_cache.*`. Disabled
+# when 0, e.g. `JINJA_TEMPLATE_CACHE_SIZE = 1000`.
+JINJA_TEMPLATE_CACHE_SIZE = 0
+
 # Roles that are controlled by the API / Superset and should not be changes
 # by humans.
 ROBOT_PERMISSION_ROLES = ["Public", "Gamma", "Alpha", "Admin", "sql_lab"]
@@ -1145,6 +1248,17 @@ DASHBOARD_TEMPLATE_ID = None
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# By default a new engine using ``NullPool`` is created for every query, so that
+# every query opens (and closes) its own connection to the analytical database.
+# When enabled, engines are cached per database, schema, effective user and query
+# source, and keep a connection pool alive between queries. Pool settings such as
+# ``pool_size``, ``max_overflow``, ``pool_recycle``, ``pool_timeout`` and
+# ``pool_pre_ping`` can be set per database in the ``engine_params`` of its extra.
+# Engines are disposed whenever the database is updated or deleted, and at most
+# ``DATABASE_ENGINE_POOLING_MAX_ENGINES`` engines are kept per process.
+DATABASE_ENGINE_POOLING = False
+DATABASE_ENGINE_POOLING_MAX_ENGINES = 100
+
 
 # A function that intercepts the SQL to be executed and can alter it.
 # The use case is can be around adding some sort of comment header
@@ -1229,6 +1343,9 @@ ALERT_REPORTS_NOTIFICATION_DRY_RUN = False
 # Max tries to run queries to prevent false errors caused by transient errors
 # being returned to users. Set to a value >1 to enable retries.
 ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
+# Maximum number of tabs of a dashboard report captured concurrently, each in its
+# own browser. The charts of a tab are captured from a single load of the tab.
+ALERT_REPORTS_SCREENSHOT_CONCURRENCY = 1
 
 # A custom prefix to use on all Alerts & Reports emails
 EMAIL_REPORTS_SUBJECT_PREFIX = "[Report] "
@@ -1253,6 +1370,18 @@ WEBDRIVER_WINDOW = {
     "pixel_density": 1,
 }
 
+# Reuse warm, authenticated webdrivers across the thumbnails and reports of a
+# worker process, rather than starting a browser and logging in for every
+# screenshot. Drivers are pooled per driver type, window size and user, recycled
+# after `max_uses` screenshots and closed after being idle for `idle_timeout`
+# seconds. At most `max_size` idle drivers are kept by each worker process.
+WEBDRIVER_POOL: Dict[str, Any] = {
+    "enabled": False,
+    "max_size": 4,
+    "max_uses": 50,
+    "idle_timeout": int(timedelta(minutes=5).total_seconds()),
+}
+
 # An optional override to the default auth hook used to provide auth to the
 # offline webdriver
 WEBDRIVER_AUTH_FUNC = None
@@ -1399,6 +1528,13 @@ GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# Maximum time, in milliseconds, that a request to the async events endpoint may
+# wait for new events with a blocking read on Redis, when there are none yet.
+# With long polling enabled, the frontend polls again as soon as it gets a
+# response, instead of every GLOBAL_ASYNC_QUERIES_POLLING_DELAY. Each waiting
+# request holds a web worker thread (and a Redis connection), so this is best
+# used with asynchronous workers. 0 disables long polling.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = 0
 
 # Embedded config options
 GUEST_ROLE_NAME = "Public"
@@ -36,6 +36,7 @@ from typing import (
     Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
 )
 
@@ -81,6 +82,7 @@ from superset.advanced_data_type.types import AdvancedDataTypeResponse
 from superset.common.db_query_status import QueryStatus
 from superset.common.utils.time_range_utils import get_since_until_from_time_range
 from superset.connectors.base.models import BaseColumn, BaseDatasource, BaseMetric
+from superset.connectors.sqla.rollups import find_rollup, get_rollups, Rollup
 from superset.connectors.sqla.utils import (
     find_cached_objects_in_session,
     get_columns_description,
@@ -119,12 +121,15 @@ from superset.utils import core as utils
 from superset.utils.core import (
     GenericDataType,
     get_column_name,
+    get_memoized_datasource_queries,
     get_username,
     is_adhoc_column,
+    json_int_dttm_ser,
     MediumText,
     QueryObjectFilterClause,
     remove_duplicates,
 )
+from superset.utils.hashing import md5_sha_from_dict
 
 config = app.config
 metadata = Model.metadata  # pylint: disable=no-member
@@ -132,6 +137,8 @@ logger = logging.getLogger(__name__)
 ADVANCED_DATA_TYPES = config["ADVANCED_DATA_TYPES"]
 VIRTUAL_TABLE_ALIAS = "virtual_table"
 
+T = TypeVar("T")
+
 # a non-exhaustive set of additive metrics
 ADDITIVE_METRIC_TYPES = {
     "count",
@@ -148,6 +155,7 @@ class SqlaQuery(NamedTuple):
     labels_expected: List[str]
     prequeries: List[str]
     sqla_query: Select
+    rollup: Optional[str] = None
 
 
 class QueryStringExtended(NamedTuple):
@@ -155,6 +163,7 @@ class QueryStringExtended(NamedTuple):
     labels_expected: List[str]
     prequeries: List[str]
     sql: str
+    rollup: Optional[str] = None
 
 
 @dataclass
@@ -856,19 +865,53 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
     def get_template_processor(self, **kwargs: Any) -> BaseTemplateProcessor:
         return get_template_processor(table=self, database=self.database, **kwargs)
 
-    def get_query_str_extended(self, query_obj: QueryObjectDict) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
-        sql = self.database.compile_sqla_query(sqlaq.sqla_query)
-        sql = self._apply_cte(sql, sqlaq.cte)
-        sql = sqlparse.format(sql, reindent=True)
-        sql = self.mutate_query_from_config(sql)
-        return QueryStringExtended(
-            applied_template_filters=sqlaq.applied_template_filters,
-            labels_expected=sqlaq.labels_expected,
-            prequeries=sqlaq.prequeries,
-            sql=sql,
+    def _memoize_query(
+        self, name: str, query_obj: QueryObjectDict, build: Callable[[], T]
+    ) -> T:
+        """
+        Build a query for the query object only once within a
+        `memoize_datasource_queries` block, where the same query object is typically
+        built to compute its cache key and then to be executed.
+        """
+        queries = get_memoized_datasource_queries()
+        if queries is None or self.id is None:
+            return build()
+
+        try:
+            key = md5_sha_from_dict(
+                {"name": name, "datasource": self.uid, "query_obj": query_obj},
+                default=json_int_dttm_ser,
+                ignore_nan=True,
+            )
+        except TypeError:
+            return build()
+
+        if key not in queries:
+            queries[key] = build()
+        return queries[key]
+
+    def get_memoized_sqla_query(self, query_obj: QueryObjectDict) -> SqlaQuery:
+        return self._memoize_query(
+            "sqla_query", query_obj, lambda: self.get_sqla_query(**query_obj)
         )
 
+    def get_query_str_extended(self, query_obj: QueryObjectDict) -> QueryStringExtended:
+        def build() -> QueryStringExtended:
+            sqlaq = self.get_memoized_sqla_query(query_obj)
+            sql = self.database.compile_sqla_query(sqlaq.sqla_query)
+            sql = self._apply_cte(sql, sqlaq.cte)
+            sql = sqlparse.format(sql, reindent=True)
+            sql = self.mutate_query_from_config(sql)
+            return QueryStringExtended(
+                applied_template_filters=sqlaq.applied_template_filters,
+                labels_expected=sqlaq.labels_expected,
+                prequeries=sqlaq.prequeries,
+                sql=sql,
+                rollup=sqlaq.rollup,
+            )
+
+        return self._memoize_query("query_str_extended", query_obj, build)
+
     def get_query_str(self, query_obj: QueryObjectDict) -> str:
         query_str_ext = self.get_query_str_extended(query_obj)
         all_queries = query_str_ext.prequeries + [query_str_ext.sql]
@@ -1117,6 +1160,95 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
     def text(self, clause: str) -> TextClause:
         return self.db_engine_spec.get_text_clause(clause)
 
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-return-statements
+    def find_rollup(
+        self,
+        columns: List[ColumnTyping],
+        metrics: List[Metric],
+        filter: List[QueryObjectFilterClause],  # pylint: disable=redefined-builtin
+        orderby: List[OrderBy],
+        granularity: Optional[str],
+        is_timeseries: bool,
+        from_dttm: Optional[datetime],
+        to_dttm: Optional[datetime],
+        extras: Dict[str, Any],
+        time_shift: Optional[str],
+    ) -> Optional[Rollup]:
+        """
+        Return the smallest rollup declared in the `extra` of the dataset that
+        covers the columns, filters and metrics of a query, if any.
+        """
+        rollups = get_rollups(self.extra_dict)
+        if (
+            not rollups
+            or not metrics
+            or extras.get("where")
+            or extras.get("having")
+            or not all(isinstance(metric, str) for metric in metrics)
+        ):
+            return None
+
+        time_grain = extras.get("time_grain_sqla")
+        referenced_columns: Set[str] = set()
+        referenced_metrics = set(cast(List[str], metrics))
+        time_grains: List[Optional[str]] = []
+        time_bounds: List[Optional[datetime]] = []
+        if granularity:
+            referenced_columns.add(granularity)
+            time_bounds += [from_dttm, to_dttm]
+            if is_timeseries:
+                time_grains.append(time_grain)
+
+        for col in columns:
+            if is_adhoc_column(col):
+                referenced_columns.add(col["sqlExpression"])
+                if col["sqlExpression"] in self.dttm_cols:
+                    time_grains.append(col.get("timeGrain"))
+            elif col != utils.DTTM_ALIAS:
+                referenced_columns.add(col)
+                if col in self.dttm_cols:
+                    time_grains.append(time_grain if col == granularity else None)
+
+        for flt in filter:
+            flt_col = flt.get("col")
+            if is_adhoc_column(flt_col):
+                return None
+            if flt_col == utils.DTTM_ALIAS:
+                continue
+            referenced_columns.add(flt_col)
+            if flt_col in self.dttm_cols:
+                if flt.get("op") != utils.FilterOperator.TEMPORAL_RANGE.value:
+                    return None
+                time_bounds += get_since_until_from_time_range(
+                    time_range=flt.get("val"),
+                    time_shift=time_shift,
+                    extras=extras,
+                )
+                if flt_grain := flt.get("grain"):
+                    time_grains.append(flt_grain)
+
+        for col, _ascending in orderby:
+            if not isinstance(col, str):
+                return None
+            if col in self.column_names:
+                referenced_columns.add(col)
+            else:
+                referenced_metrics.add(col)
+
+        # calculated columns are rendered from their expression, which refers to the
+        # columns of the dataset rather than to the ones of the rollups
+        columns_by_name = {col.column_name: col for col in self.columns}
+        if any(
+            (table_column := columns_by_name.get(column_name)) is None
+            or table_column.expression
+            for column_name in referenced_columns
+        ):
+            return None
+
+        return find_rollup(
+            rollups, referenced_columns, referenced_metrics, time_grains, time_bounds
+        )
+
     def get_sqla_query(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
         self,
         apply_fetch_values_predicate: bool = False,
@@ -1196,6 +1328,28 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
 
         metrics_by_name: Dict[str, SqlMetric] = {m.metric_name: m for m in self.metrics}
 
+        row_level_filters = self.get_sqla_row_level_filters(template_processor)
+        rollup = (
+            self.find_rollup(
+                columns=groupby or columns,
+                metrics=metrics,
+                filter=filter or [],
+                orderby=orderby,
+                granularity=granularity,
+                is_timeseries=is_timeseries,
+                from_dttm=from_dttm,
+                to_dttm=to_dttm,
+                extras=extras,
+                time_shift=time_shift,
+            )
+            if not (
+                row_level_filters
+                or series_limit
+                or (apply_fetch_values_predicate and self.fetch_values_predicate)
+            )
+            else None
+        )
+
         if not granularity and is_timeseries:
             raise QueryObjectValidationError(
                 _(
@@ -1217,6 +1371,12 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
                         template_processor=template_processor,
                     )
                 )
+            elif isinstance(metric, str) and rollup:
+                metrics_exprs.append(
+                    self.make_sqla_column_compatible(
+                        literal_column(rollup.metrics[metric]), metric
+                    )
+                )
             elif isinstance(metric, str) and metric in metrics_by_name:
                 metrics_exprs.append(
                     metrics_by_name[metric].get_sqla_col(
@@ -1267,6 +1427,11 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
             elif col in metrics_exprs_by_label:
                 col = metrics_exprs_by_label[col]
                 need_groupby = True
+            elif rollup and col in rollup.metrics:
+                col = self.make_sqla_column_compatible(
+                    literal_column(rollup.metrics[col]), col
+                )
+                need_groupby = True
             elif col in metrics_by_name:
                 col = metrics_by_name[col].get_sqla_col(
                     template_processor=template_processor
@@ -1406,7 +1571,10 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
 
         qry = sa.select(select_exprs)
 
-        tbl, cte = self.get_from_clause(template_processor)
+        if rollup:
+            tbl, cte = rollup.get_sqla_table(), None
+        else:
+            tbl, cte = self.get_from_clause(template_processor)
 
         if groupby_all_columns:
             qry = qry.group_by(*groupby_all_columns.values())
@@ -1577,7 +1745,7 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
                         raise QueryObjectValidationError(
                             _("Invalid filter operation type: %(op)s", op=op)
                         )
-        where_clause_and += self.get_sqla_row_level_filters(template_processor)
+        where_clause_and += row_level_filters
         if extras:
             where = extras.get("where")
             if where:
@@ -1759,6 +1927,7 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
             labels_expected=labels_expected,
             sqla_query=qry,
             prequeries=prequeries,
+            rollup=rollup.full_name if rollup else None,
         )
 
     def _get_series_orderby(
@@ -1898,6 +2067,7 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
             query=sql,
             errors=errors,
             error_message=error_message,
+            rollup=query_str_ext.rollup,
         )
 
     def get_sqla_table_object(self) -> Table:
@@ -2086,7 +2256,7 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
         """
         extra_cache_keys = super().get_extra_cache_keys(query_obj)
         if self.has_extra_cache_key_calls(query_obj):
-            sqla_query = self.get_sqla_query(**query_obj)
+            sqla_query = self.get_memoized_sqla_query(query_obj)
             extra_cache_keys += sqla_query.extra_cache_keys
         return extra_cache_keys
 
@@ -2292,3 +2462,12 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         SqlaTable, secondary=RLSFilterTables, backref="row_level_security_filters"
     )
     clause = Column(Text, nullable=False)
+
+
+clear_rls_filters_cache = security_manager.clear_rls_filters_cache
+sa.event.listen(RowLevelSecurityFilter, "after_insert", clear_rls_filters_cache)
+sa.event.listen(RowLevelSecurityFilter, "after_update", clear_rls_filters_cache)
+sa.event.listen(RowLevelSecurityFilter, "after_delete", clear_rls_filters_cache)
+sa.event.listen(security_manager.role_model, "after_insert", clear_rls_filters_cache)
+sa.event.listen(security_manager.role_model, "after_update", clear_rls_filters_cache)
+sa.event.listen(security_manager.role_model, "after_delete", clear_rls_filters_cache)
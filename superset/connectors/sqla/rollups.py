@@ -0,0 +1,201 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Routing of dataset queries to pre-aggregated rollup tables.
+
+Rollups are declared in the ``extra`` JSON of a dataset, for instance::
+
+    {
+        "rollups": [
+            {
+                "table_name": "sales_daily",
+                "schema": "rollups",
+                "time_grain": "P1D",
+                "columns": ["ds", "country", "product"],
+                "metrics": {"count": "SUM(cnt)", "sum__revenue": "SUM(revenue)"},
+                "row_count": 100000
+            }
+        ]
+    }
+
+A rollup holds the dataset aggregated by its ``columns``, with its time columns
+truncated to ``time_grain``. Only additive metrics can be served from it, by
+re-aggregating their partial aggregates with the expressions in ``metrics``.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy.sql import table
+from sqlalchemy.sql.selectable import TableClause
+
+EPOCH = datetime(1970, 1, 1)
+
+# time grains of a fixed duration, in seconds
+FIXED_GRAIN_SECONDS = {
+    "PT1S": 1,
+    "PT1M": 60,
+    "PT5M": 5 * 60,
+    "PT10M": 10 * 60,
+    "PT15M": 15 * 60,
+    "PT30M": 30 * 60,
+    "PT1H": 60 * 60,
+    "PT6H": 6 * 60 * 60,
+    "P1D": 24 * 60 * 60,
+}
+
+# time grains whose buckets are made of whole days
+DAY_ALIGNED_GRAINS = {
+    "P1D",
+    "P1W",
+    "P1M",
+    "P3M",
+    "P1Y",
+    "1969-12-28T00:00:00Z/P1W",
+    "1969-12-29T00:00:00Z/P1W",
+    "P1W/1970-01-03T00:00:00Z",
+    "P1W/1970-01-04T00:00:00Z",
+}
+
+# time grains whose buckets are made of whole months
+MONTH_ALIGNED_GRAINS = {"P1M": 1, "P3M": 3, "P1Y": 12}
+
+
+def is_grain_covered(rollup_grain: Optional[str], time_grain: Optional[str]) -> bool:
+    """
+    Whether timestamps truncated to the grain of a rollup can be truncated to
+    another time grain without loss, i.e. if every bucket of `time_grain` is a
+    union of buckets of `rollup_grain`.
+    """
+    if rollup_grain == time_grain:
+        return True
+    if not rollup_grain or not time_grain:
+        return False
+    if rollup_grain in MONTH_ALIGNED_GRAINS:
+        return (
+            time_grain in MONTH_ALIGNED_GRAINS
+            and MONTH_ALIGNED_GRAINS[time_grain] % MONTH_ALIGNED_GRAINS[rollup_grain]
+            == 0
+        )
+    if rollup_grain in FIXED_GRAIN_SECONDS:
+        rollup_seconds = FIXED_GRAIN_SECONDS[rollup_grain]
+        if time_grain in FIXED_GRAIN_SECONDS:
+            return FIXED_GRAIN_SECONDS[time_grain] % rollup_seconds == 0
+        return (
+            time_grain in DAY_ALIGNED_GRAINS
+            and FIXED_GRAIN_SECONDS["P1D"] % rollup_seconds == 0
+        )
+    return False
+
+
+def is_dttm_aligned(dttm: Optional[datetime], rollup_grain: Optional[str]) -> bool:
+    """
+    Whether a time bound falls on a bucket boundary of the grain of a rollup, so
+    that filtering the rollup on it selects whole buckets.
+    """
+    if dttm is None:
+        return True
+    if rollup_grain in MONTH_ALIGNED_GRAINS:
+        return (
+            dttm == datetime(dttm.year, dttm.month, 1)
+            and (dttm.month - 1) % MONTH_ALIGNED_GRAINS[rollup_grain] == 0
+        )
+    if rollup_grain in FIXED_GRAIN_SECONDS:
+        dttm = dttm.replace(tzinfo=None)
+        return (dttm - EPOCH).total_seconds() % FIXED_GRAIN_SECONDS[rollup_grain] == 0
+    return False
+
+
+class Rollup(NamedTuple):
+    table_name: str
+    schema: Optional[str]
+    time_grain: Optional[str]
+    columns: FrozenSet[str]
+    metrics: Dict[str, str]
+    row_count: Optional[int]
+
+    @classmethod
+    def from_dict(cls, rollup: Dict[str, Any]) -> Rollup:
+        return cls(
+            table_name=rollup["table_name"],
+            schema=rollup.get("schema"),
+            time_grain=rollup.get("time_grain"),
+            columns=frozenset(rollup.get("columns", [])),
+            metrics=dict(rollup.get("metrics", {})),
+            row_count=rollup.get("row_count"),
+        )
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.schema}.{self.table_name}" if self.schema else self.table_name
+
+    def get_sqla_table(self) -> TableClause:
+        tbl = table(self.table_name)
+        if self.schema:
+            tbl.schema = self.schema
+        return tbl
+
+    def covers(  # pylint: disable=too-many-arguments
+        self,
+        columns: Iterable[str],
+        metrics: Iterable[str],
+        time_grains: Iterable[Optional[str]],
+        time_bounds: Iterable[Optional[datetime]],
+    ) -> bool:
+        """
+        Whether the rollup holds the columns and metrics of a query, at a grain and
+        alignment that allows answering it exactly.
+        """
+        return (
+            self.columns.issuperset(columns)
+            and set(self.metrics).issuperset(metrics)
+            and all(is_grain_covered(self.time_grain, grain) for grain in time_grains)
+            and all(is_dttm_aligned(dttm, self.time_grain) for dttm in time_bounds)
+        )
+
+
+def get_rollups(extra: Dict[str, Any]) -> List[Rollup]:
+    return [Rollup.from_dict(rollup) for rollup in extra.get("rollups", [])]
+
+
+def find_rollup(  # pylint: disable=too-many-arguments
+    rollups: List[Rollup],
+    columns: Iterable[str],
+    metrics: Iterable[str],
+    time_grains: Iterable[Optional[str]],
+    time_bounds: Iterable[Optional[datetime]],
+) -> Optional[Rollup]:
+    """
+    Return the smallest rollup covering a query, if any. Rollups are compared by
+    their declared row count, then by their number of columns.
+    """
+    columns, metrics = set(columns), set(metrics)
+    time_grains, time_bounds = list(time_grains), list(time_bounds)
+    candidates = [
+        rollup
+        for rollup in rollups
+        if rollup.covers(columns, metrics, time_grains, time_bounds)
+    ]
+    return min(
+        candidates,
+        key=lambda rollup: (
+            rollup.row_count if rollup.row_count is not None else float("inf"),
+            len(rollup.columns),
+        ),
+        default=None,
+    )
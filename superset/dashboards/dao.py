@@ -20,6 +20,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
 
 from superset import security_manager
 from superset.dao.base import BaseDAO
@@ -54,7 +55,16 @@ class DashboardDAO(BaseDAO):
 
     @staticmethod
     def get_charts_for_dashboard(id_or_slug: str) -> List[Slice]:
-        return DashboardDAO.get_by_id_or_slug(id_or_slug).slices
+        dashboard = DashboardDAO.get_by_id_or_slug(id_or_slug)
+        # fetch the charts along with their dataset in a single query, rather than
+        # lazily loading the charts and then their datasets
+        return (
+            db.session.query(Slice)
+            .join(Slice.dashboards)
+            .filter(Dashboard.id == dashboard.id)
+            .options(joinedload(Slice.table))
+            .all()
+        )
 
     @staticmethod
     def get_dashboard_changed_on(
@@ -119,7 +119,10 @@ extra_description = markdown(
     "5. The ``allows_virtual_table_explore`` field is a boolean specifying "
     "whether or not the Explore button in SQL Lab results is shown.<br/>"
     "6. The ``disable_data_preview`` field is a boolean specifying whether or not data "
-    "preview queries will be run when fetching table metadata in SQL Lab.",
+    "preview queries will be run when fetching table metadata in SQL Lab.<br/>"
+    "7. The ``cache_stale_timeout`` field is a number of seconds during which chart "
+    "data past its cache timeout is still served while being refreshed in the "
+    "background.",
     True,
 )
 get_export_ids_schema = {"type": "array", "items": {"type": "integer"}}
@@ -639,6 +642,7 @@ class ImportV1DatabaseExtraSchema(Schema):
     allows_virtual_table_explore = fields.Boolean(required=False)
     cancel_query_on_windows_unload = fields.Boolean(required=False)
     disable_data_preview = fields.Boolean(required=False)
+    cache_stale_timeout = fields.Integer(required=False, allow_none=True)
 
 
 class ImportV1DatabaseSchema(Schema):
@@ -19,9 +19,12 @@
 import logging
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import simplejson as json
 
-from superset.utils.core import JS_MAX_INTEGER
+from superset.utils.core import JS_MAX_INTEGER, json_int_dttm_ser
 
 logger = logging.getLogger(__name__)
 
@@ -53,3 +56,89 @@ def df_to_records(dframe: pd.DataFrame) -> List[Dict[str, Any]]:
         dict(zip(columns, map(_convert_big_integers, row)))
         for row in zip(*[dframe[col] for col in columns])
     )
+
+
+def df_to_columnar(dframe: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Convert a DataFrame to a columnar layout, holding the column names and the list
+    of values of each column rather than one dictionary per row. Temporal columns
+    are converted to milliseconds since the epoch, as `json_int_dttm_ser` does.
+
+    :param dframe: the DataFrame to convert
+    :returns: a dictionary with the `columns` and the `data` of the DataFrame
+    """
+    if not dframe.columns.is_unique:
+        logger.warning(
+            "DataFrame columns are not unique, some columns will be omitted."
+        )
+    data: Dict[Any, List[Any]] = {}
+    for name, series in dframe.items():
+        if pd.api.types.is_datetime64_any_dtype(series):
+            if series.dt.tz is not None:
+                # the wall time is kept, as with `datetime_to_epoch`
+                series = series.dt.tz_localize(None)
+            epoch = series.to_numpy(dtype="datetime64[ns]").view("i8") / 1e6
+            data[name] = np.where(series.isna(), np.nan, epoch).tolist()
+        else:
+            data[name] = series.tolist()
+    return {"columns": list(dframe.columns), "data": data}
+
+
+def columnar_to_df(columnar: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Convert data in the columnar layout of `df_to_columnar` back to a DataFrame.
+    """
+    return pd.DataFrame(columnar["data"], columns=columnar["columns"])
+
+
+def df_to_arrow_ipc(dframe: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to the Arrow IPC streaming format. Object columns holding
+    values of mixed types are converted to strings.
+
+    :param dframe: the DataFrame to convert
+    :returns: the Arrow IPC stream
+    """
+    arrays = []
+    for _, series in dframe.items():
+        try:
+            arrays.append(pa.array(series))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(pa.array(series.where(series.isna(), series.astype(str))))
+    table = pa.Table.from_arrays(arrays, names=[str(name) for name in dframe.columns])
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def set_arrow_ipc_metadata(data: bytes, metadata: Dict[str, Any]) -> bytes:
+    """
+    Attach metadata to the schema of an Arrow IPC stream, each value being JSON
+    encoded under its key. The record batches are written again without copying
+    their buffers.
+
+    :param data: the Arrow IPC stream
+    :param metadata: the metadata to attach
+    :returns: the Arrow IPC stream with the metadata in its schema
+    """
+    reader = pa.ipc.open_stream(data)
+    schema = reader.schema.with_metadata(
+        {
+            key: json.dumps(value, default=json_int_dttm_ser, ignore_nan=True)
+            for key, value in metadata.items()
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in reader:
+            writer.write_batch(pa.RecordBatch.from_arrays(batch.columns, schema=schema))
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_ipc_to_df(data: bytes) -> pd.DataFrame:
+    """
+    Read a DataFrame from the Arrow IPC streaming format.
+    """
+    return pa.ipc.open_stream(data).read_pandas()
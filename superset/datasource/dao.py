@@ -16,8 +16,9 @@
 # under the License.
 
 import logging
-from typing import Dict, Type, Union
+from typing import Dict, Iterable, List, Type, Union
 
+import sqlalchemy as sa
 from sqlalchemy.orm import Session
 
 from superset.connectors.sqla.models import SqlaTable
@@ -32,6 +33,9 @@ logger = logging.getLogger(__name__)
 
 Datasource = Union[Dataset, SqlaTable, Table, Query, SavedQuery]
 
+# relationships needed to serialize a datasource, loaded eagerly in bulk
+EAGER_RELATIONSHIPS = ("columns", "metrics", "owners", "database")
+
 
 class DatasourceDAO(BaseDAO):
 
@@ -68,3 +72,38 @@ class DatasourceDAO(BaseDAO):
             raise DatasourceNotFound()
 
         return datasource
+
+    @classmethod
+    def get_datasources(
+        cls,
+        session: Session,
+        datasource_type: Union[DatasourceType, str],
+        datasource_ids: Iterable[int],
+        eager: bool = False,
+    ) -> List[Datasource]:
+        """
+        Fetch the datasources of a type with a single ``IN`` query. Missing
+        datasources are skipped.
+
+        :param eager: Whether to eagerly load the relationships needed to serialize
+            the datasources, with one more query for each of them
+        """
+        if datasource_type not in cls.sources:
+            raise DatasourceTypeNotSupportedError()
+
+        datasource_ids = set(datasource_ids)
+        if not datasource_ids:
+            return []
+
+        model = cls.sources[datasource_type]
+        query = session.query(model)
+        if eager:
+            relationships = sa.inspect(model).relationships
+            query = query.options(
+                *[
+                    sa.orm.subqueryload(getattr(model, name))
+                    for name in EAGER_RELATIONSHIPS
+                    if name in relationships
+                ]
+            )
+        return query.filter(model.id.in_(datasource_ids)).all()
@@ -27,6 +27,7 @@ from typing import (
     Callable,
     ContextManager,
     Dict,
+    Iterator,
     List,
     Match,
     NamedTuple,
@@ -40,6 +41,7 @@ from typing import (
 )
 
 import pandas as pd
+import pyarrow as pa
 import sqlparse
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -356,6 +358,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     force_column_alias_quotes = False
     arraysize = 0
+    # Name of a cursor method returning the whole result set as a ``pyarrow.Table``
+    # (e.g. ``fetch_arrow_table`` on ADBC cursors). When set, results are fetched
+    # as columns instead of being built row by row.
+    arrow_fetch_method: Optional[str] = None
     max_column_name_length = 0
     try_remove_schema_from_table_name = True  # pylint: disable=invalid-name
     run_multiple_statements_as_one = False
@@ -644,7 +650,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     @classmethod
     def fetch_data(
         cls, cursor: Any, limit: Optional[int] = None
-    ) -> List[Tuple[Any, ...]]:
+    ) -> Union[List[Tuple[Any, ...]], pa.Table]:
         """
 
         :param cursor: Cursor instance
@@ -654,12 +660,67 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         if cls.arraysize:
             cursor.arraysize = cls.arraysize
         try:
+            if cls.arrow_fetch_method and hasattr(cursor, cls.arrow_fetch_method):
+                table = getattr(cursor, cls.arrow_fetch_method)()
+                return table.slice(0, limit) if limit else table
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
-                return cursor.fetchmany(limit)
-            return cursor.fetchall()
+                return cls.process_fetched_rows(cursor, cursor.fetchmany(limit))
+            return cls.process_fetched_rows(cursor, cursor.fetchall())
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def fetch_data_in_batches(
+        cls, cursor: Any, limit: Optional[int] = None, batch_size: int = 10000
+    ) -> Iterator[Union[List[Tuple[Any, ...]], pa.Table]]:
+        """
+        Fetch the results of a query in batches of at most ``batch_size`` rows.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :param batch_size: Maximum number of rows in each batch
+        :return: Iterator over batches of rows
+        """
+        if not cursor.description:
+            return
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        try:
+            if cls.arrow_fetch_method and hasattr(cursor, cls.arrow_fetch_method):
+                table = getattr(cursor, cls.arrow_fetch_method)()
+                num_rows = table.num_rows
+                if limit is not None:
+                    num_rows = min(num_rows, limit)
+                for offset in range(0, num_rows, batch_size):
+                    yield table.slice(offset, min(batch_size, num_rows - offset))
+                return
+
+            fetched = 0
+            while limit is None or fetched < limit:
+                size = batch_size if limit is None else min(batch_size, limit - fetched)
+                rows = cursor.fetchmany(size)
+                if not rows:
+                    return
+                fetched += len(rows)
+                yield cls.process_fetched_rows(cursor, rows)
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def process_fetched_rows(  # pylint: disable=unused-argument
+        cls, cursor: Any, rows: List[Any]
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Convert the rows fetched from a cursor, by `fetch_data` and
+        `fetch_data_in_batches`, to tuples of values. Some drivers return their own
+        row types, to be unpacked further.
+
+        :param cursor: Cursor instance
+        :param rows: Rows fetched from the cursor
+        :return: List of tuples
+        """
+        return rows
+
     @classmethod
     def expand_data(
         cls, columns: List[ResultSetColumnType], data: List[Dict[Any, Any]]
@@ -668,7 +729,8 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     ]:
         """
         Some engines support expanding nested fields. See implementation in Presto
-        spec for details.
+        spec for details. The columns returned only depend on the types of the
+        selected columns, so that results read in batches are expanded alike.
 
         :param columns: columns selected in the query
         :param data: original data set
@@ -211,15 +211,14 @@ class BigQueryEngineSpec(BaseEngineSpec):
         return None
 
     @classmethod
-    def fetch_data(
-        cls, cursor: Any, limit: Optional[int] = None
+    def process_fetched_rows(
+        cls, cursor: Any, rows: List[Any]
     ) -> List[Tuple[Any, ...]]:
-        data = super().fetch_data(cursor, limit)
         # Support type BigQuery Row, introduced here PR #4071
         # google.cloud.bigquery.table.Row
-        if data and type(data[0]).__name__ == "Row":
-            data = [r.values() for r in data]  # type: ignore
-        return data
+        if rows and type(rows[0]).__name__ == "Row":
+            rows = [r.values() for r in rows]
+        return rows
 
     @staticmethod
     def _mutate_label(label: str) -> str:
@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Tuple
 
 from superset.db_engine_specs.base import BaseEngineSpec
 
@@ -40,9 +40,8 @@ class ExasolEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
     }
 
     @classmethod
-    def fetch_data(
-        cls, cursor: Any, limit: Optional[int] = None
+    def process_fetched_rows(
+        cls, cursor: Any, rows: List[Any]
     ) -> List[Tuple[Any, ...]]:
-        data = super().fetch_data(cursor, limit)
         # Lists of `pyodbc.Row` need to be unpacked further
-        return cls.pyodbc_rows_to_tuples(data)
+        return cls.pyodbc_rows_to_tuples(rows)
@@ -120,12 +120,11 @@ class MssqlEngineSpec(BaseEngineSpec):
         return None
 
     @classmethod
-    def fetch_data(
-        cls, cursor: Any, limit: Optional[int] = None
+    def process_fetched_rows(
+        cls, cursor: Any, rows: List[Any]
     ) -> List[Tuple[Any, ...]]:
-        data = super().fetch_data(cursor, limit)
         # Lists of `pyodbc.Row` need to be unpacked further
-        return cls.pyodbc_rows_to_tuples(data)
+        return cls.pyodbc_rows_to_tuples(rows)
 
     @classmethod
     def extract_error_message(cls, ex: Exception) -> str:
@@ -43,6 +43,7 @@ import pandas as pd
 import simplejson as json
 from flask import current_app
 from flask_babel import gettext as __, lazy_gettext as _
+from flask_caching.backends import NullCache
 from sqlalchemy import Column, literal_column, types
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.reflection import Inspector
@@ -71,6 +72,7 @@ from superset.result_set import destringify
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import core as utils
 from superset.utils.core import ColumnSpec, GenericDataType
+from superset.utils.hashing import md5_sha_from_dict
 
 if TYPE_CHECKING:
     # prevent circular imports
@@ -408,7 +410,6 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         return None
 
     @classmethod
-    @cache_manager.data_cache.memoize(timeout=60)
     def latest_partition(
         cls,
         table_name: str,
@@ -429,6 +430,35 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_partition('foo_table')
         (['ds'], ('2018-01-01',))
         """
+        if cls.has_partition_cache():
+            column_names, values = cls.get_cached_partition(
+                "latest_partition", table_name, schema, database
+            )
+        else:
+            column_names, values = cls._get_memoized_latest_partition(
+                table_name, schema, database
+            )
+
+        if not show_first and len(column_names) > 1:
+            raise SupersetTemplateException(
+                "The table should have a single partitioned field "
+                "to use this function. You may want to use "
+                "`presto.latest_sub_partition`"
+            )
+
+        return column_names, values
+
+    @classmethod
+    @cache_manager.data_cache.memoize(timeout=60)
+    def _get_memoized_latest_partition(
+        cls, table_name: str, schema: Optional[str], database: Database
+    ) -> Tuple[List[str], Optional[List[str]]]:
+        return cls._get_latest_partition(table_name, schema, database)
+
+    @classmethod
+    def _get_latest_partition(
+        cls, table_name: str, schema: Optional[str], database: Database
+    ) -> Tuple[List[str], Optional[List[str]]]:
         indexes = database.get_indexes(table_name, schema)
         if not indexes:
             raise SupersetTemplateException(
@@ -441,13 +471,6 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
                 "The table should have one partitioned field"
             )
 
-        if not show_first and len(indexes[0]["column_names"]) > 1:
-            raise SupersetTemplateException(
-                "The table should have a single partitioned field "
-                "to use this function. You may want to use "
-                "`presto.latest_sub_partition`"
-            )
-
         column_names = indexes[0]["column_names"]
         part_fields = [(column_name, True) for column_name in column_names]
         sql = cls._partition_query(table_name, database, 1, part_fields)
@@ -483,6 +506,16 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_sub_partition('sub_partition_table', event_type='click')
         '2018-01-01'
         """
+        if cls.has_partition_cache():
+            return cls.get_cached_partition(
+                "latest_sub_partition", table_name, schema, database, **kwargs
+            )
+        return cls._get_latest_sub_partition(table_name, schema, database, **kwargs)
+
+    @classmethod
+    def _get_latest_sub_partition(
+        cls, table_name: str, schema: Optional[str], database: Database, **kwargs: Any
+    ) -> Any:
         indexes = database.get_indexes(table_name, schema)
         part_fields = indexes[0]["column_names"]
         for k in kwargs.keys():  # pylint: disable=consider-iterating-dictionary
@@ -507,6 +540,94 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
             return ""
         return df.to_dict()[field_to_return][0]
 
+    @staticmethod
+    def has_partition_cache() -> bool:
+        """Whether the latest partitions are kept in `PARTITION_CACHE_CONFIG`"""
+        return not isinstance(cache_manager.partition_cache.cache, NullCache)
+
+    @staticmethod
+    def _get_partition_cache_key(
+        method: str,
+        table_name: str,
+        schema: Optional[str],
+        database: Database,
+        kwargs: Dict[str, Any],
+    ) -> str:
+        key = md5_sha_from_dict(
+            {
+                "method": method,
+                "database_id": database.id,
+                "schema": schema,
+                "table_name": table_name,
+                "kwargs": kwargs,
+            }
+        )
+        return f"partition_{key}"
+
+    @classmethod
+    def get_cached_partition(  # pylint: disable=too-many-arguments
+        cls,
+        method: str,
+        table_name: str,
+        schema: Optional[str],
+        database: Database,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Get the partition metadata returned by ``_get_<method>`` from the partition
+        cache, computing it when missing. Entries older than
+        ``LATEST_PARTITION_REFRESH_INTERVAL`` seconds are returned as is while being
+        refreshed by a Celery task, at most one refresh being enqueued per entry.
+
+        :param method: either ``latest_partition`` or ``latest_sub_partition``
+        :param table_name: the name of the table
+        :param schema: schema / database / namespace
+        :param database: database query will be run against
+        :param kwargs: the filters of ``latest_sub_partition``
+        :return: the partition metadata
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.partitions import refresh_partition
+
+        cache = cache_manager.partition_cache
+        key = cls._get_partition_cache_key(method, table_name, schema, database, kwargs)
+        entry = cache.get(key)
+        if entry is None:
+            return cls.refresh_cached_partition(
+                method, table_name, schema, database, **kwargs
+            )
+
+        interval = current_app.config["LATEST_PARTITION_REFRESH_INTERVAL"]
+        if time.time() - entry["refreshed_at"] > interval and cache.add(
+            f"{key}_refreshing", True, timeout=interval
+        ):
+            refresh_partition.delay(method, database.id, table_name, schema, kwargs)
+        return entry["partition"]
+
+    @classmethod
+    def refresh_cached_partition(  # pylint: disable=too-many-arguments
+        cls,
+        method: str,
+        table_name: str,
+        schema: Optional[str],
+        database: Database,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Compute the partition metadata returned by ``_get_<method>`` and store it in
+        the partition cache.
+        """
+        cache = cache_manager.partition_cache
+        key = cls._get_partition_cache_key(method, table_name, schema, database, kwargs)
+        try:
+            partition = getattr(cls, f"_get_{method}")(
+                table_name, schema, database, **kwargs
+            )
+            cache.set(key, {"partition": partition, "refreshed_at": time.time()})
+        finally:
+            cache.delete(f"{key}_refreshing")
+        return partition
+
 
 class PrestoEngineSpec(PrestoBaseEngineSpec):
     engine = "presto"
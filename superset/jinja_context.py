@@ -17,6 +17,8 @@
 """Defines the templating context for SQL Lab"""
 import json
 import re
+import threading
+from collections import OrderedDict
 from functools import partial
 from typing import (
     Any,
@@ -32,7 +34,7 @@ from typing import (
 
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined
+from jinja2 import DebugUndefined, Template
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.types import String
@@ -41,6 +43,7 @@ from typing_extensions import TypedDict
 from superset.datasets.commands.exceptions import DatasetNotFoundError
 from superset.exceptions import SupersetTemplateException
 from superset.extensions import feature_flag_manager
+from superset.stats_logger import BaseStatsLogger
 from superset.utils.core import (
     convert_legacy_filters_into_adhoc,
     get_user_id,
@@ -426,6 +429,93 @@ def where_in(values: List[Any], mark: str = "'") -> str:
     return f"({joined_values})"
 
 
+def create_environment() -> SandboxedEnvironment:
+    env = SandboxedEnvironment(undefined=DebugUndefined)
+    # custom filters
+    env.filters["where_in"] = where_in
+    return env
+
+
+class TemplateCache:
+    """
+    An app-wide, size-bounded LRU cache of compiled templates, keyed by engine and
+    template source, with one sandboxed environment per engine shared by all the
+    template processors of that engine.
+    """
+
+    def __init__(
+        self, max_size: int = 1000, stats_logger: Optional[BaseStatsLogger] = None
+    ) -> None:
+        self.max_size = max_size
+        self.stats_logger = stats_logger
+        self.hits = 0
+        self.misses = 0
+        self._environments: Dict[Optional[str], SandboxedEnvironment] = {}
+        self._templates: "OrderedDict[Tuple[Optional[str], str], Template]" = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get_environment(self, engine: Optional[str]) -> SandboxedEnvironment:
+        with self._lock:
+            if engine not in self._environments:
+                self._environments[engine] = create_environment()
+            return self._environments[engine]
+
+    def get_template(self, engine: Optional[str], source: str) -> Template:
+        """
+        Return the template compiled from ``source`` by the environment of ``engine``,
+        compiling it if needed.
+        """
+        key = (engine, source)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                self._incr("hit")
+                return template
+            self.misses += 1
+            self._incr("miss")
+
+        # compile outside of the lock, as it is the expensive part
+        template = self.get_environment(engine).from_string(source)
+        with self._lock:
+            self._templates[key] = template
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+                self._incr("evict")
+        return template
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _incr(self, name: str) -> None:
+        if self.stats_logger:
+            self.stats_logger.incr(f"jinja_template_cache.{name}")
+
+
+def get_template_cache() -> Optional[TemplateCache]:
+    """
+    Return the template cache of the current app, stored in its extensions when first
+    used, or `None` when `JINJA_TEMPLATE_CACHE_SIZE` is not set.
+    """
+    max_size = current_app.config["JINJA_TEMPLATE_CACHE_SIZE"]
+    if not max_size:
+        return None
+    cache = current_app.extensions.get("jinja_template_cache")
+    if cache is None or cache.max_size != max_size:
+        cache = current_app.extensions["jinja_template_cache"] = TemplateCache(
+            max_size=max_size, stats_logger=current_app.config["STATS_LOGGER"]
+        )
+    return cache
+
+
 class BaseTemplateProcessor:
     """
     Base class for database-specific jinja context
@@ -455,16 +545,28 @@ class BaseTemplateProcessor:
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
         self._context: Dict[str, Any] = {}
-        self._env = SandboxedEnvironment(undefined=DebugUndefined)
+        self._template_cache = get_template_cache()
+        self._env = (
+            self._template_cache.get_environment(self.engine)
+            if self._template_cache
+            else create_environment()
+        )
         self.set_context(**kwargs)
 
-        # custom filters
-        self._env.filters["where_in"] = where_in
-
     def set_context(self, **kwargs: Any) -> None:
         self._context.update(kwargs)
         self._context.update(context_addons())
 
+    def get_template(self, sql: str) -> Template:
+        # only the templates compiled by the environment shared by the processors of
+        # the engine are cached, as a processor may replace its own environment
+        if (
+            self._template_cache
+            and self._env is self._template_cache.get_environment(self.engine)
+        ):
+            return self._template_cache.get_template(self.engine, sql)
+        return self._env.from_string(sql)
+
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -472,7 +574,7 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
-        template = self._env.from_string(sql)
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         context = validate_template_context(self.engine, kwargs)
@@ -586,7 +688,7 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self._env.from_string(sql)
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Presto.
@@ -24,7 +24,7 @@ from ast import literal_eval
 from contextlib import closing, contextmanager
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
 
 import numpy
 import pandas as pd
@@ -62,6 +62,8 @@ from superset.models.helpers import AuditMixinNullable, ImportExportMixin
 from superset.result_set import SupersetResultSet
 from superset.utils import cache as cache_util, core as utils
 from superset.utils.core import get_username
+from superset.utils.engine_registry import EngineKey, EngineRegistry, QUEUE_POOL_PARAMS
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.memoized import memoized
 
 config = app.config
@@ -73,6 +75,11 @@ logger = logging.getLogger(__name__)
 
 DB_CONNECTION_MUTATOR = config["DB_CONNECTION_MUTATOR"]
 
+engine_registry = EngineRegistry(
+    max_engines=config["DATABASE_ENGINE_POOLING_MAX_ENGINES"],
+    stats_logger=stats_logger,
+)
+
 
 class Url(Model, AuditMixinNullable):
     """Used for the short url feature"""
@@ -396,9 +403,49 @@ class Database(
         masked_url = self.get_password_masked_url(sqlalchemy_url)
         logger.debug("Database._get_sqla_engine(). Masked URL: %s", str(masked_url))
 
-        params = extra.get("engine_params", {})
+        if DB_CONNECTION_MUTATOR:
+            if not source and request and request.referrer:
+                if "/superset/dashboard/" in request.referrer:
+                    source = utils.QuerySource.DASHBOARD
+                elif "/explore/" in request.referrer:
+                    source = utils.QuerySource.CHART
+                elif "/superset/sqllab" in request.referrer:
+                    source = utils.QuerySource.SQL_LAB
+
+        def create() -> Engine:
+            return self._create_sqla_engine(
+                sqlalchemy_url,
+                extra.get("engine_params", {}),
+                effective_username,
+                nullpool=nullpool and not config["DATABASE_ENGINE_POOLING"],
+                source=source,
+            )
+
+        if not config["DATABASE_ENGINE_POOLING"]:
+            return create()
+
+        key = EngineKey(
+            database_id=self.id,
+            schema=schema,
+            effective_username=effective_username,
+            # the source only affects the engine through the connection mutator
+            source=source.name if source and DB_CONNECTION_MUTATOR else None,
+            config_hash=self.engine_config_hash,
+        )
+        return engine_registry.get(key, create)
+
+    def _create_sqla_engine(
+        self,
+        sqlalchemy_url: URL,
+        params: Dict[str, Any],
+        effective_username: Optional[str],
+        nullpool: bool,
+        source: Optional[utils.QuerySource],
+    ) -> Engine:
         if nullpool:
             params["poolclass"] = NullPool
+            for param in QUEUE_POOL_PARAMS:
+                params.pop(param, None)
 
         connect_args = params.get("connect_args", {})
         if self.impersonate_user:
@@ -412,14 +459,6 @@ class Database(
         self.update_params_from_encrypted_extra(params)
 
         if DB_CONNECTION_MUTATOR:
-            if not source and request and request.referrer:
-                if "/superset/dashboard/" in request.referrer:
-                    source = utils.QuerySource.DASHBOARD
-                elif "/explore/" in request.referrer:
-                    source = utils.QuerySource.CHART
-                elif "/superset/sqllab" in request.referrer:
-                    source = utils.QuerySource.SQL_LAB
-
             sqlalchemy_url, params = DB_CONNECTION_MUTATOR(
                 sqlalchemy_url, params, effective_username, security_manager, source
             )
@@ -429,6 +468,22 @@ class Database(
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex)
 
+    @property
+    def engine_config_hash(self) -> str:
+        """
+        A hash of every setting that affects engine creation, used to key pooled
+        engines so that they are never reused after the database is modified.
+        """
+        return md5_sha_from_dict(
+            {
+                "sqlalchemy_uri": self.sqlalchemy_uri_decrypted,
+                "extra": self.extra,
+                "encrypted_extra": self.encrypted_extra,
+                "impersonate_user": self.impersonate_user,
+                "server_cert": self.server_cert,
+            }
+        )
+
     @contextmanager
     def get_raw_connection(
         self,
@@ -450,22 +505,62 @@ class Database(
     def get_reserved_words(self) -> Set[str]:
         return self.get_dialect().preparer.reserved_words
 
-    def get_df(  # pylint: disable=too-many-locals
+    def get_df(
         self,
         sql: str,
         schema: Optional[str] = None,
         mutator: Optional[Callable[[pd.DataFrame], None]] = None,
     ) -> pd.DataFrame:
+        with self._execute_statements(sql, schema) as cursor:
+            data = self.db_engine_spec.fetch_data(cursor)
+            result_set = SupersetResultSet(
+                data, cursor.description, self.db_engine_spec
+            )
+            df = result_set.to_pandas_df()
+            if mutator:
+                df = mutator(df)
+
+            return self._stringify_nested_columns(df)
+
+    def get_df_batches(
+        self,
+        sql: str,
+        schema: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 10000,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run a query and yield its results in DataFrames of at most `batch_size` rows,
+        fetched from the cursor one batch at a time. An empty DataFrame holding the
+        columns of the results is yielded when there are no rows.
+        """
+        with self._execute_statements(sql, schema) as cursor:
+            is_empty = True
+            for data in self.db_engine_spec.fetch_data_in_batches(
+                cursor, limit, batch_size
+            ):
+                is_empty = False
+                result_set = SupersetResultSet(
+                    data, cursor.description, self.db_engine_spec
+                )
+                yield self._stringify_nested_columns(result_set.to_pandas_df())
+            if is_empty:
+                result_set = SupersetResultSet(
+                    [], cursor.description, self.db_engine_spec
+                )
+                yield result_set.to_pandas_df()
+
+    @contextmanager
+    def _execute_statements(
+        self, sql: str, schema: Optional[str] = None
+    ) -> Iterator[Any]:
+        """
+        Execute the statements of a script, yielding the cursor holding the results
+        of the last one.
+        """
         sqls = self.db_engine_spec.parse_sql(sql)
         engine = self._get_sqla_engine(schema)
 
-        def needs_conversion(df_series: pd.Series) -> bool:
-            return (
-                not df_series.empty
-                and isinstance(df_series, pd.Series)
-                and isinstance(df_series[0], (list, dict))
-            )
-
         def _log_query(sql: str) -> None:
             if log_query:
                 log_query(
@@ -486,20 +581,22 @@ class Database(
 
             _log_query(sqls[-1])
             self.db_engine_spec.execute(cursor, sqls[-1])
+            yield cursor
 
-            data = self.db_engine_spec.fetch_data(cursor)
-            result_set = SupersetResultSet(
-                data, cursor.description, self.db_engine_spec
+    @staticmethod
+    def _stringify_nested_columns(df: pd.DataFrame) -> pd.DataFrame:
+        def needs_conversion(df_series: pd.Series) -> bool:
+            return (
+                not df_series.empty
+                and isinstance(df_series, pd.Series)
+                and isinstance(df_series[0], (list, dict))
             )
-            df = result_set.to_pandas_df()
-            if mutator:
-                df = mutator(df)
 
-            for col, coltype in df.dtypes.to_dict().items():
-                if coltype == numpy.object_ and needs_conversion(df[col]):
-                    df[col] = df[col].apply(utils.json_dumps_w_dates)
+        for col, coltype in df.dtypes.to_dict().items():
+            if coltype == numpy.object_ and needs_conversion(df[col]):
+                df[col] = df[col].apply(utils.json_dumps_w_dates)
 
-            return df
+        return df
 
     def compile_sqla_query(self, qry: Select, schema: Optional[str] = None) -> str:
         engine = self._get_sqla_engine(schema=schema)
@@ -827,6 +924,40 @@ sqla.event.listen(Database, "after_insert", security_manager.database_after_inse
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
 
+sqla.event.listen(
+    security_manager.role_model, "after_update", security_manager.on_role_after_update
+)
+sqla.event.listen(
+    security_manager.role_model,
+    "after_delete",
+    security_manager.clear_permissions_cache,
+)
+sqla.event.listen(
+    security_manager.permission_model,
+    "after_update",
+    security_manager.clear_permissions_cache,
+)
+sqla.event.listen(
+    security_manager.permissionview_model,
+    "after_insert",
+    security_manager.clear_permissions_cache,
+)
+sqla.event.listen(
+    security_manager.permissionview_model,
+    "after_delete",
+    security_manager.clear_permissions_cache,
+)
+
+
+def dispose_engines(  # pylint: disable=unused-argument
+    mapper: Any, connection: Connection, target: Database
+) -> None:
+    engine_registry.dispose(target.id)
+
+
+sqla.event.listen(Database, "after_update", dispose_engines)
+sqla.event.listen(Database, "after_delete", dispose_engines)
+
 
 class Log(Model):  # pylint: disable=too-few-public-methods
 
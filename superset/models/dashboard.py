@@ -20,7 +20,7 @@ import json
 import logging
 from collections import defaultdict
 from functools import partial
-from typing import Any, Callable, Dict, List, Set, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Set, Tuple, Union
 
 import sqlalchemy as sqla
 from flask_appbuilder import Model
@@ -180,19 +180,31 @@ class Dashboard(Model, AuditMixinNullable, ImportExportMixin):
     @property
     def datasources(self) -> Set[BaseDatasource]:
         # Verbose but efficient database enumeration of dashboard datasources.
-        datasources_by_cls_model: Dict[Type["BaseDatasource"], Set[int]] = defaultdict(
-            set
-        )
+        return set(self.get_datasources_by_slices(self.slices).values())
 
-        for slc in self.slices:
-            datasources_by_cls_model[slc.cls_model].add(slc.datasource_id)
+    @staticmethod
+    def get_datasources_by_slices(
+        slices: List[Slice], eager: bool = False
+    ) -> Dict[Tuple[str, int], BaseDatasource]:
+        """
+        Fetch the datasources of the slices with one query per datasource type.
+
+        :param slices: The slices whose datasources to fetch
+        :param eager: Whether to eagerly load the columns, metrics, owners and
+            database of the datasources
+        :returns: The datasources by their type and id
+        """
+        datasource_ids_by_type: Dict[str, Set[int]] = defaultdict(set)
+
+        for slc in slices:
+            datasource_ids_by_type[slc.datasource_type].add(slc.datasource_id)
 
         return {
-            datasource
-            for cls_model, datasource_ids in datasources_by_cls_model.items()
-            for datasource in db.session.query(cls_model)
-            .filter(cls_model.id.in_(datasource_ids))
-            .all()
+            (datasource_type, datasource.id): datasource
+            for datasource_type, datasource_ids in datasource_ids_by_type.items()
+            for datasource in DatasourceDAO.get_datasources(
+                db.session, datasource_type, datasource_ids, eager=eager
+            )
         }
 
     @property
@@ -290,19 +302,17 @@ class Dashboard(Model, AuditMixinNullable, ImportExportMixin):
     )
     def datasets_trimmed_for_slices(self) -> List[Dict[str, Any]]:
         # Verbose but efficient database enumeration of dashboard datasources.
-        slices_by_datasource: Dict[
-            Tuple[Type["BaseDatasource"], int], Set[Slice]
-        ] = defaultdict(set)
+        slices_by_datasource: Dict[Tuple[str, int], Set[Slice]] = defaultdict(set)
 
         for slc in self.slices:
-            slices_by_datasource[(slc.cls_model, slc.datasource_id)].add(slc)
+            slices_by_datasource[(slc.datasource_type, slc.datasource_id)].add(slc)
 
+        # the columns and metrics of the datasources are serialized
+        datasources = self.get_datasources_by_slices(self.slices, eager=True)
         result: List[Dict[str, Any]] = []
 
-        for (cls_model, datasource_id), slices in slices_by_datasource.items():
-            datasource = (
-                db.session.query(cls_model).filter_by(id=datasource_id).one_or_none()
-            )
+        for key, slices in slices_by_datasource.items():
+            datasource = datasources.get(key)
 
             if datasource:
                 # Filter out unneeded fields from the datasource payload
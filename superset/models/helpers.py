@@ -548,6 +548,7 @@ class QueryResult:  # pylint: disable=too-few-public-methods
         errors: Optional[List[Dict[str, Any]]] = None,
         from_dttm: Optional[datetime] = None,
         to_dttm: Optional[datetime] = None,
+        rollup: Optional[str] = None,
     ) -> None:
         self.df = df
         self.query = query
@@ -558,6 +559,7 @@ class QueryResult:  # pylint: disable=too-few-public-methods
         self.errors = errors or []
         self.from_dttm = from_dttm
         self.to_dttm = to_dttm
+        self.rollup = rollup
 
 
 class ExtraJSONMixin:
@@ -128,14 +128,16 @@ class CreateReportScheduleCommand(CreateMixin, BaseReportScheduleCommand):
         if extra is None or dashboard is None:
             return
 
-        dashboard_state = extra.get("dashboard")
-        if not dashboard_state:
+        dashboard_state = extra.get("dashboard") or {}
+        tabs = extra.get("tabs") or []
+        charts = extra.get("charts") or []
+        if not dashboard_state and not tabs and not charts:
             return
 
         position_data = json.loads(dashboard.position_json or "{}")
         active_tabs = dashboard_state.get("activeTabs") or []
         anchor = dashboard_state.get("anchor")
-        invalid_tab_ids = set(active_tabs) - set(position_data.keys())
+        invalid_tab_ids = set(active_tabs).union(tabs) - set(position_data.keys())
         if anchor and anchor not in position_data:
             invalid_tab_ids.add(anchor)
         if invalid_tab_ids:
@@ -145,3 +147,15 @@ class CreateReportScheduleCommand(CreateMixin, BaseReportScheduleCommand):
                     "extra",
                 )
             )
+
+        invalid_chart_ids = set(charts) - {chart.id for chart in dashboard.slices}
+        if invalid_chart_ids:
+            exceptions.append(
+                ValidationError(
+                    _(
+                        "Invalid chart ids: %(chart_ids)s",
+                        chart_ids=str(invalid_chart_ids),
+                    ),
+                    "extra",
+                )
+            )
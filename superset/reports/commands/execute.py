@@ -17,7 +17,7 @@
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, List, Optional, Union
+from typing import Any, cast, List, Optional, Tuple, Union
 from uuid import UUID
 
 import pandas as pd
@@ -31,6 +31,7 @@ from superset.common.chart_data import ChartDataResultFormat, ChartDataResultTyp
 from superset.dashboards.permalink.commands.create import (
     CreateDashboardPermalinkCommand,
 )
+from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorsException, SupersetException
 from superset.extensions import feature_flag_manager, machine_auth_provider_factory
@@ -71,6 +72,7 @@ from superset.reports.notifications.base import NotificationContent
 from superset.reports.notifications.exceptions import NotificationError
 from superset.tasks.utils import get_executor
 from superset.utils.celery import session_scope
+from superset.utils.concurrency import map_concurrently
 from superset.utils.core import HeaderDataType, override_user
 from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
 from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
@@ -180,11 +182,7 @@ class BaseReportState:
         # If we need to render dashboard in a specific state, use stateful permalink
         dashboard_state = self._report_schedule.extra.get("dashboard")
         if dashboard_state:
-            permalink_key = CreateDashboardPermalinkCommand(
-                dashboard_id=str(self._report_schedule.dashboard_id),
-                state=dashboard_state,
-            ).run()
-            return get_url_path("Superset.dashboard_permalink", key=permalink_key)
+            return self._get_permalink_url(dashboard_state)
 
         return get_url_path(
             "Superset.dashboard",
@@ -195,33 +193,137 @@ class BaseReportState:
             **kwargs,
         )
 
+    def _get_permalink_url(self, dashboard_state: DashboardPermalinkState) -> str:
+        permalink_key = CreateDashboardPermalinkCommand(
+            dashboard_id=str(self._report_schedule.dashboard_id),
+            state=dashboard_state,
+        ).run()
+        return get_url_path("Superset.dashboard_permalink", key=permalink_key)
+
+    def _get_dashboard_urls(self) -> List[str]:
+        """
+        Get the urls of the tabs of the dashboard to capture, each anchored to one
+        of the tabs configured in the report
+        """
+        tabs = self._report_schedule.extra.get("tabs")
+        if not tabs:
+            return [self._get_url()]
+
+        dashboard_state = self._report_schedule.extra.get("dashboard") or {}
+        return [
+            self._get_permalink_url(
+                {  # type: ignore
+                    **dashboard_state,
+                    "activeTabs": [tab],
+                    "anchor": tab,
+                }
+            )
+            for tab in tabs
+        ]
+
+    def _get_dashboard_chart_ids(self) -> List[List[int]]:
+        """
+        Get the ids of the charts to capture from each of the urls of the dashboard,
+        each chart being captured from the tab containing it in the dashboard
+        layout, or from the first url when it isn't in any of the report tabs
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.views.utils import is_slice_in_container
+
+        chart_ids = self._report_schedule.extra.get("charts") or []
+        tabs = self._report_schedule.extra.get("tabs") or []
+        if len(tabs) <= 1:
+            return [chart_ids]
+
+        try:
+            layout = json.loads(self._report_schedule.dashboard.position_json or "{}")
+        except json.JSONDecodeError:
+            layout = {}
+        tab_chart_ids: List[List[int]] = [[] for _ in tabs]
+        for chart_id in chart_ids:
+            index = next(
+                (
+                    idx
+                    for idx, tab in enumerate(tabs)
+                    if tab in layout and is_slice_in_container(layout, tab, chart_id)
+                ),
+                0,
+            )
+            tab_chart_ids[index].append(chart_id)
+        return tab_chart_ids
+
     def _get_screenshots(self) -> List[bytes]:
         """
-        Get chart or dashboard screenshots
+        Get chart or dashboard screenshots. The tabs of a dashboard are captured
+        concurrently, and the charts of a dashboard from a single load of the tab
+        containing them
         :raises: ReportScheduleScreenshotFailedError
         """
-        url = self._get_url()
         _, username = get_executor(
             executor_types=app.config["ALERT_REPORTS_EXECUTE_AS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
+        screenshots: List[Tuple[Union[ChartScreenshot, DashboardScreenshot], List[str]]]
         if self._report_schedule.chart:
-            screenshot: Union[ChartScreenshot, DashboardScreenshot] = ChartScreenshot(
-                url,
-                self._report_schedule.chart.digest,
-                window_size=app.config["WEBDRIVER_WINDOW"]["slice"],
-                thumb_size=app.config["WEBDRIVER_WINDOW"]["slice"],
-            )
+            screenshots = [
+                (
+                    ChartScreenshot(
+                        self._get_url(),
+                        self._report_schedule.chart.digest,
+                        window_size=app.config["WEBDRIVER_WINDOW"]["slice"],
+                        thumb_size=app.config["WEBDRIVER_WINDOW"]["slice"],
+                    ),
+                    [],
+                )
+            ]
         else:
-            screenshot = DashboardScreenshot(
-                url,
-                self._report_schedule.dashboard.digest,
-                window_size=app.config["WEBDRIVER_WINDOW"]["dashboard"],
-                thumb_size=app.config["WEBDRIVER_WINDOW"]["dashboard"],
-            )
+            urls = self._get_dashboard_urls()
+            if self._report_schedule.extra.get("charts"):
+                # only the tabs containing some of the charts are loaded
+                urls_chart_ids = [
+                    (url, chart_ids)
+                    for url, chart_ids in zip(urls, self._get_dashboard_chart_ids())
+                    if chart_ids
+                ]
+            else:
+                urls_chart_ids = [(url, []) for url in urls]
+            screenshots = [
+                (
+                    DashboardScreenshot(
+                        url,
+                        self._report_schedule.dashboard.digest,
+                        window_size=app.config["WEBDRIVER_WINDOW"]["dashboard"],
+                        thumb_size=app.config["WEBDRIVER_WINDOW"]["dashboard"],
+                    ),
+                    [
+                        DashboardScreenshot.get_chart_element(chart_id)
+                        for chart_id in chart_ids
+                    ],
+                )
+                for url, chart_ids in urls_chart_ids
+            ]
+
+        def take_screenshots(
+            screenshot_elements: Tuple[
+                Union[ChartScreenshot, DashboardScreenshot], List[str]
+            ]
+        ) -> List[Optional[bytes]]:
+            screenshot, element_names = screenshot_elements
+            if element_names:
+                return screenshot.get_screenshots(user, element_names)
+            return [screenshot.get_screenshot(user=user)]
+
         try:
-            image = screenshot.get_screenshot(user=user)
+            images = [
+                image
+                for tab_images in map_concurrently(
+                    take_screenshots,
+                    screenshots,
+                    app.config["ALERT_REPORTS_SCREENSHOT_CONCURRENCY"],
+                )
+                for image in tab_images
+            ]
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while taking a screenshot.")
             raise ReportScheduleScreenshotTimeout() from ex
@@ -229,9 +331,9 @@ class BaseReportState:
             raise ReportScheduleScreenshotFailedError(
                 f"Failed taking a screenshot {str(ex)}"
             ) from ex
-        if not image:
+        if not all(images):
             raise ReportScheduleScreenshotFailedError()
-        return [image]
+        return cast(List[bytes], images)
 
     def _get_csv_data(self) -> bytes:
         url = self._get_url(result_format=ChartDataResultFormat.CSV)
@@ -14,10 +14,14 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import TypedDict
+from typing import List, TypedDict
 
 from superset.dashboards.permalink.types import DashboardPermalinkState
 
 
-class ReportScheduleExtra(TypedDict):
+class ReportScheduleExtra(TypedDict, total=False):
     dashboard: DashboardPermalinkState
+    # tabs of the dashboard captured in separate screenshots
+    tabs: List[str]
+    # charts of the dashboard captured in separate screenshots, from each tab
+    charts: List[int]
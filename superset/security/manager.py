@@ -25,15 +25,18 @@ from typing import (
     Callable,
     cast,
     Dict,
+    FrozenSet,
     List,
     NamedTuple,
     Optional,
     Set,
+    Tuple,
     TYPE_CHECKING,
     Union,
 )
+from uuid import uuid4
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_appbuilder.security.sqla.manager import SecurityManager
@@ -56,11 +59,10 @@ from flask_appbuilder.security.views import (
 from flask_appbuilder.widgets import ListWidget
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import object_session, Session
 from sqlalchemy.orm.mapper import Mapper
-from sqlalchemy.orm.query import Query as SqlaQuery
 
 from superset import sql_parse
 from superset.constants import RouteMethod
@@ -103,6 +105,18 @@ class DatabaseAndSchema(NamedTuple):
     schema: str
 
 
+class RLSFilter(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
+PERMISSIONS_VERSION_CACHE_KEY = "superset:permissions_version"
+RLS_FILTERS_VERSION_CACHE_KEY = "superset:rls_filters_version"
+# session info holding the cache versions to bump once the transaction is committed
+STALE_CACHE_VERSIONS_INFO_KEY = "superset_stale_cache_versions"
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -312,6 +326,128 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             return self.is_item_public(permission_name, view_name)
         return self._has_view_access(user, permission_name, view_name)
 
+    def _has_view_access(
+        self, user: User, permission_name: str, view_name: str
+    ) -> bool:
+        if not current_app.config["PERMISSIONS_CACHE"]:
+            return super()._has_view_access(user, permission_name, view_name)
+
+        # builtin (statically configured) roles don't need querying the database
+        db_role_ids = []
+        for role in user.roles:
+            if role.name in self.builtin_roles:
+                if self._has_access_builtin_roles(role, permission_name, view_name):
+                    return True
+            else:
+                db_role_ids.append(role.id)
+
+        return (permission_name, view_name) in self.get_roles_permissions(db_role_ids)
+
+    def get_roles_permissions(self, role_ids: List[int]) -> FrozenSet[Tuple[str, str]]:
+        """
+        Return the (permission, view menu) pairs granted to the passed roles.
+
+        The permissions are resolved once per request for a given set of roles, and
+        shared across requests when `PERMISSIONS_CACHE_TIMEOUT` is set.
+
+        :param role_ids: The ids of the roles
+        :returns: The permission and view menu names granted to the roles
+        """
+
+        key = ",".join(str(role_id) for role_id in sorted(role_ids))
+        permissions: Dict[str, FrozenSet[Tuple[str, str]]] = g.setdefault(
+            "roles_permissions", {}
+        )
+        if key not in permissions:
+            permissions[key] = self._get_cached_roles_permissions(role_ids, key)
+        return permissions[key]
+
+    def _get_cached_roles_permissions(
+        self, role_ids: List[int], key: str
+    ) -> FrozenSet[Tuple[str, str]]:
+        timeout = current_app.config["PERMISSIONS_CACHE_TIMEOUT"]
+        if timeout is None:
+            return self._get_roles_permissions(role_ids)
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        version = self._get_cache_version(PERMISSIONS_VERSION_CACHE_KEY)
+        cache_key = f"permissions:{version}:{key}"
+        permissions = cache_manager.cache.get(cache_key)
+        if permissions is None:
+            permissions = self._get_roles_permissions(role_ids)
+            cache_manager.cache.set(cache_key, permissions, timeout=timeout)
+        return permissions
+
+    def _get_roles_permissions(self, role_ids: List[int]) -> FrozenSet[Tuple[str, str]]:
+        if not role_ids:
+            return frozenset()
+
+        query = (
+            self.get_session.query(self.permission_model.name, self.viewmenu_model.name)
+            .select_from(self.permissionview_model)
+            .join(self.permission_model)
+            .join(self.viewmenu_model)
+            .join(assoc_permissionview_role)
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+        )
+        return frozenset(
+            (permission_name, view_name) for permission_name, view_name in query
+        )
+
+    def clear_permissions_cache(  # pylint: disable=unused-argument
+        self, mapper: Mapper, connection: Connection, target: Model
+    ) -> None:
+        """
+        Invalidate the permissions of the roles resolved so far, following the change
+        of a role, a permission or a view menu.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The mapped instance being changed
+        """
+        if has_app_context() and current_app.config["PERMISSIONS_CACHE"]:
+            g.pop("roles_permissions", None)
+            if current_app.config["PERMISSIONS_CACHE_TIMEOUT"] is not None:
+                self._bump_cache_version_on_commit(
+                    target, PERMISSIONS_VERSION_CACHE_KEY
+                )
+
+    @staticmethod
+    def _get_cache_version(key: str) -> str:
+        """
+        Return the version embedded in cache keys, replaced by `_bump_cache_version` to
+        leave the values cached until then to expire.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        version = cache_manager.cache.get(key)
+        if version is None:
+            cache_manager.cache.add(key, uuid4().hex, timeout=0)
+            version = cache_manager.cache.get(key)
+        return version
+
+    @staticmethod
+    def _bump_cache_version(key: str) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache_manager.cache.set(key, uuid4().hex, timeout=0)
+
+    def _bump_cache_version_on_commit(self, target: Model, key: str) -> None:
+        """
+        Bump a cache version once the transaction changing `target` is committed,
+        rather than when it is flushed, so that the values read by other requests
+        before the commit can't be cached under the new version.
+        """
+        session = object_session(target)
+        if session is None:
+            self._bump_cache_version(key)
+            return
+        session.info.setdefault(STALE_CACHE_VERSIONS_INFO_KEY, set()).add(key)
+
     def can_access_all_queries(self) -> bool:
         """
         Return True if the user can access all SQL Lab queries, False otherwise.
@@ -1623,6 +1759,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being changed
         """
+        self.clear_permissions_cache(mapper, connection, target)
 
     def on_view_menu_after_insert(
         self, mapper: Mapper, connection: Connection, target: ViewMenu
@@ -1655,6 +1792,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.clear_permissions_cache(mapper, connection, target)
 
     def on_permission_after_insert(
         self, mapper: Mapper, connection: Connection, target: Permission
@@ -1687,6 +1825,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.clear_permissions_cache(mapper, connection, target)
 
     def on_permission_view_after_delete(
         self, mapper: Mapper, connection: Connection, target: PermissionView
@@ -1703,6 +1842,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.clear_permissions_cache(mapper, connection, target)
 
     @staticmethod
     def get_exclude_users_from_lists() -> List[str]:
@@ -1859,11 +1999,14 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource") -> List[SqlaQuery]:
+    def get_rls_filters(self, table: "BaseDatasource") -> List[RLSFilter]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        The filters are resolved once per request for a given set of roles and table,
+        and shared across requests when `RLS_FILTERS_CACHE_TIMEOUT` is set.
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -1871,6 +2014,36 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = sorted(role.id for role in self.get_user_roles(g.user))
+        key = f"{','.join(str(role_id) for role_id in user_roles)}:{table.id}"
+        filters: Dict[str, List[RLSFilter]] = g.setdefault("rls_filters", {})
+        if key not in filters:
+            filters[key] = self._get_cached_rls_filters(user_roles, table.id, key)
+        return filters[key]
+
+    def _get_cached_rls_filters(
+        self, user_roles: List[int], table_id: int, key: str
+    ) -> List[RLSFilter]:
+        timeout = current_app.config["RLS_FILTERS_CACHE_TIMEOUT"]
+        if timeout is None:
+            return self._get_rls_filters(user_roles, table_id)
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        version = self._get_cache_version(RLS_FILTERS_VERSION_CACHE_KEY)
+        cache_key = f"rls_filters:{version}:{key}"
+        cached = cache_manager.cache.get(cache_key)
+        if cached is not None:
+            return [RLSFilter(*filter_) for filter_ in cached]
+
+        filters = self._get_rls_filters(user_roles, table_id)
+        cache_manager.cache.set(
+            cache_key, [tuple(filter_) for filter_ in filters], timeout=timeout
+        )
+        return filters
+
+    def _get_rls_filters(self, user_roles: List[int], table_id: int) -> List[RLSFilter]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -1878,7 +2051,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session()
             .query(RLSFilterRoles.c.rls_filter_id)
@@ -1900,7 +2072,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         filter_tables = (
             self.get_session()
             .query(RLSFilterTables.c.rls_filter_id)
-            .filter(RLSFilterTables.c.table_id == table.id)
+            .filter(RLSFilterTables.c.table_id == table_id)
         )
         query = (
             self.get_session()
@@ -1925,7 +2097,25 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [RLSFilter(*row) for row in query.all()]
+
+    def clear_rls_filters_cache(  # pylint: disable=unused-argument
+        self, mapper: Mapper, connection: Connection, target: Model
+    ) -> None:
+        """
+        Invalidate the row level security filters resolved so far, following the
+        change of a filter or a role.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The mapped instance being changed
+        """
+        if has_app_context():
+            g.pop("rls_filters", None)
+            if current_app.config["RLS_FILTERS_CACHE_TIMEOUT"] is not None:
+                self._bump_cache_version_on_commit(
+                    target, RLS_FILTERS_VERSION_CACHE_KEY
+                )
 
     def get_rls_ids(self, table: "BaseDatasource") -> List[int]:
         """
@@ -2221,3 +2411,17 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return current_app.config["AUTH_ROLE_ADMIN"] in [
             role.name for role in self.get_user_roles()
         ]
+
+
+def bump_stale_cache_versions(session: Session) -> None:
+    """
+    Bump the cache versions invalidated by the changes of a committed transaction.
+    Versions flagged in a transaction that is rolled back are left for the next
+    commit of the session, invalidating the caches once more at worst.
+    """
+    # pylint: disable=protected-access
+    for key in session.info.pop(STALE_CACHE_VERSIONS_INFO_KEY, ()):
+        SupersetSecurityManager._bump_cache_version(key)
+
+
+event.listen(Session, "after_commit", bump_stale_cache_versions)
@@ -23,8 +23,6 @@ from sys import getsizeof
 from typing import Any, cast, Dict, List, Optional, Tuple, Union
 
 import backoff
-import msgpack
-import pyarrow as pa
 import simplejson as json
 from celery import Task
 from celery.exceptions import SoftTimeLimitExceeded
@@ -51,6 +49,12 @@ from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql_parse import CtasMethod, insert_rls, ParsedQuery
 from superset.sqllab.limiting_factor import LimitingFactor
+from superset.sqllab.result_chunks import ResultsChunkWriter
+from superset.sqllab.results_format import (
+    is_serialized_results,
+    serialize_results,
+    serialize_table,
+)
 from superset.utils.celery import session_scope
 from superset.utils.core import (
     get_username,
@@ -67,6 +71,7 @@ stats_logger = config["STATS_LOGGER"]
 SQLLAB_TIMEOUT = config["SQLLAB_ASYNC_TIME_LIMIT_SEC"]
 SQLLAB_HARD_TIMEOUT = SQLLAB_TIMEOUT + 60
 SQL_MAX_ROW = config["SQL_MAX_ROW"]
+SQLLAB_RESULTS_BATCH_SIZE = config["SQLLAB_RESULTS_BATCH_SIZE"]
 SQLLAB_CTAS_NO_LIMIT = config["SQLLAB_CTAS_NO_LIMIT"]
 SQL_QUERY_MUTATOR = config["SQL_QUERY_MUTATOR"]
 log_query = config["QUERY_LOGGER"]
@@ -193,15 +198,21 @@ def get_sql_results(  # pylint: disable=too-many-arguments
                 return handle_query_error(ex, query, session)
 
 
-def execute_sql_statement(  # pylint: disable=too-many-arguments,too-many-statements
+def execute_sql_statement(  # pylint: disable=too-many-arguments,too-many-statements,too-many-locals
     sql_statement: str,
     query: Query,
     session: Session,
     cursor: Any,
     log_params: Optional[Dict[str, Any]],
     apply_ctas: bool = False,
-) -> SupersetResultSet:
-    """Executes a single SQL statement"""
+    results_writer: Optional[ResultsChunkWriter] = None,
+) -> Union[SupersetResultSet, ResultsChunkWriter]:
+    """
+    Executes a single SQL statement
+
+    When a ``results_writer`` is given, results are fetched in batches and written
+    to the results backend as they are fetched, instead of being returned.
+    """
     database: Database = query.database
     db_engine_spec = database.db_engine_spec
 
@@ -285,6 +296,10 @@ def execute_sql_statement(  # pylint: disable=too-many-arguments,too-many-statem
                 query.id,
                 str(query.to_dict()),
             )
+            if results_writer is not None:
+                _write_data_in_batches(cursor, query, results_writer, increased_limit)
+                return results_writer
+
             data = db_engine_spec.fetch_data(cursor, increased_limit)
             if query.limit is None or len(data) <= query.limit:
                 query.limiting_factor = LimitingFactor.NOT_LIMITED
@@ -322,6 +337,28 @@ def execute_sql_statement(  # pylint: disable=too-many-arguments,too-many-statem
     return SupersetResultSet(data, cursor_description, db_engine_spec)
 
 
+def _write_data_in_batches(
+    cursor: Any,
+    query: Query,
+    results_writer: ResultsChunkWriter,
+    increased_limit: Optional[int],
+) -> None:
+    db_engine_spec = query.database.db_engine_spec
+    limited = False
+    for data in db_engine_spec.fetch_data_in_batches(
+        cursor, increased_limit, SQLLAB_RESULTS_BATCH_SIZE
+    ):
+        if query.limit is not None and results_writer.size + len(data) > query.limit:
+            # drop the extra row fetched to check if the results were limited
+            data = data[: query.limit - results_writer.size]
+            limited = True
+        results_writer.write(
+            SupersetResultSet(data, cursor.description, db_engine_spec)
+        )
+    if not limited:
+        query.limiting_factor = LimitingFactor.NOT_LIMITED
+
+
 def apply_limit_if_exists(
     database: Database, increased_limit: Optional[int], query: Query, sql: str
 ) -> str:
@@ -340,7 +377,7 @@ def _serialize_payload(
 ) -> Union[bytes, str]:
     logger.debug("Serializing to msgpack: %r", use_msgpack)
     if use_msgpack:
-        return msgpack.dumps(payload, default=json_iso_dttm_ser, use_bin_type=True)
+        return serialize_results(payload)
 
     return json.dumps(payload, default=json_iso_dttm_ser, ignore_nan=True)
 
@@ -359,12 +396,7 @@ def _serialize_and_expand_data(
         with stats_timing(
             "sqllab.query.results_backend_pa_serialization", stats_logger
         ):
-            data = (
-                pa.default_serialization_context()
-                .serialize(result_set.pa_table)
-                .to_buffer()
-                .to_pybytes()
-            )
+            data = serialize_table(result_set.pa_table)
 
         # expand when loading data from results backend
         all_columns, expanded_columns = (selected_columns, [])
@@ -383,6 +415,43 @@ def _serialize_and_expand_data(
     return (data, selected_columns, all_columns, expanded_columns)
 
 
+def _serialize_and_expand_data_for_storage_and_response(
+    result_set: SupersetResultSet,
+    db_engine_spec: BaseEngineSpec,
+    expand_data: bool = False,
+    display_limit: Optional[int] = None,
+) -> Tuple[bytes, List[Any], List[Any], List[Any], List[Any]]:
+    """
+    Serialize a result set both for the results backend and for the response of a
+    synchronous query, with a single pass over its Arrow table.
+
+    The results backend gets the whole table, while only the rows that can be
+    displayed are converted to records for the response, since the rest would be
+    dropped before being sent back to the client.
+    """
+    selected_columns = result_set.columns
+    table = result_set.pa_table
+
+    with stats_timing("sqllab.query.results_backend_pa_serialization", stats_logger):
+        stored_data = serialize_table(table)
+
+    with stats_timing("sqllab.query.results_records_serialization", stats_logger):
+        if display_limit is not None:
+            table = table.slice(0, display_limit)
+        df = SupersetResultSet.convert_table_to_df(table)
+        data = df_to_records(df) or []
+
+        if expand_data:
+            all_columns, data, expanded_columns = db_engine_spec.expand_data(
+                selected_columns, data
+            )
+        else:
+            all_columns = selected_columns
+            expanded_columns = []
+
+    return (stored_data, data, selected_columns, all_columns, expanded_columns)
+
+
 def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-locals, too-many-statements, too-many-branches
     query_id: int,
     rendered_query: str,
@@ -464,6 +533,22 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
             )
         )
 
+    cache_timeout = database.cache_timeout
+    if cache_timeout is None:
+        cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
+
+    # Asynchronous queries write their results to the results backend in chunks
+    # while they are fetched, so that memory usage is bounded by the batch size
+    results_writer = (
+        ResultsChunkWriter(str(uuid.uuid4()), cache_timeout)
+        if SQLLAB_RESULTS_BATCH_SIZE
+        and store_results
+        and not return_results
+        and results_backend
+        and results_backend_use_msgpack
+        else None
+    )
+
     with database.get_raw_connection(query.schema, source=QuerySource.SQL_LAB) as conn:
         # Sharing a single connection and cursor across the
         # execution of all statements (if many)
@@ -497,6 +582,7 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
                     cursor,
                     log_params,
                     apply_ctas,
+                    results_writer if i == statement_count - 1 else None,
                 )
             except SqlLabQueryStoppedException:
                 payload.update({"status": QueryStatus.STOPPED})
@@ -531,9 +617,37 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
-    )
+    if isinstance(result_set, ResultsChunkWriter):
+        # data was already stored in chunks, expanded when loaded
+        data, selected_columns, all_columns, expanded_columns = (
+            None,
+            result_set.columns,
+            result_set.columns,
+            [],
+        )
+        payload["chunks"] = result_set.chunks
+    elif use_arrow_data and return_results:
+        # the stored payload and the response are encoded in a single pass
+        (
+            data,
+            returned_data,
+            selected_columns,
+            returned_columns,
+            returned_expanded_columns,
+        ) = _serialize_and_expand_data_for_storage_and_response(
+            result_set, db_engine_spec, expand_data, config["DISPLAY_MAX_ROW"]
+        )
+        # expand when loading data from results backend
+        all_columns, expanded_columns = (selected_columns, [])
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            result_set, db_engine_spec, use_arrow_data, expand_data
+        )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
@@ -549,7 +663,7 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
     payload["query"]["state"] = QueryStatus.SUCCESS
 
     if store_results and results_backend:
-        key = str(uuid.uuid4())
+        key = results_writer.key if results_writer else str(uuid.uuid4())
         payload["query"]["resultsKey"] = key
         logger.info(
             "Query %s: Storing results in results backend, key: %s", str(query_id), key
@@ -561,11 +675,12 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
                 serialized_payload = _serialize_payload(
                     payload, cast(bool, results_backend_use_msgpack)
                 )
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
-
-            compressed = zlib_compress(serialized_payload)
+            # Arrow results are stored with compressed buffers already
+            compressed = (
+                serialized_payload
+                if is_serialized_results(serialized_payload)
+                else zlib_compress(serialized_payload)
+            )
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
@@ -577,22 +692,13 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
     session.commit()
 
     if return_results:
-        # since we're returning results we need to create non-arrow data
+        # since we're returning results we need to return non-arrow data
         if use_arrow_data:
-            (
-                data,
-                selected_columns,
-                all_columns,
-                expanded_columns,
-            ) = _serialize_and_expand_data(
-                result_set, db_engine_spec, False, expand_data
-            )
             payload.update(
                 {
-                    "data": data,
-                    "columns": all_columns,
-                    "selected_columns": selected_columns,
-                    "expanded_columns": expanded_columns,
+                    "data": returned_data,
+                    "columns": returned_columns,
+                    "expanded_columns": returned_expanded_columns,
                 }
             )
         return payload
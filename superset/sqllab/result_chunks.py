@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Chunked storage of SQL Lab results in the results backend.
+
+Large results are written as a sequence of independent Arrow IPC files,
+each stored under its own key, while the main results key only holds the payload
+metadata and the list of chunks.
+"""
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+import pyarrow as pa
+
+from superset import results_backend
+from superset.exceptions import SerializationError
+from superset.result_set import SupersetResultSet
+from superset.sqllab.results_format import (
+    deserialize_table,
+    iter_table_batches,
+    serialize_table,
+)
+from superset.superset_typing import ResultSetColumnType
+
+logger = logging.getLogger(__name__)
+
+
+class ResultsChunkWriter:
+    """
+    Write a result set to the results backend, one batch of rows at a time.
+    """
+
+    def __init__(self, key: str, cache_timeout: int) -> None:
+        self.key = key
+        self.cache_timeout = cache_timeout
+        self.chunks: List[Dict[str, Any]] = []
+        self.columns: List[ResultSetColumnType] = []
+        self.size = 0
+
+    def write(self, result_set: SupersetResultSet) -> None:
+        if not result_set.size:
+            return
+
+        if not self.columns:
+            self.columns = result_set.columns
+
+        chunk_key = f"{self.key}-{len(self.chunks)}"
+        blob = serialize_table(result_set.pa_table)
+        results_backend.set(chunk_key, blob, self.cache_timeout)
+
+        self.chunks.append({"key": chunk_key, "rows": result_set.size})
+        self.size += result_set.size
+        logger.debug("Stored results chunk %s (%i rows)", chunk_key, result_set.size)
+
+
+def read_chunks(
+    chunks: List[Dict[str, Any]],
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> pa.Table:
+    """
+    Read a range of rows from result chunks in the results backend. Only the chunks
+    overlapping with the range are fetched and decoded, based on their row counts.
+    """
+    tables = []
+    start = 0
+    for chunk in chunks:
+        if limit is not None and start >= offset + limit:
+            break
+        end = start + chunk["rows"]
+        if end > offset:
+            blob = results_backend.get(chunk["key"])
+            if not blob:
+                raise SerializationError(f"Results chunk {chunk['key']} is missing")
+            chunk_offset = max(offset - start, 0)
+            chunk_limit = (
+                None if limit is None else offset + limit - start - chunk_offset
+            )
+            tables.append(deserialize_table(blob, chunk_offset, chunk_limit))
+        start = end
+
+    if not tables:
+        return pa.table({})
+    return concat_tables(tables)
+
+
+def iter_chunks(chunks: List[Dict[str, Any]]) -> Iterator[pa.Table]:
+    """
+    Read result chunks from the results backend one record batch at a time.
+    """
+    for chunk in chunks:
+        blob = results_backend.get(chunk["key"])
+        if not blob:
+            raise SerializationError(f"Results chunk {chunk['key']} is missing")
+        yield from iter_table_batches(blob)
+
+
+def concat_tables(tables: List[pa.Table]) -> pa.Table:
+    """
+    Concatenate tables built from different batches of the same result.
+
+    Since batches are converted independently, a column might have a null type in
+    some batches, or have fallen back to strings in others.
+    """
+    types: Dict[str, Set[pa.DataType]] = {}
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                types.setdefault(field.name, set()).add(field.type)
+
+    conflicting = {name for name, types_ in types.items() if len(types_) > 1}
+    if conflicting:
+        tables = [
+            table.cast(
+                pa.schema(
+                    field.with_type(pa.string()) if field.name in conflicting else field
+                    for field in table.schema
+                )
+            )
+            for table in tables
+        ]
+
+    return pa.concat_tables(tables, promote=True)
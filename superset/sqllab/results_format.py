@@ -0,0 +1,168 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Binary format of SQL Lab results stored in the results backend.
+
+A serialized result is made of a fixed size header (magic bytes, format version and
+metadata length), the msgpack encoded payload metadata, and the data as an Arrow IPC
+file with compressed buffers. Since the IPC file format has a footer indexing its
+record batches, ranges of rows and subsets of columns can be read without decoding
+the whole result, directly from the stored bytes.
+"""
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import msgpack
+import pyarrow as pa
+
+from superset import app
+from superset.exceptions import SerializationError
+from superset.utils.core import json_iso_dttm_ser, zlib_decompress
+
+config = app.config
+
+MAGIC = b"SSRB"
+VERSION = 1
+HEADER = struct.Struct(">4sBI")
+
+# maximum number of rows in each record batch of the Arrow IPC file
+BATCH_SIZE = 65536
+
+
+def serialize_table(table: pa.Table, batch_size: int = BATCH_SIZE) -> bytes:
+    """
+    Serialize a table to an Arrow IPC file, compressed with the codec set in
+    ``RESULTS_BACKEND_COMPRESSION``.
+    """
+    options = pa.ipc.IpcWriteOptions(compression=config["RESULTS_BACKEND_COMPRESSION"])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table, max_chunksize=batch_size)
+    return sink.getvalue().to_pybytes()
+
+
+def deserialize_table(
+    data: Union[bytes, pa.Buffer],
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+) -> pa.Table:
+    """
+    Read a range of rows and a subset of columns from an Arrow IPC file, only
+    decoding the record batches that overlap with the range.
+    """
+    try:
+        reader = pa.ipc.open_file(data)
+        if columns is not None:
+            indexes = [reader.schema.get_field_index(name) for name in columns]
+            reader = pa.ipc.open_file(
+                data,
+                options=pa.ipc.IpcReadOptions(
+                    included_fields=[index for index in indexes if index >= 0]
+                ),
+            )
+
+        batches = []
+        start = 0
+        for i in range(reader.num_record_batches):
+            if limit is not None and start >= offset + limit:
+                break
+            batch = reader.get_batch(i)
+            end = start + batch.num_rows
+            if end > offset:
+                batch_offset = max(offset - start, 0)
+                batch_limit = (
+                    None if limit is None else offset + limit - start - batch_offset
+                )
+                batches.append(batch.slice(batch_offset, batch_limit))
+            start = end
+
+        schema = batches[0].schema if batches else reader.schema
+        return pa.Table.from_batches(batches, schema=schema)
+    except pa.ArrowInvalid as ex:
+        raise SerializationError("Unable to deserialize table") from ex
+
+
+def iter_table_batches(data: Union[bytes, pa.Buffer]) -> Iterator[pa.Table]:
+    """
+    Read an Arrow IPC file one record batch at a time.
+    """
+    try:
+        reader = pa.ipc.open_file(data)
+        for i in range(reader.num_record_batches):
+            yield pa.Table.from_batches([reader.get_batch(i)])
+    except pa.ArrowInvalid as ex:
+        raise SerializationError("Unable to deserialize table") from ex
+
+
+def is_serialized_results(blob: Union[bytes, str]) -> bool:
+    return isinstance(blob, bytes) and blob[: len(MAGIC)] == MAGIC
+
+
+def serialize_results(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a results payload whose ``data`` holds a serialized Arrow table.
+    """
+    data = payload.get("data") or b""
+    metadata = msgpack.dumps(
+        {**payload, "data": None},
+        default=json_iso_dttm_ser,
+        use_bin_type=True,
+    )
+    return HEADER.pack(MAGIC, VERSION, len(metadata)) + metadata + data
+
+
+def deserialize_results(
+    blob: bytes,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+) -> Tuple[Dict[str, Any], Optional[pa.Table]]:
+    """
+    Deserialize the metadata and (a slice of) the data of serialized results.
+    """
+    metadata, data = split_results(blob)
+    if data is None:
+        return metadata, None
+    return metadata, deserialize_table(data, offset, limit, columns)
+
+
+def split_results(blob: bytes) -> Tuple[Dict[str, Any], Optional[pa.Buffer]]:
+    """
+    Split serialized results into their deserialized metadata and the Arrow IPC
+    file holding their data, if any.
+    """
+    magic, version, length = HEADER.unpack_from(blob)
+    if magic != MAGIC or version != VERSION:
+        raise SerializationError(f"Unsupported results format version {version}")
+
+    metadata = msgpack.loads(blob[HEADER.size : HEADER.size + length], raw=False)
+    if len(blob) == HEADER.size + length:
+        return metadata, None
+
+    # zero-copy view over the stored bytes
+    return metadata, pa.py_buffer(blob)[HEADER.size + length :]
+
+
+def decompress_results(blob: bytes, use_msgpack: bool) -> Union[bytes, str]:
+    """
+    Decompress results read from the results backend. Serialized Arrow results
+    are stored as is, since their buffers are already compressed.
+    """
+    if is_serialized_results(blob):
+        return blob
+    return zlib_decompress(blob, decode=not use_msgpack)
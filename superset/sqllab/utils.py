@@ -20,7 +20,7 @@ from superset.common.db_query_status import QueryStatus
 
 
 def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-name
-    sql_results: Dict[str, Any], max_rows_in_result: int
+    sql_results: Dict[str, Any], max_rows_in_result: int, offset: int = 0
 ) -> Dict[str, Any]:
     """
     Given a `sql_results` nested structure, applies a limit to the number of rows
@@ -32,13 +32,14 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
 
     :param max_rows_in_result:
     :param sql_results: The results of a sql query from sql_lab.get_sql_results
+    :param offset: The number of rows already skipped from the data
     :returns: The mutated sql_results structure
     """
 
     def is_require_to_apply() -> bool:
         return (
             sql_results["status"] == QueryStatus.SUCCESS
-            and sql_results["query"]["rows"] > max_rows_in_result
+            and sql_results["query"]["rows"] > offset + max_rows_in_result
         )
 
     if is_require_to_apply():
@@ -98,6 +98,34 @@ def load_chart_data_into_cache(
             raise ex
 
 
+@celery_app.task(name="refresh_chart_data_cache", soft_time_limit=query_timeout)
+def refresh_chart_data_cache(
+    user_id: Optional[int],
+    form_data: Dict[str, Any],
+) -> None:
+    """
+    Reload the cached data of a chart query context that is being served stale
+    """
+    user = (
+        security_manager.get_user_by_id(user_id)
+        or security_manager.get_anonymous_user()
+    )
+
+    with override_user(user, force=False):
+        try:
+            set_form_data(form_data)
+            query_context = _create_query_context_from_form(
+                {**form_data, "force": True}
+            )
+            query_context.raise_for_access()
+            query_context.get_payload()
+        except SoftTimeLimitExceeded as ex:
+            logger.warning(
+                "A timeout occurred while refreshing chart data, error: %s", ex
+            )
+            raise ex
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: Dict[str, Any],
@@ -0,0 +1,89 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Tasks keeping the latest partitions of Presto, Trino and Hive tables cached"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from superset.extensions import celery_app, db
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="partitions.refresh", soft_time_limit=300)
+def refresh_partition(
+    method: str,
+    database_id: int,
+    table_name: str,
+    schema: Optional[str],
+    kwargs: Dict[str, Any],
+) -> None:
+    """Refresh the cached partition metadata of a table"""
+    # pylint: disable=import-outside-toplevel
+    from superset.db_engine_specs.presto import PrestoBaseEngineSpec
+    from superset.models.core import Database
+
+    database = db.session.query(Database).filter_by(id=database_id).one_or_none()
+    if not database or not issubclass(database.db_engine_spec, PrestoBaseEngineSpec):
+        logger.warning("No partitioned database found with id %s", database_id)
+        return
+
+    try:
+        database.db_engine_spec.refresh_cached_partition(
+            method, table_name, schema, database, **kwargs
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.exception(
+            "Failed refreshing the %s of %s.%s", method, schema, table_name
+        )
+
+
+@celery_app.task(name="partitions.prime_dashboards", soft_time_limit=3600)
+def prime_dashboard_partitions() -> None:
+    """Cache the latest partitions of the tables referenced by dashboards"""
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.db_engine_specs.presto import PrestoBaseEngineSpec
+    from superset.models.slice import Slice
+    from superset.utils.core import DatasourceType
+
+    if not PrestoBaseEngineSpec.has_partition_cache():
+        logger.warning("No partition cache set, refusing to prime it")
+        return
+
+    table_ids = db.session.query(Slice.datasource_id).filter(
+        Slice.datasource_type == DatasourceType.TABLE,
+        Slice.dashboards.any(),
+    )
+    tables = (
+        db.session.query(SqlaTable)
+        # only physical tables are partitioned
+        .filter(SqlaTable.id.in_(table_ids), SqlaTable.sql.is_(None))
+        .all()
+    )
+    for table in tables:
+        db_engine_spec = table.database.db_engine_spec
+        if not issubclass(db_engine_spec, PrestoBaseEngineSpec):
+            continue
+
+        try:
+            db_engine_spec.refresh_cached_partition(
+                "latest_partition", table.table_name, table.schema, table.database
+            )
+        except Exception:  # pylint: disable=broad-except
+            # the table isn't partitioned
+            logger.debug("No partition found for %s", table.full_name, exc_info=True)
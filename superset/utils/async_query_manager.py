@@ -164,13 +164,43 @@ class AsyncQueryManager:
         )
 
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self, channel: str, last_id: Optional[str], block_ms: Optional[int] = None
     ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read the events of a channel following the last event received. When
+        `block_ms` is given and there are no such events yet, wait for up to
+        `block_ms` milliseconds for new events to be added.
+        """
+        if block_ms:
+            return self.read_channels_events({channel: last_id}, block_ms)[channel]
+
         stream_name = f"{self._stream_prefix}{channel}"
         start_id = increment_id(last_id) if last_id else "-"
         results = self._redis.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
         return [] if not results else list(map(parse_event, results))
 
+    def read_channels_events(
+        self, last_ids: Dict[str, Optional[str]], block_ms: Optional[int] = None
+    ) -> Dict[str, List[Optional[Dict[str, Any]]]]:
+        """
+        Read the events of several channels with a single command, following the
+        last event received on each of them. When `block_ms` is given and there are
+        no such events yet, wait for up to `block_ms` milliseconds for new events
+        to be added to any of the channels.
+        """
+        streams = {
+            f"{self._stream_prefix}{channel}": last_id or "0-0"
+            for channel, last_id in last_ids.items()
+        }
+        results = self._redis.xread(
+            streams, count=self.MAX_EVENT_COUNT, block=block_ms or None
+        )
+        events = dict(results or [])
+        return {
+            channel: list(map(parse_event, events.get(stream_name) or []))
+            for channel, stream_name in zip(last_ids, streams)
+        }
+
     def update_job(
         self, job_metadata: Dict[str, Any], status: str, **kwargs: Any
     ) -> None:
@@ -189,5 +219,8 @@ class AsyncQueryManager:
         logger.debug("********** logging event data to stream %s", scoped_stream_name)
         logger.debug(event_data)
 
-        self._redis.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
-        self._redis.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+        # write to both streams in a single round trip
+        pipeline = self._redis.pipeline(transaction=False)
+        pipeline.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
+        pipeline.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+        pipeline.execute()
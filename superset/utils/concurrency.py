@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, TypeVar
+
+import sqlalchemy as sa
+from flask import (
+    copy_current_request_context,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+)
+from sqlalchemy.exc import InvalidRequestError, NoInspectionAvailable
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_local = threading.local()
+
+
+def _merge_user(user: Any) -> Any:
+    """
+    Merge the logged in user into the session of the current thread, so that its
+    relationships (e.g. its roles) are never lazily loaded through the session of
+    the thread it was copied from, sessions not being thread-safe.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset import db, security_manager
+
+    try:
+        state = sa.inspect(user)
+    except NoInspectionAvailable:
+        # anonymous and guest users aren't mapped
+        return user
+    if state.identity is None:
+        return user
+
+    try:
+        return db.session.merge(user, load=False)
+    except InvalidRequestError:
+        # the user has pending changes, which can't be merged without loading it
+        return security_manager.get_user_by_id(state.identity[0])
+
+
+def copy_current_context(func: Callable[..., R]) -> Callable[..., R]:
+    """
+    Wrap a function so that it runs in a copy of the current app context,
+    request context and ``g`` (which holds the logged in user) when called from
+    another thread. The logged in user is merged into the session of the thread
+    running the function.
+
+    The wrapper must be created in the thread owning the context, once per call.
+    """
+    if not has_app_context():
+        return func
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    g_vars = dict(vars(g._get_current_object()))  # pylint: disable=protected-access
+    if has_request_context():
+        func = copy_current_request_context(func)
+
+    def wrapper(*args: Any, **kwargs: Any) -> R:
+        with app.app_context():
+            vars(g).update(g_vars)
+            if "user" in g_vars:
+                g.user = _merge_user(g_vars["user"])
+            _local.in_worker = True
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _local.in_worker = False
+
+    return wrapper
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> List[R]:
+    """
+    Apply a function to items in a bounded thread pool, preserving their order.
+
+    The first exception raised (in the order of the items) is re-raised. Calls run
+    serially when ``max_workers`` is 1 or less, or when already running in a worker,
+    so that nested calls never exceed the concurrency limit of the outer one.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1 or getattr(_local, "in_worker", False):
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(copy_current_context(func), item) for item in items]
+        return [future.result() for future in futures]
@@ -77,7 +77,15 @@ import sqlalchemy as sa
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.backends.openssl.x509 import _Certificate
-from flask import current_app, flash, g, Markup, render_template, request
+from flask import (
+    current_app,
+    flash,
+    g,
+    has_app_context,
+    Markup,
+    render_template,
+    request,
+)
 from flask_appbuilder import SQLA
 from flask_appbuilder.security.sqla.models import Role, User
 from flask_babel import gettext as __
@@ -1550,6 +1558,37 @@ def override_user(user: Optional[User], force: bool = True) -> Iterator[Any]:
         delattr(g, "user")
 
 
+@contextmanager
+def memoize_datasource_queries() -> Iterator[None]:
+    """
+    Memoize the queries built by datasources within the block, keyed by query object.
+
+    The same query object is typically built once to compute its cache key, and once
+    more to be executed on a cache miss: the block makes both share the rendered
+    templates, row level security filters and compiled SQL.
+    """
+
+    # pylint: disable=assigning-non-slot
+    if has_app_context() and "datasource_queries" not in g:
+        g.datasource_queries = {}
+        try:
+            yield
+        finally:
+            g.pop("datasource_queries", None)
+    else:
+        yield
+
+
+def get_memoized_datasource_queries() -> Optional[Dict[str, Any]]:
+    """
+    Return the queries memoized by the enclosing `memoize_datasource_queries` block,
+    if any.
+    """
+    if not has_app_context():
+        return None
+    return g.get("datasource_queries")
+
+
 def parse_ssl_cert(certificate: str) -> _Certificate:
     """
     Parses the contents of a certificate and returns a valid certificate object
@@ -17,11 +17,13 @@
 import logging
 import re
 import urllib.request
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 from urllib.error import URLError
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import simplejson
 
 from superset.utils.core import GenericDataType
@@ -38,6 +40,18 @@ negative_number_re = re.compile(r"^-[0-9.]+$")
 #
 problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
 
+# The same patterns for the RE2 engine of Arrow, which has no lookahead, and whose
+# `\s` and `$` don't match the Unicode whitespace and trailing newline matched by
+# Python.
+unicode_whitespace = (
+    r"\t\n\x0b\x0c\r\x1c-\x1f \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}"
+    r"\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}"
+)
+problematic_chars_re2 = rf'^(?:"{{2}}|[{unicode_whitespace}]+)?[\-@+|=%]'
+negative_number_re2 = r"^-[0-9.]+\n?$"
+
+ArrowStrings = Union[pa.Array, pa.ChunkedArray]
+
 
 def escape_value(value: str) -> str:
     """
@@ -64,22 +78,108 @@ def escape_value(value: str) -> str:
     return value
 
 
+def escape_values(column: pd.Series) -> pd.Series:
+    """
+    Vectorized version of `escape_value`, escaping all the strings of a column at
+    once. Values that are not strings are left untouched.
+    """
+    needs_escaping = column.str.match(problematic_chars_re.pattern, na=False)
+    is_negative_number = column.str.match(negative_number_re.pattern, na=False)
+    mask = (needs_escaping & ~is_negative_number).to_numpy(dtype=bool)
+    if not mask.any():
+        return column
+
+    escaped = "'" + column[mask].str.replace("|", "\\|", regex=False)
+    values = column.to_numpy(dtype=object, copy=True)
+    values[mask] = escaped.to_numpy(dtype=object)
+    return pd.Series(values, index=column.index, name=column.name, dtype=column.dtype)
+
+
+def escape_arrow_array(array: ArrowStrings) -> ArrowStrings:
+    """
+    Version of `escape_value` for Arrow string arrays, built on Arrow compute
+    functions.
+    """
+    needs_escaping = pc.match_substring_regex(array, problematic_chars_re2)
+    is_negative_number = pc.match_substring_regex(array, negative_number_re2)
+    mask = pc.fill_null(pc.and_not(needs_escaping, is_negative_number), False)
+    if not pc.any(mask).as_py():
+        return array
+
+    escaped = pc.binary_join_element_wise(
+        "'", pc.replace_substring(array, "|", "\\|"), ""
+    )
+    return pc.if_else(mask, escaped, array)
+
+
+def escape_column(column: pd.Series) -> pd.Series:
+    """
+    Escape the strings of a column, with Arrow compute functions when the column is
+    backed by Arrow, and with pandas string methods otherwise.
+    """
+    dtype = column.dtype
+    if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+        array = pd.arrays.ArrowStringArray(escape_arrow_array(pa.array(column.array)))
+        return pd.Series(array, index=column.index, name=column.name)
+    if isinstance(dtype, pd.ArrowDtype) and pa.types.is_string(dtype.pyarrow_dtype):
+        array = pd.arrays.ArrowExtensionArray(
+            escape_arrow_array(pa.array(column.array))
+        )
+        return pd.Series(array, index=column.index, name=column.name)
+    if dtype == np.dtype(object) or isinstance(dtype, pd.StringDtype):
+        try:
+            return escape_values(column)
+        except AttributeError:
+            # the `.str` accessor is only available on columns holding strings
+            return column
+    return column
+
+
 def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
-    escape_values = lambda v: escape_value(v) if isinstance(v, str) else v
+    escape_name = lambda v: escape_value(v) if isinstance(v, str) else v
 
     # Escape csv headers
-    df = df.rename(columns=escape_values)
+    df = df.rename(columns=escape_name)
 
     # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+    for idx, (_, column) in enumerate(df.items()):
+        escaped = escape_column(column)
+        if escaped is not column:
+            df.isetitem(idx, escaped)
 
     return df.to_csv(**kwargs)
 
 
+def df_to_escaped_csv_chunks(
+    dfs: Iterable[pd.DataFrame], **kwargs: Any
+) -> Iterator[str]:
+    """
+    Convert consecutive batches of rows to escaped CSV, one batch at a time. The
+    header is only written for the first batch.
+    """
+    header = kwargs.pop("header", True)
+    for df in dfs:
+        yield df_to_escaped_csv(df, header=header, **kwargs)
+        header = False
+
+
+def join_csv_chunks(data: Union[str, Iterable[str]]) -> str:
+    """
+    Join the chunks of CSV of chart data, which is only streamed lazily to the
+    client as long as it isn't post-processed nor bundled with other results.
+    """
+    return data if isinstance(data, str) else "".join(data)
+
+
+def iter_df_batches(df: pd.DataFrame, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Split a DataFrame into batches of at most `batch_size` rows, each with its own
+    range index.
+    """
+    for start in range(0, max(len(df.index), 1), batch_size):
+        yield df.iloc[start : start + batch_size].reset_index(drop=True)
+
+
 def get_chart_csv_data(
     chart_url: str, auth_cookies: Optional[Dict[str, str]] = None
 ) -> Optional[bytes]:
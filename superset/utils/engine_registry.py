@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from superset.stats_logger import BaseStatsLogger
+
+logger = logging.getLogger(__name__)
+
+# engine parameters that are only understood by queue based pools, and that make
+# ``create_engine`` fail when combined with ``NullPool``
+QUEUE_POOL_PARAMS = ("pool_size", "max_overflow", "pool_timeout", "pool_use_lifo")
+
+
+class EngineKey(NamedTuple):
+    database_id: Optional[int]
+    schema: Optional[str]
+    effective_username: Optional[str]
+    source: Optional[str]
+    # hash of the connection settings (URI, extra, encrypted extra, ...) so that
+    # engines are never reused across configuration changes
+    config_hash: str
+
+
+class EngineRegistry:
+    """
+    A process-wide, size-bounded registry of pooled SQLAlchemy engines.
+
+    Engines are kept in LRU order and disposed when evicted or invalidated. The
+    registry is fork-aware: engines inherited from a parent process are dropped
+    without closing the parent's connections.
+    """
+
+    def __init__(
+        self,
+        max_engines: int = 100,
+        stats_logger: Optional[BaseStatsLogger] = None,
+    ) -> None:
+        self.max_engines = max_engines
+        self.stats_logger = stats_logger
+        self._engines: "OrderedDict[EngineKey, Engine]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def __contains__(self, key: EngineKey) -> bool:
+        return key in self._engines
+
+    def _check_pid(self) -> None:
+        if self._pid != os.getpid():
+            for engine in self._engines.values():
+                engine.dispose(close=False)
+            self._engines.clear()
+            self._pid = os.getpid()
+
+    def get(self, key: EngineKey, factory: Callable[[], Engine]) -> Engine:
+        """
+        Return the engine registered under ``key``, creating it with ``factory``
+        if needed.
+        """
+        with self._lock:
+            self._check_pid()
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                self._incr(key, "hit")
+                return engine
+
+            self._incr(key, "miss")
+            engine = factory()
+            self._register_pool_metrics(key, engine)
+            self._engines[key] = engine
+            while len(self._engines) > self.max_engines:
+                evicted_key, evicted = self._engines.popitem(last=False)
+                self._incr(evicted_key, "evict")
+                evicted.dispose()
+            return engine
+
+    def dispose(self, database_id: Optional[int] = None) -> None:
+        """
+        Dispose engines of a given database, or all of them if no id is given.
+        """
+        with self._lock:
+            for key in list(self._engines):
+                if database_id is None or key.database_id == database_id:
+                    self._engines.pop(key).dispose()
+
+    def _incr(self, key: EngineKey, name: str) -> None:
+        if self.stats_logger:
+            self.stats_logger.incr(f"engine_pool.{key.database_id}.{name}")
+
+    def _register_pool_metrics(self, key: EngineKey, engine: Engine) -> None:
+        if not self.stats_logger:
+            return
+
+        stats_logger = self.stats_logger
+        prefix = f"engine_pool.{key.database_id}"
+
+        def report_size() -> None:
+            checkedout = getattr(engine.pool, "checkedout", None)
+            if callable(checkedout):
+                stats_logger.gauge(f"{prefix}.checkedout", checkedout())
+
+        # pylint: disable=unused-argument
+        def on_connect(*args: Any) -> None:
+            stats_logger.incr(f"{prefix}.connect")
+
+        def on_checkout(*args: Any) -> None:
+            stats_logger.incr(f"{prefix}.checkout")
+            report_size()
+
+        def on_checkin(*args: Any) -> None:
+            report_size()
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
@@ -16,11 +16,16 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import json
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from datetime import datetime, timedelta
@@ -30,6 +35,7 @@ from typing import (
     cast,
     Dict,
     Iterator,
+    List,
     Optional,
     Tuple,
     Type,
@@ -37,7 +43,7 @@ from typing import (
     Union,
 )
 
-from flask import current_app, g, request
+from flask import current_app, Flask, g, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 from typing_extensions import Literal
@@ -373,3 +379,180 @@ class DBEventLogger(AbstractEventLogger):
         except SQLAlchemyError as ex:
             logging.error("DBEventLogger failed to log event(s)")
             logging.exception(ex)
+
+
+class BatchedDBEventLogger(DBEventLogger):
+    """
+    Event logger that commits logs to Superset DB in batches, from a background
+    thread, so that logging events doesn't add a round trip to the metadata
+    database to the requests being logged.
+
+    Logs are held in a bounded queue, and are dropped and counted when it is full
+    or when they can't be written. A batch is written once it holds ``batch_size``
+    logs, or ``flush_interval`` seconds after its first log was queued. On exit,
+    the worker is stopped, waiting up to ``shutdown_timeout`` seconds for the batch
+    it is writing, and the queue is flushed.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        shutdown_timeout: float = 10.0,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.dropped = 0
+        self._app: Optional[Flask] = None
+        self._reset()
+        atexit.register(self.close)
+
+    def _reset(self) -> None:
+        # the queue, the lock and the worker are not inherited by forked processes
+        self._pid = os.getpid()
+        self._queue: queue.Queue[Optional[Dict[str, Any]]] = queue.Queue(
+            self.max_queue_size
+        )
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: Optional[int],
+        action: str,
+        dashboard_id: Optional[int],
+        duration_ms: Optional[int],
+        slice_id: Optional[int],
+        referrer: Optional[str],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        if self._pid != os.getpid():
+            self._reset()
+        self._start_worker()
+
+        dttm = datetime.utcnow()
+        for record in kwargs.get("records", []):
+            json_string: Optional[str]
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            row = {
+                "action": action,
+                "json": json_string,
+                "dashboard_id": dashboard_id,
+                "slice_id": slice_id,
+                "duration_ms": duration_ms,
+                "referrer": referrer,
+                "user_id": user_id,
+                "dttm": dttm,
+            }
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self._drop(1)
+
+    def _start_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                # pylint: disable=protected-access
+                self._app = current_app._get_current_object()  # type: ignore
+                self._thread = threading.Thread(
+                    target=self._run, name="BatchedDBEventLogger", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            row = self._queue.get()
+            if row is None:
+                # woken up to stop
+                continue
+            batch = [row]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if row is None:
+                    break
+                batch.append(row)
+            try:
+                self._write(batch)
+            except Exception:  # pylint: disable=broad-except
+                # keep the worker alive, whatever went wrong writing the batch
+                logger.exception("BatchedDBEventLogger failed to write logs")
+                self._drop(len(batch))
+
+    def close(self) -> None:
+        """
+        Stop the worker and write the logs left in the queue, from the calling
+        thread.
+        """
+        self._stopping.set()
+        if self._thread is not None and self._pid == os.getpid():
+            try:
+                # wake the worker up if it's waiting for logs
+                self._queue.put_nowait(None)
+            except queue.Full:
+                pass
+            self._thread.join(self.shutdown_timeout)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all the queued logs, from the calling thread.
+        """
+        batch: List[Dict[str, Any]] = []
+        while True:
+            try:
+                row = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if row is None:
+                continue
+            batch.append(row)
+            if len(batch) == self.batch_size:
+                self._write(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.models.core import Log
+
+        if self._app is None:
+            logger.warning(
+                "BatchedDBEventLogger dropped %s log(s) queued outside of an app",
+                len(batch),
+            )
+            self._drop(len(batch))
+            return
+        with self._app.app_context():
+            sesh = self._app.appbuilder.get_session  # type: ignore
+            try:
+                sesh.bulk_insert_mappings(Log, batch)
+                sesh.commit()
+            except SQLAlchemyError as ex:
+                sesh.rollback()
+                logging.error("BatchedDBEventLogger failed to log event(s)")
+                logging.exception(ex)
+                self._drop(len(batch))
+
+    def _drop(self, count: int) -> None:
+        with self._lock:
+            self.dropped += count
+        for _ in range(count):
+            self.stats_logger.incr("event_logger.dropped")
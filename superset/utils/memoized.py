@@ -15,10 +15,18 @@
 # specific language governing permissions and limitations
 # under the License.
 import functools
-from typing import Any, Callable, Dict, Optional, Tuple, Type
+import threading
+import weakref
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type
 
+from flask import current_app, has_app_context
 
-class _memoized:
+DEFAULT_MAX_SIZE = 1024
+
+
+class _memoized:  # pylint: disable=too-many-instance-attributes
     """Decorator that caches a function's return value each time it is called
 
     If called later with the same arguments, the cached value is returned, and
@@ -26,32 +34,72 @@ class _memoized:
 
     Define ``watch`` as a tuple of attribute names if this Decorator
     should account for instance variable changes.
+
+    At most ``max_size`` values are kept, the least recently used being evicted
+    first, each for at most ``ttl`` seconds if set. The instances of memoized methods
+    are weakly referenced, their values being evicted once they are garbage
+    collected. Hits, misses and evictions are counted in ``stats``, misses and
+    evictions being also reported to the stats logger as
+    ``memoized.<function>.<event>``, once the lock is released.
     """
 
     def __init__(
-        self, func: Callable[..., Any], watch: Optional[Tuple[str, ...]] = None
+        self,
+        func: Callable[..., Any],
+        watch: Optional[Tuple[str, ...]] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: Optional[float] = None,
     ) -> None:
         self.func = func
-        self.cache: Dict[Any, Any] = {}
+        self.cache: "OrderedDict[Any, Tuple[Any, Optional[float]]]" = OrderedDict()
         self.is_method = False
         self.watch = watch or ()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = {"hit": 0, "miss": 0, "eviction": 0}
+        # the keys of the values memoized for weakly referenced instances
+        self._instance_keys: Dict[int, Set[Any]] = {}
+        self._key_instances: Dict[Any, int] = {}
+        self._lock = threading.RLock()
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        key = [args, frozenset(kwargs.items())]
+        instance_id = self._track_instance(args[0]) if self.is_method and args else None
+        key = [
+            args if instance_id is None else (("instance", instance_id), *args[1:]),
+            frozenset(kwargs.items()),
+        ]
         if self.is_method:
             key.append(tuple(getattr(args[0], v, None) for v in self.watch))
         key = tuple(key)  # type: ignore
-        try:
-            if key in self.cache:
-                return self.cache[key]
-        except TypeError as ex:
-            # Uncachable -- for instance, passing a list as an argument.
-            raise TypeError("Function cannot be memoized") from ex
+        now = monotonic()
+        with self._lock:
+            try:
+                cached = self.cache.get(key)
+            except TypeError as ex:
+                # Uncachable -- for instance, passing a list as an argument.
+                raise TypeError("Function cannot be memoized") from ex
+            evictions = 0
+            if cached is not None:
+                value, expires_at = cached
+                if expires_at is None or expires_at > now:
+                    self.cache.move_to_end(key)
+                    # hits are only counted, as they are the hot path
+                    self.stats["hit"] += 1
+                    return value
+                evictions += self._evict(key)
+            self.stats["miss"] += 1
+        self._report("miss")
+
         value = self.func(*args, **kwargs)
-        try:
-            self.cache[key] = value
-        except TypeError as ex:
-            raise TypeError("Function cannot be memoized") from ex
+        with self._lock:
+            self.cache[key] = (value, None if self.ttl is None else now + self.ttl)
+            self.cache.move_to_end(key)
+            if instance_id in self._instance_keys:
+                self._instance_keys[instance_id].add(key)
+                self._key_instances[key] = instance_id  # type: ignore
+            while len(self.cache) > self.max_size:
+                evictions += self._evict(next(iter(self.cache)))
+        self._report("eviction", evictions)
         return value
 
     def __repr__(self) -> str:
@@ -68,14 +116,60 @@ class _memoized:
         func.__func__ = self.func  # type: ignore
         return func
 
+    def _track_instance(self, instance: Any) -> Optional[int]:
+        """
+        Reference the instance weakly, returning its id, or None when it doesn't
+        support weak references and has to be part of the keys.
+        """
+        instance_id = id(instance)
+        with self._lock:
+            if instance_id not in self._instance_keys:
+                try:
+                    weakref.finalize(instance, self._forget_instance, instance_id)
+                except TypeError:
+                    return None
+                self._instance_keys[instance_id] = set()
+        return instance_id
+
+    def _forget_instance(self, instance_id: int) -> None:
+        evictions = 0
+        with self._lock:
+            for key in list(self._instance_keys.get(instance_id, ())):
+                evictions += self._evict(key)
+            self._instance_keys.pop(instance_id, None)
+        self._report("eviction", evictions)
+
+    def _evict(self, key: Any) -> int:
+        """
+        Evict the value of a key, returning the number of values evicted.
+        """
+        if self.cache.pop(key, None) is None:
+            return 0
+        self.stats["eviction"] += 1
+        instance_id = self._key_instances.pop(key, None)
+        if instance_id is not None:
+            self._instance_keys[instance_id].discard(key)
+        return 1
+
+    def _report(self, event: str, count: int = 1) -> None:
+        if not count or not has_app_context():
+            return
+        stats_logger = current_app.config.get("STATS_LOGGER")
+        if stats_logger:
+            for _ in range(count):
+                stats_logger.incr(f"memoized.{self.func.__qualname__}.{event}")
+
 
 def memoized(
-    func: Optional[Callable[..., Any]] = None, watch: Optional[Tuple[str, ...]] = None
+    func: Optional[Callable[..., Any]] = None,
+    watch: Optional[Tuple[str, ...]] = None,
+    max_size: int = DEFAULT_MAX_SIZE,
+    ttl: Optional[float] = None,
 ) -> Callable[..., Any]:
     if func:
         return _memoized(func)
 
     def wrapper(f: Callable[..., Any]) -> Callable[..., Any]:
-        return _memoized(f, watch)
+        return _memoized(f, watch, max_size, ttl)
 
     return wrapper
@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import logging
 from io import BytesIO
-from typing import Optional, TYPE_CHECKING, Union
+from typing import List, Optional, TYPE_CHECKING, Union
 
 from flask import current_app
 
@@ -76,6 +76,18 @@ class BaseScreenshot:
         self.screenshot = driver.get_screenshot(self.url, self.element, user)
         return self.screenshot
 
+    def get_screenshots(
+        self,
+        user: User,
+        element_names: List[str],
+        window_size: Optional[WindowSize] = None,
+    ) -> List[Optional[bytes]]:
+        """
+        Take screenshots of several elements of the page, loading it once.
+        """
+        driver = self.driver(window_size)
+        return driver.get_screenshots(self.url, element_names, user)
+
     def get(
         self,
         user: User = None,
@@ -214,6 +226,10 @@ class DashboardScreenshot(BaseScreenshot):
     thumbnail_type: str = "dashboard"
     element: str = "grid-container"
 
+    @staticmethod
+    def get_chart_element(chart_id: int) -> str:
+        return f"dashboard-chart-id-{chart_id}"
+
     def __init__(
         self,
         url: str,
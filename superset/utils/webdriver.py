@@ -17,10 +17,14 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import threading
+from contextlib import contextmanager
 from enum import Enum
-from time import sleep
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from time import monotonic, sleep
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 from flask import current_app
 from selenium.common.exceptions import (
@@ -38,6 +42,8 @@ from superset.extensions import machine_auth_provider_factory
 from superset.utils.retries import retry_call
 
 WindowSize = Tuple[int, int]
+# driver type, window size and id of the authenticated user
+PoolKey = Tuple[str, WindowSize, int]
 logger = logging.getLogger(__name__)
 
 
@@ -164,19 +170,44 @@ class WebDriverProxy:
     def get_screenshot(
         self, url: str, element_name: str, user: User
     ) -> Optional[bytes]:
+        return self.get_screenshots(url, [element_name], user)[0]
+
+    def get_screenshots(
+        self, url: str, element_names: List[str], user: User
+    ) -> List[Optional[bytes]]:
+        """
+        Take screenshots of several elements of a page, loading it once.
+        """
+        pool = get_webdriver_pool()
+        if pool and user:
+            with pool.driver(self, user) as driver:
+                return self._take_screenshots(driver, url, element_names, user)
+
         driver = self.auth(user)
+        try:
+            return self._take_screenshots(driver, url, element_names, user)
+        finally:
+            self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
+
+    def _take_screenshots(
+        self, driver: WebDriver, url: str, element_names: List[str], user: User
+    ) -> List[Optional[bytes]]:
         driver.set_window_size(*self._window)
         driver.get(url)
-        img: Optional[bytes] = None
+        imgs: List[Optional[bytes]] = [None] * len(element_names)
         selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
         logger.debug("Sleeping for %i seconds", selenium_headstart)
         sleep(selenium_headstart)
 
         try:
-            logger.debug("Wait for the presence of %s", element_name)
-            element = WebDriverWait(driver, self._screenshot_locate_wait).until(
-                EC.presence_of_element_located((By.CLASS_NAME, element_name))
-            )
+            elements = []
+            for element_name in element_names:
+                logger.debug("Wait for the presence of %s", element_name)
+                elements.append(
+                    WebDriverWait(driver, self._screenshot_locate_wait).until(
+                        EC.presence_of_element_located((By.CLASS_NAME, element_name))
+                    )
+                )
             logger.debug("Wait for .loading to be done")
             WebDriverWait(driver, self._screenshot_load_wait).until_not(
                 EC.presence_of_all_elements_located((By.CLASS_NAME, "loading"))
@@ -193,7 +224,8 @@ class WebDriverProxy:
             logger.debug("Wait %i seconds for chart animation", selenium_animation_wait)
             sleep(selenium_animation_wait)
             logger.info(
-                "Taking a PNG screenshot of url %s as user %s",
+                "Taking %i PNG screenshot(s) of url %s as user %s",
+                len(elements),
                 url,
                 user.username,
             )
@@ -208,7 +240,8 @@ class WebDriverProxy:
                         unexpected_errors,
                     )
 
-            img = element.screenshot_as_png
+            for idx, element in enumerate(elements):
+                imgs[idx] = element.screenshot_as_png
 
         except TimeoutException:
             logger.warning("Selenium timed out requesting url %s", url, exc_info=True)
@@ -220,6 +253,138 @@ class WebDriverProxy:
             )
         except WebDriverException as ex:
             logger.error(ex, exc_info=True)
-        finally:
-            self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
-        return img
+        return imgs
+
+
+class PooledWebDriver:  # pylint: disable=too-few-public-methods
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.uses = 0
+        self.last_used = monotonic()
+
+
+class WebDriverPool:
+    """
+    Pool of warm, authenticated drivers, reused across the screenshots taken by a
+    worker process. Drivers are keyed by driver type, window size and user, checked
+    to be responsive before being reused, and destroyed after ``max_uses``
+    screenshots or when they have been idle for ``idle_timeout`` seconds. At most
+    ``max_size`` idle drivers are kept.
+    """
+
+    def __init__(self, max_size: int = 4, max_uses: int = 50, idle_timeout: int = 300):
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[PoolKey, List[PooledWebDriver]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(proxy: WebDriverProxy, user: User) -> PoolKey:
+        # pylint: disable=protected-access
+        return proxy._driver_type, proxy._window, user.id
+
+    @contextmanager
+    def driver(self, proxy: WebDriverProxy, user: User) -> Iterator[WebDriver]:
+        """
+        Borrow a driver authenticated as a user, creating one if none is idle.
+        """
+        key = self.get_key(proxy, user)
+        pooled = self._acquire(key)
+        if pooled is None:
+            pooled = PooledWebDriver(proxy.auth(user))
+
+        try:
+            yield pooled.driver
+        except Exception:
+            WebDriverProxy.destroy(pooled.driver)
+            raise
+        pooled.uses += 1
+        pooled.last_used = monotonic()
+        self._release(key, pooled)
+
+    def _acquire(self, key: PoolKey) -> Optional[PooledWebDriver]:
+        self.evict_idle()
+        while True:
+            with self._lock:
+                drivers = self._idle.get(key)
+                if not drivers:
+                    return None
+                pooled = drivers.pop()
+            if self.is_healthy(pooled.driver):
+                return pooled
+            WebDriverProxy.destroy(pooled.driver)
+
+    def _release(self, key: PoolKey, pooled: PooledWebDriver) -> None:
+        with self._lock:
+            size = sum(len(drivers) for drivers in self._idle.values())
+            if pooled.uses < self.max_uses and size < self.max_size:
+                self._idle.setdefault(key, []).append(pooled)
+                return
+        WebDriverProxy.destroy(pooled.driver)
+
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        try:
+            return bool(driver.window_handles)
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    def evict_idle(self) -> None:
+        """
+        Destroy the drivers that have been idle for longer than the idle timeout.
+        """
+        now = monotonic()
+        expired: List[PooledWebDriver] = []
+        with self._lock:
+            for key, drivers in list(self._idle.items()):
+                expired.extend(
+                    pooled
+                    for pooled in drivers
+                    if now - pooled.last_used > self.idle_timeout
+                )
+                self._idle[key] = [
+                    pooled
+                    for pooled in drivers
+                    if now - pooled.last_used <= self.idle_timeout
+                ]
+        for pooled in expired:
+            WebDriverProxy.destroy(pooled.driver)
+
+    def close(self) -> None:
+        """
+        Destroy all the idle drivers.
+        """
+        with self._lock:
+            drivers = [pooled for idle in self._idle.values() for pooled in idle]
+            self._idle.clear()
+        for pooled in drivers:
+            WebDriverProxy.destroy(pooled.driver)
+
+
+_pool: Optional[WebDriverPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_webdriver_pool() -> Optional[WebDriverPool]:
+    """
+    Return the pool of drivers of the current process, when `WEBDRIVER_POOL` is
+    enabled. Drivers are never shared with forked processes.
+    """
+    global _pool, _pool_pid  # pylint: disable=global-statement
+
+    config = current_app.config["WEBDRIVER_POOL"]
+    if not config.get("enabled"):
+        return None
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = WebDriverPool(
+                max_size=config.get("max_size", 4),
+                max_uses=config.get("max_uses", 50),
+                idle_timeout=config.get("idle_timeout", 300),
+            )
+            _pool_pid = os.getpid()
+            atexit.register(_pool.close)
+        return _pool
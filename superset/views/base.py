@@ -19,8 +19,9 @@ import functools
 import logging
 import os
 import traceback
+import zlib
 from datetime import datetime
-from typing import Any, Callable, cast, Dict, List, Optional, Union
+from typing import Any, Callable, cast, Dict, Iterable, Iterator, List, Optional, Union
 
 import simplejson as json
 import yaml
@@ -34,6 +35,7 @@ from flask import (
     Response,
     send_file,
     session,
+    stream_with_context,
 )
 from flask_appbuilder import BaseView, Model, ModelView
 from flask_appbuilder.actions import action
@@ -98,6 +100,7 @@ FRONTEND_CONF_KEYS = (
     "DISPLAY_MAX_ROW",
     "GLOBAL_ASYNC_QUERIES_TRANSPORT",
     "GLOBAL_ASYNC_QUERIES_POLLING_DELAY",
+    "GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT",
     "SQL_VALIDATORS_BY_ENGINE",
     "SQLALCHEMY_DOCS_URL",
     "SQLALCHEMY_DISPLAY_TEXT",
@@ -690,6 +693,31 @@ class CsvResponse(Response):
     default_mimetype = "text/csv"
 
 
+def stream_csv_response(
+    chunks: Iterable[str], headers: Optional[Dict[str, Any]] = None
+) -> CsvResponse:
+    """
+    Stream chunks of CSV to the client as they are produced, gzip encoded when
+    `CSV_EXPORT_GZIP` is enabled and the client accepts it.
+    """
+    if not (conf["CSV_EXPORT_GZIP"] and "gzip" in request.accept_encodings):
+        return CsvResponse(stream_with_context(chunks), headers=headers)
+
+    def compress() -> Iterator[bytes]:
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            if data := compressor.compress(chunk.encode(CsvResponse.charset)):
+                yield data
+        yield compressor.flush()
+
+    response = CsvResponse(
+        stream_with_context(compress()), headers=headers, direct_passthrough=True
+    )
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
 def bind_field(
     _: Any, form: DynamicForm, unbound_field: UnboundField, options: Dict[Any, Any]
 ) -> Field:
@@ -17,16 +17,16 @@
 # pylint: disable=too-many-lines, invalid-name
 from __future__ import annotations
 
+import itertools
 import logging
 import re
 from contextlib import closing
 from datetime import datetime, timedelta
-from typing import Any, Callable, cast, Dict, List, Optional, Union
+from typing import Any, Callable, cast, Dict, Iterator, List, Optional, Union
 from urllib import parse
 
 import backoff
 import humanize
-import pandas as pd
 import simplejson as json
 from flask import abort, flash, g, redirect, render_template, request, Response
 from flask_appbuilder import expose
@@ -117,6 +117,7 @@ from superset.sqllab.exceptions import (
 from superset.sqllab.execution_context_convertor import ExecutionContextConvertor
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.query_render import SqlQueryRenderImpl
+from superset.sqllab.results_format import decompress_results
 from superset.sqllab.sql_json_executer import (
     ASynchronousSqlJsonExecutor,
     SqlJsonExecutor,
@@ -152,11 +153,13 @@ from superset.views.base import (
     json_error_response,
     json_errors_response,
     json_success,
+    stream_csv_response,
     validate_sqlatable,
 )
 from superset.views.sql_lab.schemas import SqlJsonPayloadSchema
 from superset.views.utils import (
     _deserialize_results_payload,
+    _iter_results_payload_dfs,
     bootstrap_user_data,
     check_datasource_perms,
     check_explore_cache_perms,
@@ -2183,7 +2186,8 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
         """Serves a key off of the results backend
 
         It is possible to pass the `rows` query argument to limit the number
-        of rows returned.
+        of rows returned, and the `offset` query argument to skip rows, in order to
+        page through the results without decoding them whole.
         """
         if not results_backend:
             raise SupersetErrorException(
@@ -2242,10 +2246,32 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
                 status=403,
             ) from ex
 
-        payload = utils.zlib_decompress(blob, decode=not results_backend_use_msgpack)
+        rows = None
+        offset = 0
+        try:
+            if "rows" in request.args:
+                rows = int(request.args["rows"])
+            if "offset" in request.args:
+                offset = int(request.args["offset"])
+            if (rows is not None and rows < 0) or offset < 0:
+                raise ValueError("Negative rows or offset")
+        except ValueError as ex:
+            raise SupersetErrorException(
+                SupersetError(
+                    message=__(
+                        "The provided `rows` and `offset` arguments must be "
+                        "non-negative integers."
+                    ),
+                    error_type=SupersetErrorType.INVALID_PAYLOAD_SCHEMA_ERROR,
+                    level=ErrorLevel.ERROR,
+                ),
+                status=400,
+            ) from ex
+
+        payload = decompress_results(blob, cast(bool, results_backend_use_msgpack))
         try:
             obj = _deserialize_results_payload(
-                payload, query, cast(bool, results_backend_use_msgpack)
+                payload, query, cast(bool, results_backend_use_msgpack), rows, offset
             )
         except SerializationError as ex:
             raise SupersetErrorException(
@@ -2261,22 +2287,10 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
                 status=404,
             ) from ex
 
-        if "rows" in request.args:
-            try:
-                rows = int(request.args["rows"])
-            except ValueError as ex:
-                raise SupersetErrorException(
-                    SupersetError(
-                        message=__(
-                            "The provided `rows` argument is not a valid integer."
-                        ),
-                        error_type=SupersetErrorType.INVALID_PAYLOAD_SCHEMA_ERROR,
-                        level=ErrorLevel.ERROR,
-                    ),
-                    status=400,
-                ) from ex
-
-            obj = apply_display_max_row_configuration_if_require(obj, rows)
+        if rows is not None:
+            obj = apply_display_max_row_configuration_if_require(obj, rows, offset)
+        if offset:
+            obj["offset"] = offset
 
         return json_success(
             json.dumps(
@@ -2488,20 +2502,10 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
             blob = results_backend.get(query.results_key)
         if blob:
             logger.info("Decompressing")
-            payload = utils.zlib_decompress(
-                blob, decode=not results_backend_use_msgpack
-            )
-            obj = _deserialize_results_payload(
+            payload = decompress_results(blob, cast(bool, results_backend_use_msgpack))
+            dfs = _iter_results_payload_dfs(
                 payload, query, cast(bool, results_backend_use_msgpack)
             )
-
-            df = pd.DataFrame(
-                data=obj["data"],
-                dtype=object,
-                columns=[c["name"] for c in obj["columns"]],
-            )
-
-            logger.info("Using pandas to convert to CSV")
         else:
             logger.info("Running a query to turn into CSV")
             if query.select_sql:
@@ -2517,27 +2521,46 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
             }:
                 # remove extra row from `increased_limit`
                 limit -= 1
-            df = query.database.get_df(sql, query.schema)[:limit]
+            dfs = query.database.get_df_batches(
+                sql,
+                query.schema,
+                limit=limit,
+                batch_size=config["CSV_EXPORT_BATCH_SIZE"],
+            )
+
+        # read the first batch before streaming the response, so that errors running
+        # the query or reading the results are not raised in the middle of it
+        first_df = next(dfs)
+
+        def generate_csv() -> Iterator[str]:
+            logger.info("Using pandas to convert to CSV")
+            row_count = 0
+            header = True
+            for df in itertools.chain([first_df], dfs):
+                row_count += len(df.index)
+                yield csv.df_to_escaped_csv(
+                    df, index=False, header=header, **config["CSV_EXPORT"]
+                )
+                header = False
+
+            event_info = {
+                "event_type": "data_export",
+                "client_id": client_id,
+                "row_count": row_count,
+                "database": query.database.name,
+                "schema": query.schema,
+                "sql": query.sql,
+                "exported_format": "csv",
+            }
+            event_rep = repr(event_info)
+            logger.debug(
+                "CSV exported: %s", event_rep, extra={"superset_event": event_info}
+            )
 
-        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
         quoted_csv_name = parse.quote(query.name)
-        response = CsvResponse(
-            csv_data, headers=generate_download_headers("csv", quoted_csv_name)
-        )
-        event_info = {
-            "event_type": "data_export",
-            "client_id": client_id,
-            "row_count": len(df.index),
-            "database": query.database.name,
-            "schema": query.schema,
-            "sql": query.sql,
-            "exported_format": "csv",
-        }
-        event_rep = repr(event_info)
-        logger.debug(
-            "CSV exported: %s", event_rep, extra={"superset_event": event_info}
+        return stream_csv_response(
+            generate_csv(), headers=generate_download_headers("csv", quoted_csv_name)
         )
-        return response
 
     @api
     @handle_api_exception
@@ -17,10 +17,22 @@
 import logging
 from collections import defaultdict
 from functools import wraps
-from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    cast,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib import parse
 
 import msgpack
+import pandas as pd
 import pyarrow as pa
 import simplejson as json
 from flask import g, has_request_context, request
@@ -46,6 +58,13 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.result_chunks import iter_chunks, read_chunks
+from superset.sqllab.results_format import (
+    deserialize_results,
+    is_serialized_results,
+    iter_table_batches,
+    split_results,
+)
 from superset.superset_typing import FormData
 from superset.utils.core import DatasourceType
 from superset.utils.decorators import stats_timing
@@ -551,10 +570,42 @@ def check_slice_perms(_self: Any, slice_id: int) -> None:
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    rows: Optional[int] = None,
+    offset: int = 0,
 ) -> Dict[str, Any]:
+    """
+    Deserialize results read from the results backend.
+
+    :param payload: The decompressed results
+    :param query: The query that produced the results
+    :param use_msgpack: Whether results were serialized with msgpack and Arrow
+    :param rows: If set, only read ``rows`` rows
+    :param offset: The number of rows to skip, only decoding the ones that are read
+        when results are stored in the Arrow IPC format
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
-    if use_msgpack:
+    end = None if rows is None else offset + rows
+    if not use_msgpack:
+        with stats_timing(
+            "sqllab.query.results_backend_json_deserialize", stats_logger
+        ):
+            ds_payload = json.loads(payload)
+        if ds_payload.get("data") and (offset or rows is not None):
+            ds_payload["data"] = ds_payload["data"][offset:end]
+        return ds_payload
+
+    if is_serialized_results(payload):
+        with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
+            ds_payload, pa_table = deserialize_results(
+                cast(bytes, payload), offset=offset, limit=rows
+            )
+            if ds_payload.get("chunks") is not None:
+                pa_table = read_chunks(ds_payload.pop("chunks"), offset, rows)
+    else:
+        # results stored before the Arrow IPC format was introduced
         with stats_timing(
             "sqllab.query.results_backend_msgpack_deserialize", stats_logger
         ):
@@ -565,22 +616,67 @@ def _deserialize_results_payload(
                 pa_table = pa.deserialize(ds_payload["data"])
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
+            pa_table = pa_table.slice(offset, rows)
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
+    df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
+    ds_payload["data"] = dataframe.df_to_records(df) or []
 
-        db_engine_spec = query.database.db_engine_spec
-        all_columns, data, expanded_columns = db_engine_spec.expand_data(
-            ds_payload["selected_columns"], ds_payload["data"]
-        )
-        ds_payload.update(
-            {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+    db_engine_spec = query.database.db_engine_spec
+    all_columns, data, expanded_columns = db_engine_spec.expand_data(
+        ds_payload["selected_columns"], ds_payload["data"]
+    )
+    ds_payload.update(
+        {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+    )
+
+    return ds_payload
+
+
+def _iter_results_payload_dfs(
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    Deserialize results read from the results backend into DataFrames, one record
+    batch at a time when results are stored in the Arrow IPC format.
+
+    :param payload: The decompressed results
+    :param query: The query that produced the results
+    :param use_msgpack: Whether results were serialized with msgpack and Arrow
+    """
+    if not use_msgpack or not is_serialized_results(payload):
+        obj = _deserialize_results_payload(payload, query, use_msgpack)
+        yield pd.DataFrame(
+            data=obj["data"],
+            dtype=object,
+            columns=[c["name"] for c in obj["columns"]],
         )
+        return
 
-        return ds_payload
+    ds_payload, data = split_results(cast(bytes, payload))
+    if ds_payload.get("chunks") is not None:
+        tables = iter_chunks(ds_payload["chunks"])
+    else:
+        tables = iter_table_batches(data) if data is not None else iter([])
+
+    db_engine_spec = query.database.db_engine_spec
+    selected_columns = ds_payload["selected_columns"]
+    # the nested fields are expanded from the types of the selected columns, so
+    # every batch is laid out with the columns expanded from the whole result
+    all_columns = db_engine_spec.expand_data(selected_columns, [])[0]
+    columns = [c["name"] for c in all_columns]
+    empty = True
+    for pa_table in tables:
+        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
+        _all_columns, records, _expanded_columns = db_engine_spec.expand_data(
+            selected_columns, dataframe.df_to_records(df) or []
+        )
+        empty = False
+        yield pd.DataFrame(data=records, dtype=object).reindex(columns=columns)
 
-    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+    if empty:
+        yield pd.DataFrame(dtype=object, columns=columns)
 
 
 def get_cta_schema_name(
@@ -593,6 +689,7 @@ def get_cta_schema_name(
         return None
     return func(database, user, schema, sql)
 
+
 def get_all_users():
     users = db.session.query(security_manager.user_model).all()
     return users
@@ -89,6 +89,7 @@ from superset.utils.core import (
     get_metric_names,
     is_adhoc_column,
     JS_MAX_INTEGER,
+    memoize_datasource_queries,
     merge_extra_filters,
     QueryMode,
     simple_filter_to_adhoc,
@@ -516,6 +517,7 @@ class BaseViz:  # pylint: disable=too-many-public-methods
             payload["colnames"] = list(df.columns)
         return payload
 
+    @memoize_datasource_queries()
     def get_df_payload(  # pylint: disable=too-many-statements
         self, query_obj: Optional[QueryObjectDict] = None, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -106,6 +106,26 @@ class TestAsyncEventApi(SupersetTestCase):
         }
         self.assertEqual(response, expected)
 
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_events_long_polling(self, mock_uuid4):
+        async_query_manager.init_app(app)
+        self.login(username="admin")
+        with mock.patch.dict(
+            app.config, {"GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT": 5000}
+        ), mock.patch.object(async_query_manager._redis, "xread") as mock_xread:
+            mock_xread.return_value = []
+            rv = self.client.get(
+                "api/v1/async_event/?last_id=1607471525180-0&timeout=10000"
+            )
+            response = json.loads(rv.data.decode("utf-8"))
+
+        assert rv.status_code == 200
+        channel_id = app.config["GLOBAL_ASYNC_QUERIES_REDIS_STREAM_PREFIX"] + self.UUID
+        mock_xread.assert_called_with(
+            {channel_id: "1607471525180-0"}, count=100, block=5000
+        )
+        self.assertEqual(response, {"result": []})
+
     def test_events_no_login(self):
         async_query_manager.init_app(app)
         rv = self.fetch_events()
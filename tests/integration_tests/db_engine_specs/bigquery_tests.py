@@ -22,7 +22,6 @@ from pandas import DataFrame
 from sqlalchemy import column
 
 from superset.connectors.sqla.models import TableColumn
-from superset.db_engine_specs.base import BaseEngineSpec
 from superset.db_engine_specs.bigquery import BigQueryEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.sql_parse import Table
@@ -118,14 +117,15 @@ class TestBigQueryDbEngineSpec(TestDbEngineSpec):
             def values(self):
                 return self._value
 
+        cursor = mock.MagicMock()
         data1 = [(1, "foo")]
-        with mock.patch.object(BaseEngineSpec, "fetch_data", return_value=data1):
-            result = BigQueryEngineSpec.fetch_data(None, 0)
+        cursor.fetchall.return_value = data1
+        result = BigQueryEngineSpec.fetch_data(cursor, 0)
         self.assertEqual(result, data1)
 
         data2 = [Row(1), Row(2)]
-        with mock.patch.object(BaseEngineSpec, "fetch_data", return_value=data2):
-            result = BigQueryEngineSpec.fetch_data(None, 0)
+        cursor.fetchall.return_value = data2
+        result = BigQueryEngineSpec.fetch_data(cursor, 0)
         self.assertEqual(result, [1, 2])
 
     def test_extra_table_metadata(self):
@@ -403,3 +403,12 @@ def test__latest_partition_from_df():
         ["ds=01-01-19/hour=1", "ds=01-03-19/hour=1", "ds=01-02-19/hour=2"],
         ["01-03-19", "1"],
     )
+
+
+@mock.patch("superset.db_engine_specs.base.BaseEngineSpec.fetch_data_in_batches")
+def test_fetch_data_in_batches_programming_error(fetch_data_in_batches_mock):
+    from pyhive.exc import ProgrammingError
+
+    fetch_data_in_batches_mock.side_effect = ProgrammingError
+    cursor = mock.Mock()
+    assert list(HiveEngineSpec.fetch_data_in_batches(cursor)) == []
@@ -14,16 +14,20 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import copy
 import re
+import threading
 import time
 from typing import Any, Dict
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 import pytest
+import sqlalchemy as sa
 from pandas import DateOffset
 
-from superset import db
+from superset import app, db
 from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
@@ -306,6 +310,39 @@ class TestQueryContext(SupersetTestCase):
         self.assertIn("name,sum__num\n", data)
         self.assertEqual(len(data.split("\n")), 12)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_concurrent_queries(self):
+        """
+        Ensure that queries running concurrently return the same results as when
+        run serially, the datasource never being loaded from the worker threads
+        """
+        self.login(username="admin")
+        payload = get_query_context("birth_names")
+        payload["force"] = True
+        payload["queries"].append({**payload["queries"][0], "row_limit": 5})
+        serial = ChartDataQueryContextSchema().load(copy.deepcopy(payload))
+        serial_responses = serial.get_payload()
+
+        session = db.session()
+        thread_ids = set()
+
+        def record_thread(orm_execute_state: Any) -> None:
+            thread_ids.add(threading.get_ident())
+
+        query_context = ChartDataQueryContextSchema().load(payload)
+        session.expire_all()
+        sa.event.listen(session, "do_orm_execute", record_thread)
+        try:
+            with mock.patch.dict(app.config, {"CHART_DATA_QUERY_CONCURRENCY": 2}):
+                responses = query_context.get_payload()
+        finally:
+            sa.event.remove(session, "do_orm_execute", record_thread)
+
+        assert thread_ids <= {threading.get_ident()}
+        assert [query["data"] for query in responses["queries"]] == [
+            query["data"] for query in serial_responses["queries"]
+        ]
+
     def test_sql_injection_via_groupby(self):
         """
         Ensure that calling invalid columns names in groupby are caught
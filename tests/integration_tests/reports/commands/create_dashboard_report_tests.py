@@ -89,3 +89,30 @@ def test_raise_exception_for_invalid_tab_ids(tabbed_dashboard: Dashboard) -> Non
             }
         ).run()
     assert "Invalid tab ids" in str(exc_info.value.normalized_messages())
+
+
+@pytest.mark.usefixtures("login_as_admin")
+def test_raise_exception_for_invalid_screenshot_tabs_and_charts(
+    tabbed_dashboard: Dashboard,
+) -> None:
+    with pytest.raises(ReportScheduleInvalidError) as exc_info:
+        CreateReportScheduleCommand(
+            {
+                **DASHBOARD_REPORT_SCHEDULE_DEFAULTS,
+                "name": "tabbed dashboard report (invalid screenshot tabs)",
+                "dashboard": tabbed_dashboard.id,
+                "extra": {"tabs": ["TAB-L1AA", "TAB-INVALID_ID"]},
+            }
+        ).run()
+    assert "Invalid tab ids" in str(exc_info.value.normalized_messages())
+
+    with pytest.raises(ReportScheduleInvalidError) as exc_info:
+        CreateReportScheduleCommand(
+            {
+                **DASHBOARD_REPORT_SCHEDULE_DEFAULTS,
+                "name": "tabbed dashboard report (invalid screenshot charts)",
+                "dashboard": tabbed_dashboard.id,
+                "extra": {"charts": [-1]},
+            }
+        ).run()
+    assert "Invalid chart ids" in str(exc_info.value.normalized_messages())
@@ -14,12 +14,15 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import json
 from datetime import datetime
+from typing import Any
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 from flask import current_app
 
+from superset import db
 from superset.dashboards.permalink.commands.create import (
     CreateDashboardPermalinkCommand,
 )
@@ -111,3 +114,68 @@ def test_report_with_header_data(
         assert header_data.get("notification_source") == ReportSourceFormat.DASHBOARD
         assert header_data.get("notification_type") == report_schedule.type
         assert len(send_email_smtp_mock.call_args.kwargs["header_data"]) == 6
+
+
+@patch("superset.reports.notifications.email.send_email_smtp")
+@patch(
+    "superset.reports.commands.execute.DashboardScreenshot",
+)
+@patch(
+    "superset.dashboards.permalink.commands.create.CreateDashboardPermalinkCommand.run"
+)
+def test_report_for_dashboard_charts_in_tabs(
+    create_dashboard_permalink_mock: MagicMock,
+    dashboard_screenshot_mock: MagicMock,
+    send_email_smtp_mock: MagicMock,
+    tabbed_dashboard: Dashboard,
+) -> None:
+    """
+    Each chart of a report is only captured from the tab containing it
+    """
+    create_dashboard_permalink_mock.side_effect = ["permalink-a", "permalink-b"]
+    screenshots = {}
+
+    def create_screenshot(url: str, *args: Any, **kwargs: Any) -> MagicMock:
+        screenshots[url] = MagicMock()
+        screenshots[url].get_screenshots.return_value = [b"test-image"]
+        return screenshots[url]
+
+    dashboard_screenshot_mock.side_effect = create_screenshot
+    dashboard_screenshot_mock.get_chart_element.side_effect = (
+        lambda chart_id: f"chart-{chart_id}"
+    )
+    current_app.config["ALERT_REPORTS_NOTIFICATION_DRY_RUN"] = False
+
+    position_json = json.loads(tabbed_dashboard.position_json)
+    for chart_id, tab in ((101, "TAB-L1AA"), (102, "TAB-L1AB")):
+        position_json[f"CHART-{chart_id}"] = {
+            "children": [],
+            "id": f"CHART-{chart_id}",
+            "meta": {"chartId": chart_id},
+            "type": "CHART",
+        }
+        position_json[tab]["children"] = [f"CHART-{chart_id}"]
+    tabbed_dashboard.position_json = json.dumps(position_json)
+    db.session.commit()
+
+    with create_dashboard_report(
+        dashboard=tabbed_dashboard,
+        extra={},
+        name="test report tabbed dashboard charts",
+    ) as report_schedule:
+        report_schedule.set_extra_json_key("tabs", ["TAB-L1AA", "TAB-L1AB"])
+        report_schedule.set_extra_json_key("charts", [102, 101])
+        db.session.commit()
+        AsyncExecuteReportScheduleCommand(
+            str(uuid4()), report_schedule.id, datetime.utcnow()
+        ).run()
+
+        elements = {
+            url.split("/")[-2]: screenshot.get_screenshots.call_args.args[1]
+            for url, screenshot in screenshots.items()
+        }
+        assert elements == {
+            "permalink-a": ["chart-101"],
+            "permalink-b": ["chart-102"],
+        }
+        assert len(send_email_smtp_mock.call_args.kwargs["images"]) == 2
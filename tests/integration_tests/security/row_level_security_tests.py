@@ -20,7 +20,7 @@ from typing import Any, Dict, List, Optional
 from unittest import mock
 
 import pytest
-from flask import g
+from flask import current_app, g
 
 from superset import db, security_manager
 from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
@@ -28,6 +28,7 @@ from superset.security.guest_token import (
     GuestTokenResourceType,
     GuestUser,
 )
+from superset.security.manager import RLS_FILTERS_VERSION_CACHE_KEY
 from ..base_tests import SupersetTestCase
 from tests.integration_tests.fixtures.birth_names_dashboard import (
     load_birth_names_dashboard_with_slices,
@@ -303,6 +304,50 @@ class TestRowLevelSecurity(SupersetTestCase):
         assert not self.NAMES_Q_REGEX.search(sql)
         assert not self.BASE_FILTER_REGEX.search(sql)
 
+    @pytest.mark.usefixtures("load_energy_table_with_slice")
+    def test_rls_filters_resolved_once_per_request(self):
+        g.user = self.get_user(username="alpha")
+        tbl = self.get_table(name="energy_usage")
+        with mock.patch.object(
+            security_manager,
+            "_get_rls_filters",
+            wraps=security_manager._get_rls_filters,
+        ) as get_rls_filters:
+            assert security_manager.get_rls_ids(tbl) == [self.rls_entry1.id]
+            assert security_manager.get_rls_cache_key(tbl) == [
+                str(self.rls_entry1.id)
+            ]
+            get_rls_filters.assert_called_once()
+
+            # changing a filter invalidates the filters resolved so far
+            self.rls_entry1.clause = "value > 2"
+            db.session.commit()
+            filters = security_manager.get_rls_filters(tbl)
+            assert [filter_.clause for filter_ in filters] == ["value > 2"]
+            assert get_rls_filters.call_count == 2
+
+    @pytest.mark.usefixtures("load_energy_table_with_slice")
+    def test_rls_filters_cache_version_bumped_on_commit(self):
+        with mock.patch.dict(current_app.config, {"RLS_FILTERS_CACHE_TIMEOUT": 60}):
+            version = security_manager._get_cache_version(
+                RLS_FILTERS_VERSION_CACHE_KEY
+            )
+
+            # the filters read by other requests until the change is committed
+            # are cached under the previous version
+            self.rls_entry1.clause = "value > 3"
+            db.session.flush()
+            assert (
+                security_manager._get_cache_version(RLS_FILTERS_VERSION_CACHE_KEY)
+                == version
+            )
+
+            db.session.commit()
+            assert (
+                security_manager._get_cache_version(RLS_FILTERS_VERSION_CACHE_KEY)
+                != version
+            )
+
 
 RLS_ALICE_REGEX = re.compile(r"name = 'Alice'")
 RLS_GENDER_REGEX = re.compile(r"AND \(gender = 'girl'\)")
@@ -27,7 +27,7 @@ import jwt
 import prison
 import pytest
 
-from flask import current_app
+from flask import current_app, g
 from flask_appbuilder.security.sqla.models import Role
 from superset.datasource.dao import DatasourceDAO
 from superset.models.dashboard import Dashboard
@@ -37,6 +37,7 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetSecurityException
 from superset.models.core import Database
 from superset.models.slice import Slice
+from superset.security.manager import PERMISSIONS_VERSION_CACHE_KEY
 from superset.sql_parse import Table
 from superset.utils.core import (
     DatasourceType,
@@ -1733,6 +1734,62 @@ class TestSecurityManager(SupersetTestCase):
         roles = security_manager.get_user_roles()
         self.assertEqual([security_manager.get_public_role()], roles)
 
+    @patch.dict(app.config, {"PERMISSIONS_CACHE": True})
+    def test_can_access_permissions_cache(self):
+        gamma = security_manager.find_role("Gamma")
+        view_menu_name = "[examples].[permissions_cache]"
+        with self.client.application.test_request_context(), patch.object(
+            security_manager,
+            "_get_roles_permissions",
+            wraps=security_manager._get_roles_permissions,
+        ) as get_roles_permissions:
+            g.user = security_manager.find_user("gamma")
+            assert not security_manager.can_access("schema_access", view_menu_name)
+            assert security_manager.can_access("can_read", "Dashboard")
+            get_roles_permissions.assert_called_once()
+
+            # granting a permission to a role invalidates the permissions resolved
+            pvm = security_manager.add_permission_view_menu(
+                "schema_access", view_menu_name
+            )
+            security_manager.add_permission_role(gamma, pvm)
+            assert security_manager.can_access("schema_access", view_menu_name)
+            assert get_roles_permissions.call_count == 2
+
+            security_manager.del_permission_role(gamma, pvm)
+            assert not security_manager.can_access("schema_access", view_menu_name)
+            security_manager.del_permission_view_menu("schema_access", view_menu_name)
+
+    @patch.dict(
+        app.config, {"PERMISSIONS_CACHE": True, "PERMISSIONS_CACHE_TIMEOUT": 60}
+    )
+    def test_permissions_cache_version_bumped_on_commit(self):
+        gamma = security_manager.find_role("Gamma")
+        pvm = security_manager.add_permission_view_menu(
+            "schema_access", "[examples].[permissions_cache_version]"
+        )
+        version = security_manager._get_cache_version(PERMISSIONS_VERSION_CACHE_KEY)
+
+        # the permissions read by other requests until the change is committed are
+        # cached under the previous version
+        gamma.permissions.append(pvm)
+        db.session.flush()
+        assert (
+            security_manager._get_cache_version(PERMISSIONS_VERSION_CACHE_KEY)
+            == version
+        )
+
+        db.session.commit()
+        assert (
+            security_manager._get_cache_version(PERMISSIONS_VERSION_CACHE_KEY)
+            != version
+        )
+
+        security_manager.del_permission_role(gamma, pvm)
+        security_manager.del_permission_view_menu(
+            "schema_access", "[examples].[permissions_cache_version]"
+        )
+
 
 class TestAccessRequestEndpoints(SupersetTestCase):
     def test_access_request_disabled(self):
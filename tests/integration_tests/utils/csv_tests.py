@@ -81,3 +81,95 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_to_escaped_csv_chunks():
+    df = pd.DataFrame({"a": ["=x", "y", "z"], "b": [1, 2, 3]})
+
+    batches = list(csv.iter_df_batches(df, 2))
+    assert [len(batch.index) for batch in batches] == [2, 1]
+    assert list(batches[1].index) == [0]
+
+    chunks = list(csv.df_to_escaped_csv_chunks(batches, index=False))
+    assert chunks == ["a,b\n'=x,1\ny,2\n", "z,3\n"]
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False)
+
+    # an empty DataFrame still yields its header
+    empty_df = df.iloc[:0]
+    chunks = list(
+        csv.df_to_escaped_csv_chunks(csv.iter_df_batches(empty_df, 2), index=False)
+    )
+    assert chunks == ["a,b\n"]
+
+
+ESCAPING_VALUES = [
+    "value",
+    "-10",
+    "-1.5\n",
+    "@value",
+    "+value",
+    "-value",
+    "=value",
+    "|value",
+    "%value",
+    "=cmd|' /C calc'!A0",
+    '""=10+2',
+    '"=10+2',
+    " =10+2",
+    "\u3000=10+2",
+    "\xa0 @a",
+    "\t\n+1",
+    "a=b",
+    "",
+]
+
+
+def escape_if_str(value):
+    return csv.escape_value(value) if isinstance(value, str) else value
+
+
+def test_escape_values():
+    values = [*ESCAPING_VALUES, None, 1, 1.5, b"=value"]
+    series = pd.Series(values, index=list(range(len(values)))[::-1], dtype=object)
+
+    result = csv.escape_values(series)
+
+    expected = [escape_if_str(value) for value in values]
+    assert result.tolist() == expected
+    assert list(result.index) == list(series.index)
+    assert result.dtype == object
+
+    series = pd.Series(ESCAPING_VALUES, dtype="string")
+    result = csv.escape_values(series)
+    assert result.tolist() == [csv.escape_value(value) for value in ESCAPING_VALUES]
+    assert result.dtype == "string"
+
+
+def test_escape_arrow_array():
+    array = pa.array([*ESCAPING_VALUES, None])
+
+    result = csv.escape_arrow_array(array)
+
+    expected = [csv.escape_value(value) for value in ESCAPING_VALUES]
+    assert result.to_pylist() == [*expected, None]
+
+    chunked_array = pa.chunked_array([ESCAPING_VALUES[:5], ESCAPING_VALUES[5:]])
+    assert csv.escape_arrow_array(chunked_array).to_pylist() == expected
+
+
+def test_df_to_escaped_csv_column_types():
+    df = pd.DataFrame(
+        {
+            "object": pd.Series(["=a", "b"], dtype=object),
+            "string": pd.Series(["=a", "b"], dtype="string"),
+            "arrow": pd.Series(["=a", "b"], dtype="string[pyarrow]"),
+            "numbers": pd.Series([-1, 2], dtype=object),
+        },
+        index=[10, 20],
+    )
+
+    assert csv.df_to_escaped_csv(df, index=False) == (
+        "object,string,arrow,numbers\n'=a,'=a,'=a,-1\nb,b,b,2\n"
+    )
+    # the original DataFrame is left untouched
+    assert df["object"].tolist() == ["=a", "b"]
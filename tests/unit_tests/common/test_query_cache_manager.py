@@ -0,0 +1,156 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument, redefined-outer-name
+import threading
+from typing import Any
+
+import pytest
+from cachelib import SimpleCache
+from pandas import DataFrame
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture, app_context: None) -> Any:
+    from superset.common.utils import query_cache_manager
+    from superset.constants import CacheRegion
+
+    cache = SimpleCache()
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: cache})
+    mocker.patch.dict(
+        query_cache_manager.config,
+        {
+            "DATA_CACHE_SINGLE_FLIGHT": True,
+            "DATA_CACHE_LOCK_TIMEOUT": 10,
+            "DATA_CACHE_LOCK_WAIT_TIMEOUT": 1,
+            "DATA_CACHE_LOCK_POLL_INTERVAL": 0.01,
+        },
+    )
+    return cache
+
+
+def test_single_flight_disabled(mocker: MockerFixture, cache: Any) -> None:
+    """
+    Test that no lock is taken when single-flight is disabled.
+    """
+    from superset.common.utils import query_cache_manager
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    mocker.patch.dict(query_cache_manager.config, {"DATA_CACHE_SINGLE_FLIGHT": False})
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as should_query:
+        assert should_query
+        assert not cache.has("key-lock")
+
+
+def test_single_flight_acquire(cache: Any) -> None:
+    """
+    Test that the lock is held while the value is computed, and released after.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as should_query:
+        assert should_query
+        assert cache.has("key-lock")
+    assert not cache.has("key-lock")
+
+
+def test_single_flight_coalesced(cache: Any) -> None:
+    """
+    Test that a request waits for the value cached by the lock holder.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    cache.add("key-lock", "other")
+    timer = threading.Timer(0.05, lambda: cache.set("key", {"df": None}))
+    timer.start()
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as should_query:
+        assert not should_query
+    timer.join()
+
+    # the lock of the other request is left untouched
+    assert cache.get("key-lock") == "other"
+
+
+def test_single_flight_timeout(mocker: MockerFixture, cache: Any) -> None:
+    """
+    Test that a request runs the query itself when the lock is never released.
+    """
+    from superset.common.utils import query_cache_manager
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    stats_logger = mocker.patch.object(query_cache_manager, "stats_logger")
+    mocker.patch.dict(query_cache_manager.config, {"DATA_CACHE_LOCK_WAIT_TIMEOUT": 0})
+
+    cache.add("key-lock", "other")
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as should_query:
+        assert should_query
+    assert cache.get("key-lock") == "other"
+    stats_logger.incr.assert_called_with("single_flight.timeout")
+
+
+def test_get_stale(mocker: MockerFixture, cache: Any) -> None:
+    """
+    Test that entries past their cache timeout are served as stale.
+    """
+    from superset.common.utils import query_cache_manager
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    mocker.patch.object(
+        query_cache_manager,
+        "set_and_log_cache",
+        lambda cache_instance, key, value, timeout, *args: cache_instance.set(
+            key, {**value, "dttm": None}, timeout=timeout
+        ),
+    )
+    time = mocker.patch.object(query_cache_manager, "time")
+    time.time.return_value = 1000
+    query_result = mocker.MagicMock(status="success", df=DataFrame({"a": [1]}))
+
+    QueryCacheManager().set_query_result(
+        key="key",
+        query_result=query_result,
+        timeout=60,
+        region=CacheRegion.DATA,
+        stale_timeout=600,
+    )
+    assert cache.get("key")["expires"] == 1060
+
+    assert not QueryCacheManager.get("key", CacheRegion.DATA).is_stale
+    time.time.return_value = 1061
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    assert query_cache.is_loaded
+    assert query_cache.is_stale
+
+
+def test_claim_refresh(cache: Any) -> None:
+    """
+    Test that the refresh of a stale entry is only claimed once.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    assert QueryCacheManager.claim_refresh("key", CacheRegion.DATA, 1060)
+    assert not QueryCacheManager.claim_refresh("key", CacheRegion.DATA, 1060)
+    assert not QueryCacheManager.claim_refresh(None, CacheRegion.DATA, 1060)
+
+    # once refreshed, the entry expires later and its refresh can be claimed again
+    assert QueryCacheManager.claim_refresh("key", CacheRegion.DATA, 2060)
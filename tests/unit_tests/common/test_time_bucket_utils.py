@@ -0,0 +1,100 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+
+from superset.common.utils.time_bucket_utils import (
+    get_orderby_labels,
+    get_time_buckets,
+    is_aligned_bucket_size,
+    split_df_by_time_buckets,
+    TimeBucket,
+)
+
+DAY = timedelta(days=1)
+
+
+def test_get_time_buckets_aligned():
+    assert get_time_buckets(
+        datetime(2022, 1, 1), datetime(2022, 1, 4), DAY, datetime(2022, 1, 3, 12)
+    ) == [
+        TimeBucket(datetime(2022, 1, 1), datetime(2022, 1, 2), True),
+        TimeBucket(datetime(2022, 1, 2), datetime(2022, 1, 3), True),
+        # the current bucket is not complete yet
+        TimeBucket(datetime(2022, 1, 3), datetime(2022, 1, 4), False),
+    ]
+
+
+def test_get_time_buckets_unaligned():
+    assert get_time_buckets(
+        datetime(2022, 1, 1, 6), datetime(2022, 1, 3, 6), DAY, datetime(2023, 1, 1)
+    ) == [
+        TimeBucket(datetime(2022, 1, 1, 6), datetime(2022, 1, 2), False),
+        TimeBucket(datetime(2022, 1, 2), datetime(2022, 1, 3), True),
+        TimeBucket(datetime(2022, 1, 3), datetime(2022, 1, 3, 6), False),
+    ]
+
+
+def test_is_aligned_bucket_size():
+    assert is_aligned_bucket_size("PT1H", DAY)
+    assert is_aligned_bucket_size("P1D", timedelta(weeks=1))
+    assert not is_aligned_bucket_size("PT6H", timedelta(hours=9))
+    # weeks, months and years aren't aligned to the epoch
+    assert not is_aligned_bucket_size("P1W", timedelta(weeks=1))
+    assert not is_aligned_bucket_size("P1M", timedelta(days=30))
+    assert not is_aligned_bucket_size("P1Y", timedelta(days=365))
+    assert not is_aligned_bucket_size(None, DAY)
+
+
+def test_split_df_by_time_buckets():
+    buckets = get_time_buckets(
+        datetime(2022, 1, 1), datetime(2022, 1, 4), DAY, datetime(2023, 1, 1)
+    )
+    df = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(["2022-01-03", "2022-01-01", "2022-01-01 12:00"]),
+            "value": [3, 1, 2],
+        }
+    )
+    dfs = split_df_by_time_buckets(df, "ds", buckets)
+    assert [df["value"].tolist() for df in dfs] == [[1, 2], [], [3]]
+    assert list(dfs[1].columns) == ["ds", "value"]
+
+
+def test_split_df_by_time_buckets_not_datetime():
+    buckets = get_time_buckets(
+        datetime(2022, 1, 1), datetime(2022, 1, 3), DAY, datetime(2023, 1, 1)
+    )
+    df = pd.DataFrame({"ds": [1641024000000], "value": [1]})
+    assert split_df_by_time_buckets(df, "ds", buckets) is None
+
+
+def test_get_orderby_labels():
+    query_object = SimpleNamespace(
+        orderby=[
+            ("sum__num", False),
+            ({"expressionType": "SQL", "sqlExpression": "MAX(num)"}, True),
+            ({"label": "decade", "sqlExpression": "year / 10"}, True),
+        ]
+    )
+    assert get_orderby_labels(query_object) == [  # type: ignore
+        ("sum__num", False),
+        ("MAX(num)", True),
+        ("decade", True),
+    ]
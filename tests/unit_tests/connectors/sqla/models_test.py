@@ -0,0 +1,71 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+
+import pandas as pd
+from pytest_mock import MockerFixture
+from sqlalchemy import literal_column, select
+
+
+def test_memoize_datasource_queries(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the query of a query object is built and compiled once within a
+    ``memoize_datasource_queries`` block, for its cache key and its execution.
+    """
+    from superset.connectors.sqla.models import SqlaQuery, SqlaTable
+    from superset.models.core import Database
+    from superset.utils.core import memoize_datasource_queries
+
+    get_sqla_query = mocker.patch.object(
+        SqlaTable,
+        "get_sqla_query",
+        return_value=SqlaQuery(
+            applied_template_filters=[],
+            cte=None,
+            extra_cache_keys=["admin"],
+            labels_expected=["count"],
+            prequeries=[],
+            sqla_query=select([literal_column("COUNT(*)").label("count")]),
+        ),
+    )
+    compile_sqla_query = mocker.patch.object(
+        Database, "compile_sqla_query", return_value="SELECT COUNT(*) AS count"
+    )
+    mocker.patch.object(Database, "get_df", return_value=pd.DataFrame({"count": [1]}))
+    mocker.patch.object(SqlaTable, "has_extra_cache_key_calls", return_value=True)
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    table = SqlaTable(id=1, table_name="my_table", database=database)
+    query_obj = {"metrics": ["count"], "columns": [], "is_timeseries": False}
+
+    with memoize_datasource_queries():
+        assert "admin" in table.get_extra_cache_keys(query_obj)
+        query_str_ext = table.get_query_str_extended(query_obj)
+        assert query_str_ext.sql.strip() == "SELECT COUNT(*) AS count"
+        assert table.query(query_obj).df["count"].tolist() == [1]
+        assert get_sqla_query.call_count == 1
+        assert compile_sqla_query.call_count == 1
+
+        # a different query object is built on its own
+        table.query({**query_obj, "row_limit": 10})
+        assert get_sqla_query.call_count == 2
+        assert compile_sqla_query.call_count == 2
+
+    # the queries are built again outside of the block
+    table.query(query_obj)
+    assert get_sqla_query.call_count == 3
+    assert compile_sqla_query.call_count == 3
@@ -0,0 +1,221 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import json
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import text
+
+from superset.connectors.sqla.rollups import (
+    find_rollup,
+    get_rollups,
+    is_dttm_aligned,
+    is_grain_covered,
+)
+
+EXTRA = {
+    "rollups": [
+        {
+            "table_name": "sales_daily",
+            "time_grain": "P1D",
+            "columns": ["ds", "country", "product"],
+            "metrics": {"count": "SUM(cnt)", "sum__revenue": "SUM(revenue)"},
+            "row_count": 100000,
+        },
+        {
+            "table_name": "sales_daily_country",
+            "schema": "rollups",
+            "time_grain": "P1D",
+            "columns": ["ds", "country"],
+            "metrics": {"count": "SUM(cnt)"},
+            "row_count": 1000,
+        },
+    ]
+}
+
+
+def test_is_grain_covered() -> None:
+    """
+    Test which time grains can be derived from the grain of a rollup.
+    """
+    assert is_grain_covered("P1D", "P1D")
+    assert is_grain_covered("P1D", "P1W")
+    assert is_grain_covered("P1D", "P1Y")
+    assert is_grain_covered("PT1H", "P1D")
+    assert is_grain_covered("P1M", "P3M")
+    assert not is_grain_covered("P1D", "PT1H")
+    assert not is_grain_covered("P1D", None)
+    assert not is_grain_covered("P1W", "P1M")
+    assert not is_grain_covered("P3M", "P1M")
+
+
+def test_is_dttm_aligned() -> None:
+    """
+    Test that time bounds must fall on bucket boundaries of the rollup.
+    """
+    assert is_dttm_aligned(None, "P1D")
+    assert is_dttm_aligned(datetime(2022, 1, 2), "P1D")
+    assert not is_dttm_aligned(datetime(2022, 1, 2, 12), "P1D")
+    assert is_dttm_aligned(datetime(2022, 4, 1), "P3M")
+    assert not is_dttm_aligned(datetime(2022, 2, 1), "P3M")
+
+
+def test_find_rollup_smallest() -> None:
+    """
+    Test that the smallest covering rollup is chosen.
+    """
+    rollups = get_rollups(EXTRA)
+    rollup = find_rollup(
+        rollups,
+        columns={"ds", "country"},
+        metrics={"count"},
+        time_grains=["P1W"],
+        time_bounds=[datetime(2022, 1, 1), datetime(2022, 2, 1)],
+    )
+    assert rollup is not None
+    assert rollup.full_name == "rollups.sales_daily_country"
+
+    rollup = find_rollup(
+        rollups,
+        columns={"ds", "product"},
+        metrics={"count", "sum__revenue"},
+        time_grains=["P1D"],
+        time_bounds=[],
+    )
+    assert rollup is not None
+    assert rollup.full_name == "sales_daily"
+
+
+def test_find_rollup_not_covered() -> None:
+    """
+    Test that queries not covered by any rollup hit the dataset.
+    """
+    rollups = get_rollups(EXTRA)
+    assert not find_rollup(rollups, {"ds", "city"}, {"count"}, ["P1D"], [])
+    assert not find_rollup(rollups, {"ds"}, {"count_distinct__user"}, ["P1D"], [])
+    assert not find_rollup(rollups, {"ds"}, {"count"}, ["PT1H"], [])
+    assert not find_rollup(
+        rollups, {"ds"}, {"count"}, ["P1D"], [datetime(2022, 1, 1, 6)]
+    )
+    assert get_rollups({}) == []
+
+
+@pytest.fixture
+def dataset(app_context: None, mocker: MockerFixture) -> Any:
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+
+    mocker.patch.object(SqlaTable, "get_sqla_row_level_filters", return_value=[])
+    return SqlaTable(
+        table_name="sales",
+        columns=[
+            TableColumn(column_name="ds", is_dttm=1, type="TIMESTAMP"),
+            TableColumn(column_name="country", type="VARCHAR"),
+            TableColumn(column_name="product", type="VARCHAR"),
+            TableColumn(column_name="revenue", type="INTEGER"),
+            TableColumn(
+                column_name="margin", type="INTEGER", expression="revenue - cost"
+            ),
+        ],
+        metrics=[
+            SqlMetric(metric_name="count", expression="COUNT(*)"),
+            SqlMetric(metric_name="sum__revenue", expression="SUM(revenue)"),
+        ],
+        main_dttm_col="ds",
+        database=Database(database_name="my_database", sqlalchemy_uri="sqlite://"),
+        extra=json.dumps(
+            {
+                "rollups": [
+                    {
+                        "table_name": "sales_daily",
+                        "time_grain": "P1D",
+                        "columns": ["ds", "country", "product", "margin"],
+                        "metrics": {"count": "SUM(cnt)"},
+                    }
+                ]
+            }
+        ),
+    )
+
+
+def get_query_obj(
+    columns: List[Any], filters: List[Any], extras: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "columns": columns,
+        "metrics": ["count"],
+        "filter": filters,
+        "extras": extras,
+        "is_timeseries": False,
+        "row_limit": 100,
+    }
+
+
+def test_get_query_str_rollup(dataset: Any) -> None:
+    """
+    Test that a query covered by a rollup is sent to the rollup table.
+    """
+    sql = dataset.get_query_str(get_query_obj(["country"], [], {}))
+    assert "FROM sales_daily" in sql
+    assert "SUM(cnt)" in sql
+
+    sql = dataset.get_query_str(
+        get_query_obj(
+            ["country"], [{"col": "product", "op": "==", "val": "phone"}], {}
+        )
+    )
+    assert "FROM sales_daily" in sql
+
+
+def test_get_query_str_rollup_not_covered(
+    dataset: Any, mocker: MockerFixture
+) -> None:
+    """
+    Test that calculated columns, adhoc filters and row level security filters
+    keep the query on the dataset.
+    """
+    queries = [
+        get_query_obj(["margin"], [], {}),
+        get_query_obj(["country"], [{"col": "margin", "op": ">", "val": 0}], {}),
+        get_query_obj(["country"], [], {"where": "revenue > 0"}),
+        get_query_obj(
+            ["country"],
+            [
+                {
+                    "col": {"label": "upper", "sqlExpression": "UPPER(country)"},
+                    "op": "==",
+                    "val": "US",
+                }
+            ],
+            {},
+        ),
+    ]
+    for query_obj in queries:
+        sql = dataset.get_query_str(query_obj)
+        assert "sales_daily" not in sql
+        assert "FROM sales" in sql
+
+    mocker.patch.object(
+        type(dataset),
+        "get_sqla_row_level_filters",
+        return_value=[text("country = 'US'")],
+    )
+    sql = dataset.get_query_str(get_query_obj(["country"], [], {}))
+    assert "sales_daily" not in sql
+    assert "country = 'US'" in sql
@@ -105,3 +105,82 @@ def test_max_pandas_timestamp(input_, expected) -> None:
     df = results.to_pandas_df()
 
     assert df_to_records(df) == expected
+
+
+def test_df_to_columnar() -> None:
+    """
+    Test that DataFrames are converted to columns of values, with temporal columns
+    in milliseconds since the epoch.
+    """
+    import pandas as pd
+
+    from superset.dataframe import columnar_to_df, df_to_columnar
+
+    df = pd.DataFrame(
+        {
+            "a": ["a1", None],
+            "b": [1.5, float("nan")],
+            "c": pd.to_datetime(["1970-01-02", None]),
+            "d": pd.to_datetime(["1970-01-02", "1970-01-03"]).tz_localize("US/Eastern"),
+        }
+    )
+
+    columnar = df_to_columnar(df)
+
+    assert columnar["columns"] == ["a", "b", "c", "d"]
+    assert columnar["data"]["a"] == ["a1", None]
+    assert columnar["data"]["b"][0] == 1.5
+    assert pd.isna(columnar["data"]["b"][1])
+    assert columnar["data"]["c"][0] == 86400000.0
+    assert pd.isna(columnar["data"]["c"][1])
+    assert columnar["data"]["d"] == [86400000.0, 172800000.0]
+    assert columnar_to_df(columnar).columns.tolist() == ["a", "b", "c", "d"]
+
+
+def test_df_to_arrow_ipc() -> None:
+    """
+    Test that DataFrames round-trip through the Arrow IPC stream format, with mixed
+    object columns converted to strings.
+    """
+    import pandas as pd
+
+    from superset.dataframe import arrow_ipc_to_df, df_to_arrow_ipc
+
+    df = pd.DataFrame({"a": ["a1", "a2"], "b": [1, 2], "c": [1, "c2"]})
+
+    result = arrow_ipc_to_df(df_to_arrow_ipc(df))
+
+    assert result.to_dict(orient="records") == [
+        {"a": "a1", "b": 1, "c": "1"},
+        {"a": "a2", "b": 2, "c": "c2"},
+    ]
+
+
+def test_set_arrow_ipc_metadata() -> None:
+    """
+    Test that metadata is attached to the schema of an Arrow IPC stream, leaving
+    its data untouched.
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    from superset.dataframe import (
+        arrow_ipc_to_df,
+        df_to_arrow_ipc,
+        set_arrow_ipc_metadata,
+    )
+
+    df = pd.DataFrame({"a": ["a1", "a2"], "b": [1, 2]})
+
+    data = set_arrow_ipc_metadata(
+        df_to_arrow_ipc(df), {"colnames": ["a", "b"], "rowcount": 2, "rollup": None}
+    )
+
+    assert pa.ipc.open_stream(data).schema.metadata == {
+        b"colnames": b'["a", "b"]',
+        b"rowcount": b"2",
+        b"rollup": b"null",
+    }
+    assert arrow_ipc_to_df(data).to_dict(orient="records") == df.to_dict(
+        orient="records"
+    )
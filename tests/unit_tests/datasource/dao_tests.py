@@ -210,3 +210,47 @@ def test_not_found_datasource(session_with_data: Session) -> None:
             datasource_id=500000,
             session=session_with_data,
         )
+
+
+def test_get_datasources(session_with_data: Session) -> None:
+    from sqlalchemy.orm.attributes import instance_state
+
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.dao.exceptions import DatasourceTypeNotSupportedError
+    from superset.datasource.dao import DatasourceDAO
+
+    session_with_data.expunge_all()
+    result = DatasourceDAO.get_datasources(
+        datasource_type=DatasourceType.TABLE,
+        datasource_ids=[1, 500000],
+        session=session_with_data,
+    )
+
+    assert len(result) == 1
+    assert isinstance(result[0], SqlaTable)
+    unloaded = instance_state(result[0]).unloaded
+    assert {"columns", "metrics", "owners", "database"} <= unloaded
+
+    session_with_data.expunge_all()
+    result = DatasourceDAO.get_datasources(
+        datasource_type=DatasourceType.TABLE,
+        datasource_ids=[1, 500000],
+        session=session_with_data,
+        eager=True,
+    )
+
+    assert len(result) == 1
+    unloaded = instance_state(result[0]).unloaded
+    assert not {"columns", "metrics", "owners", "database"} & unloaded
+    assert [column.column_name for column in result[0].columns] == ["a"]
+
+    assert (
+        DatasourceDAO.get_datasources(
+            datasource_type="table", datasource_ids=[], session=session_with_data
+        )
+        == []
+    )
+    with pytest.raises(DatasourceTypeNotSupportedError):
+        DatasourceDAO.get_datasources(
+            datasource_type="foo", datasource_ids=[1], session=session_with_data
+        )
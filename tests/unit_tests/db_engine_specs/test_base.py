@@ -19,6 +19,7 @@
 from textwrap import dedent
 
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy.types import TypeEngine
 
 
@@ -99,3 +100,80 @@ def test_cte_query_parsing(original: TypeEngine, expected: str) -> None:
 
     actual = BaseEngineSpec.get_cte_query(original)
     assert actual == expected
+
+
+def test_fetch_data_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched as Arrow tables when the driver supports it.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ArrowEngineSpec(BaseEngineSpec):
+        arrow_fetch_method = "fetch_arrow_table"
+
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_table.return_value = pa.table({"a": [1, 2, 3]})
+
+    assert ArrowEngineSpec.fetch_data(cursor).num_rows == 3
+    assert ArrowEngineSpec.fetch_data(cursor, limit=2).num_rows == 2
+    cursor.fetchall.assert_not_called()
+
+
+def test_fetch_data_in_batches(mocker: MockerFixture) -> None:
+    """
+    Test fetching results in batches, up to the limit.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = [(i,) for i in range(5)]
+    cursor = mocker.MagicMock()
+    cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in rows[:size]]
+
+    batches = list(BaseEngineSpec.fetch_data_in_batches(cursor, 3, batch_size=2))
+    assert batches == [[(0,), (1,)], [(2,)]]
+
+    batches = list(BaseEngineSpec.fetch_data_in_batches(cursor, None, batch_size=2))
+    assert batches == [[(3,), (4,)]]
+
+    cursor.description = None
+    assert list(BaseEngineSpec.fetch_data_in_batches(cursor)) == []
+
+
+def test_fetch_data_in_batches_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that batches are sliced from the Arrow table when the driver supports it.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ArrowEngineSpec(BaseEngineSpec):
+        arrow_fetch_method = "fetch_arrow_table"
+
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_table.return_value = pa.table({"a": [1, 2, 3, 4, 5]})
+
+    batches = list(ArrowEngineSpec.fetch_data_in_batches(cursor, 3, batch_size=2))
+    assert [batch.column("a").to_pylist() for batch in batches] == [[1, 2], [3]]
+    cursor.fetchmany.assert_not_called()
+
+
+def test_fetch_data_in_batches_processes_rows(mocker: MockerFixture) -> None:
+    """
+    Test that each batch goes through the `process_fetched_rows` hook.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ListEngineSpec(BaseEngineSpec):
+        @classmethod
+        def process_fetched_rows(cls, cursor, rows):  # type: ignore
+            return [tuple(row) for row in rows]
+
+    cursor = mocker.MagicMock()
+    cursor.fetchmany.side_effect = [[[1, "a"]], []]
+    cursor.fetchall.return_value = [[2, "b"]]
+
+    assert list(ListEngineSpec.fetch_data_in_batches(cursor)) == [[(1, "a")]]
+    assert ListEngineSpec.fetch_data(cursor) == [(2, "b")]
@@ -156,7 +156,6 @@ def test_extract_error_message() -> None:
 
 
 def test_fetch_data() -> None:
-    from superset.db_engine_specs.base import BaseEngineSpec
     from superset.db_engine_specs.mssql import MssqlEngineSpec
 
     with mock.patch.object(
@@ -165,10 +164,24 @@ def test_fetch_data() -> None:
         return_value="converted",
     ) as mock_pyodbc_rows_to_tuples:
         data = [(1, "foo")]
-        with mock.patch.object(BaseEngineSpec, "fetch_data", return_value=data):
-            result = MssqlEngineSpec.fetch_data(None, 0)
-            mock_pyodbc_rows_to_tuples.assert_called_once_with(data)
-            assert result == "converted"
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = data
+        result = MssqlEngineSpec.fetch_data(cursor, 0)
+        mock_pyodbc_rows_to_tuples.assert_called_once_with(data)
+        assert result == "converted"
+
+
+def test_fetch_data_in_batches() -> None:
+    from superset.db_engine_specs.mssql import MssqlEngineSpec
+
+    class Row(tuple):
+        pass
+
+    cursor = mock.MagicMock()
+    cursor.fetchmany.side_effect = [[Row((1, "foo"))], []]
+    batches = list(MssqlEngineSpec.fetch_data_in_batches(cursor))
+    assert batches == [[(1, "foo")]]
+    assert type(batches[0][0]) is tuple
 
 
 @pytest.mark.parametrize(
@@ -19,6 +19,8 @@ from typing import Optional
 
 import pytest
 import pytz
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
 
 
 @pytest.mark.parametrize(
@@ -52,3 +54,41 @@ def test_convert_dttm(
 
     for case in (str.lower, str.upper):
         assert PrestoEngineSpec.convert_dttm(case(target_type), dttm) == result
+
+
+def test_latest_partition_cache(mocker: MockerFixture, app_context: None) -> None:
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+    from superset.exceptions import SupersetTemplateException
+
+    mocker.patch.object(PrestoEngineSpec, "has_partition_cache", return_value=True)
+    cache_manager = mocker.patch("superset.db_engine_specs.presto.cache_manager")
+    cache_manager.partition_cache = SimpleCache()
+    time = mocker.patch("superset.db_engine_specs.presto.time")
+    refresh_partition = mocker.patch("superset.tasks.partitions.refresh_partition")
+    get_latest_partition = mocker.patch.object(
+        PrestoEngineSpec,
+        "_get_latest_partition",
+        side_effect=[(["ds", "hour"], ["2022-01-01", "23"])],
+    )
+    database = mocker.MagicMock(id=1)
+
+    time.time.return_value = 0
+    assert PrestoEngineSpec.latest_partition(
+        "table", "schema", database, show_first=True
+    ) == (["ds", "hour"], ["2022-01-01", "23"])
+    get_latest_partition.assert_called_once_with("table", "schema", database)
+
+    # the cached partitions are checked against the arguments of the call
+    with pytest.raises(SupersetTemplateException, match="single partitioned field"):
+        PrestoEngineSpec.latest_partition("table", "schema", database)
+
+    # stale partitions are served while being refreshed, once
+    time.time.return_value = 3600
+    for _ in range(2):
+        assert PrestoEngineSpec.latest_partition(
+            "table", "schema", database, show_first=True
+        ) == (["ds", "hour"], ["2022-01-01", "23"])
+    assert get_latest_partition.call_count == 1
+    refresh_partition.delay.assert_called_once_with(
+        "latest_partition", 1, "table", "schema", {}
+    )
@@ -22,7 +22,7 @@ import pytest
 from pytest_mock import MockFixture
 
 from superset.datasets.commands.exceptions import DatasetNotFoundError
-from superset.jinja_context import dataset_macro, where_in
+from superset.jinja_context import dataset_macro, TemplateCache, where_in
 
 
 def test_where_in() -> None:
@@ -34,6 +34,62 @@ def test_where_in() -> None:
     assert where_in(["O'Malley's"]) == "('O''Malley''s')"
 
 
+def test_template_cache(mocker: MockFixture) -> None:
+    """
+    Test that ``TemplateCache`` compiles each template once per engine.
+    """
+    stats_logger = mocker.MagicMock()
+    cache = TemplateCache(max_size=2, stats_logger=stats_logger)
+
+    template = cache.get_template(None, "SELECT {{ 1 + 1 }}")
+    assert template.render() == "SELECT 2"
+    assert cache.get_template(None, "SELECT {{ 1 + 1 }}") is template
+    assert cache.get_template("presto", "SELECT {{ 1 + 1 }}") is not template
+    assert cache.get_environment(None) is cache.get_environment(None)
+    assert cache.get_environment(None) is not cache.get_environment("presto")
+    assert cache.get_template(None, "{{ [1, 2]|where_in }}").render() == "(1, 2)"
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+    assert cache.hit_rate == 0.25
+    stats_logger.incr.assert_any_call("jinja_template_cache.hit")
+    stats_logger.incr.assert_any_call("jinja_template_cache.evict")
+
+    # the least recently used template was evicted
+    assert cache.get_template(None, "SELECT {{ 1 + 1 }}") is not template
+
+
+def test_get_template_cache(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the template cache of the app honours ``JINJA_TEMPLATE_CACHE_SIZE``,
+    and that it is skipped by processors replacing their environment.
+    """
+    # pylint: disable=import-outside-toplevel, protected-access
+    from flask import current_app
+
+    from superset.jinja_context import (
+        create_environment,
+        get_template_cache,
+        JinjaTemplateProcessor,
+    )
+
+    mocker.patch.dict(current_app.config, {"JINJA_TEMPLATE_CACHE_SIZE": 0})
+    assert get_template_cache() is None
+
+    mocker.patch.dict(current_app.config, {"JINJA_TEMPLATE_CACHE_SIZE": 10})
+    cache = get_template_cache()
+    assert cache is not None
+    assert cache.max_size == 10
+    assert get_template_cache() is cache
+
+    processor = JinjaTemplateProcessor(database=mocker.MagicMock())
+    assert processor.get_template("SELECT 1") is processor.get_template("SELECT 1")
+    assert len(cache) == 1
+
+    processor._env = create_environment()
+    template = processor.get_template("SELECT 2")
+    assert template.environment is processor._env
+    assert len(cache) == 1
+
+
 def test_dataset_macro(mocker: MockFixture) -> None:
     """
     Test the ``dataset_macro`` macro.
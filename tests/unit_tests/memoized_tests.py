@@ -15,6 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import gc
+from unittest.mock import patch
+
 from pytest import mark
 
 from superset.utils.memoized import memoized
@@ -94,3 +97,60 @@ class TestMemoized:
         result8 = instance.test_method(1, 2, 3)
         assert instance.watcher == 4
         assert result1 == result8
+
+    def test_memoized_max_size(self):
+        @memoized(max_size=2)
+        def test_function(a):
+            return object()
+
+        result1 = test_function(1)
+        test_function(2)
+        assert test_function(1) is result1
+        test_function(3)
+        assert test_function(1) is result1
+        assert len(test_function.cache) == 2
+        assert test_function.stats == {"hit": 2, "miss": 3, "eviction": 1}
+
+    def test_memoized_ttl(self):
+        @memoized(ttl=60)
+        def test_function(a):
+            return object()
+
+        with patch("superset.utils.memoized.monotonic", return_value=0):
+            result1 = test_function(1)
+            assert test_function(1) is result1
+        with patch("superset.utils.memoized.monotonic", return_value=61):
+            assert test_function(1) is not result1
+
+    def test_memoized_on_methods_weak_instances(self):
+        class test_class:
+            @memoized
+            def test_method(self, a):
+                return a
+
+        memoized_method = test_class.__dict__["test_method"]
+        instance = test_class()
+        assert instance.test_method(1) == 1
+        assert len(memoized_method.cache) == 1
+        del instance
+        gc.collect()
+        assert len(memoized_method.cache) == 0
+
+    def test_memoized_stats_logger(self):
+        @memoized(max_size=1)
+        def test_function(a):
+            return a
+
+        with patch(
+            "superset.utils.memoized.has_app_context", return_value=True
+        ), patch("superset.utils.memoized.current_app") as current_app:
+            stats_logger = current_app.config.get.return_value
+            test_function(1)
+            test_function(1)
+            test_function(2)
+
+        assert test_function.stats == {"hit": 1, "miss": 2, "eviction": 1}
+        # hits are not reported
+        assert [
+            key.rsplit(".", 1)[-1] for (key,), _ in stats_logger.incr.call_args_list
+        ] == ["miss", "miss", "eviction"]
@@ -145,3 +145,37 @@ def test_get_db_engine_spec(mocker: MockFixture) -> None:
         ).db_engine_spec
         == OldDBEngineSpec
     )
+
+
+def test_get_sqla_engine_pooling(mocker: MockFixture) -> None:
+    """
+    Test that engines are cached and pooled when ``DATABASE_ENGINE_POOLING`` is on.
+    """
+    from sqlalchemy.pool import NullPool
+
+    from superset.models.core import Database
+
+    database = Database(
+        id=1,
+        database_name="my_database",
+        sqlalchemy_uri="sqlite://",
+        extra='{"engine_params": {"pool_size": 5}}',
+    )
+    engine_registry = mocker.patch("superset.models.core.engine_registry")
+    engine_registry.get.side_effect = lambda key, factory: factory()
+
+    # pool only settings are dropped when using a ``NullPool``
+    engine = database._get_sqla_engine()
+    assert isinstance(engine.pool, NullPool)
+    engine_registry.get.assert_not_called()
+
+    mocker.patch.dict("superset.models.core.config", {"DATABASE_ENGINE_POOLING": True})
+    engine = database._get_sqla_engine(schema="main")
+    assert not isinstance(engine.pool, NullPool)
+    key = engine_registry.get.call_args[0][0]
+    assert key.database_id == 1
+    assert key.schema == "main"
+    assert key.config_hash == database.engine_config_hash
+
+    database.extra = '{"engine_params": {"pool_size": 10}}'
+    assert key.config_hash != database.engine_config_hash
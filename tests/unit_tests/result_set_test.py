@@ -106,3 +106,40 @@ def test_stringify_with_null_integers():
     )
 
     assert np.array_equal(result_set, expected)
+
+
+def test_mixed_type_column_is_stringified() -> None:
+    """
+    Test that only the columns Arrow can't convert are serialized as strings.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = [(1, "a"), (2, {"b": 1}), (3, None)]
+    description = [("id",), ("value",)]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "id": [1, 2, 3],
+        "value": ['"a"', '{"b": 1}', None],
+    }
+
+
+def test_arrow_table() -> None:
+    """
+    Test building a result set from an Arrow table returned by the driver.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    table = pa.table({"id": [1, 2], "tags": [["a"], ["b", "c"]]})
+    description = [("id", "int"), ("id", "array")]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.size == 2
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "id": [1, 2],
+        "id__1": ['["a"]', '["b", "c"]'],
+    }
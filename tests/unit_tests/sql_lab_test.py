@@ -61,6 +61,92 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_sql_statement_in_batches(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_sql_statement` can write results in batches.
+    """
+    from superset.common.db_query_status import QueryStatus
+    from superset.sql_lab import execute_sql_statement
+    from superset.sqllab.limiting_factor import LimitingFactor
+
+    query = mocker.MagicMock()
+    query.limit = 3
+    query.select_as_cta_used = False
+    query.limiting_factor = LimitingFactor.DROPDOWN
+    query.status = QueryStatus.RUNNING
+    database = query.database
+    database.allow_dml = False
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_in_batches.return_value = iter(
+        [[(1,), (2,)], [(3,), (4,)]]
+    )
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "int")]
+    results_writer = mocker.MagicMock()
+    results_writer.size = 0
+
+    def write(result_set):
+        results_writer.size += result_set.size
+
+    results_writer.write.side_effect = write
+
+    assert (
+        execute_sql_statement(
+            "SELECT a FROM t",
+            query,
+            session=mocker.MagicMock(),
+            cursor=cursor,
+            log_params={},
+            results_writer=results_writer,
+        )
+        == results_writer
+    )
+
+    db_engine_spec.fetch_data.assert_not_called()
+    assert results_writer.write.call_count == 2
+    # the extra row used to detect limiting was dropped
+    assert results_writer.size == 3
+    assert query.limiting_factor == LimitingFactor.DROPDOWN
+
+
+def test_serialize_and_expand_data_for_storage_and_response(
+    mocker: MockerFixture, app: None
+) -> None:
+    """
+    Test that results are encoded for storage and response in a single pass.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sql_lab import _serialize_and_expand_data_for_storage_and_response
+    from superset.sqllab.results_format import deserialize_table
+
+    stats_logger = mocker.patch("superset.sql_lab.stats_logger")
+    result_set = SupersetResultSet(
+        [(i, str(i)) for i in range(5)], [("a", "int"), ("b", "str")], BaseEngineSpec
+    )
+
+    (
+        stored_data,
+        data,
+        selected_columns,
+        all_columns,
+        expanded_columns,
+    ) = _serialize_and_expand_data_for_storage_and_response(
+        result_set, BaseEngineSpec, display_limit=2
+    )
+
+    assert deserialize_table(stored_data) == result_set.pa_table
+    assert data == [{"a": 0, "b": "0"}, {"a": 1, "b": "1"}]
+    assert selected_columns == all_columns == result_set.columns
+    assert expanded_columns == []
+    assert [call.args[0] for call in stats_logger.timing.call_args_list] == [
+        "sqllab.query.results_backend_pa_serialization",
+        "sqllab.query.results_records_serialization",
+    ]
+
+
 def test_execute_sql_statement_with_rls(
     mocker: MockerFixture,
 ) -> None:
@@ -0,0 +1,95 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+
+import pyarrow as pa
+import pytest
+from cachelib import SimpleCache
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def results_backend(mocker: MockerFixture) -> SimpleCache:
+    cache = SimpleCache()
+    mocker.patch("superset.sqllab.result_chunks.results_backend", cache)
+    return cache
+
+
+def test_write_and_read_chunks(results_backend: SimpleCache) -> None:
+    """
+    Test that results written in chunks are read back as a single table.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sqllab.result_chunks import read_chunks, ResultsChunkWriter
+
+    description = [("a", "int"), ("b", "string")]
+    writer = ResultsChunkWriter("key", 60)
+    writer.write(SupersetResultSet([(1, None), (2, None)], description, BaseEngineSpec))
+    writer.write(SupersetResultSet([], description, BaseEngineSpec))
+    writer.write(SupersetResultSet([(3, "c")], description, BaseEngineSpec))
+
+    assert writer.size == 3
+    assert writer.chunks == [{"key": "key-0", "rows": 2}, {"key": "key-1", "rows": 1}]
+    assert [column["name"] for column in writer.columns] == ["a", "b"]
+
+    table = read_chunks(writer.chunks)
+    assert table.to_pydict() == {"a": [1, 2, 3], "b": [None, None, "c"]}
+
+
+def test_read_chunks_range(mocker: MockerFixture, results_backend: SimpleCache) -> None:
+    """
+    Test that only the chunks overlapping with a range of rows are read.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sqllab.result_chunks import read_chunks, ResultsChunkWriter
+
+    description = [("a", "int")]
+    writer = ResultsChunkWriter("key", 60)
+    for rows in ([(1,), (2,)], [(3,), (4,)], [(5,), (6,)]):
+        writer.write(SupersetResultSet(rows, description, BaseEngineSpec))
+
+    get = mocker.spy(results_backend, "get")
+    table = read_chunks(writer.chunks, offset=1, limit=2)
+    assert table.to_pydict() == {"a": [2, 3]}
+    assert [call.args[0] for call in get.call_args_list] == ["key-0", "key-1"]
+
+    table = read_chunks(writer.chunks, offset=4)
+    assert table.to_pydict() == {"a": [5, 6]}
+    assert read_chunks(writer.chunks, offset=6).num_rows == 0
+
+
+def test_read_missing_chunk(results_backend: SimpleCache) -> None:
+    """
+    Test that an expired chunk is reported as a serialization error.
+    """
+    from superset.exceptions import SerializationError
+    from superset.sqllab.result_chunks import read_chunks
+
+    with pytest.raises(SerializationError):
+        read_chunks([{"key": "missing", "rows": 1}])
+
+
+def test_concat_tables_with_conflicting_types() -> None:
+    """
+    Test that columns with different types across chunks fall back to strings.
+    """
+    from superset.sqllab.result_chunks import concat_tables
+
+    table = concat_tables([pa.table({"a": [1, 2]}), pa.table({"a": ['"x"']})])
+    assert table.to_pydict() == {"a": ["1", "2", '"x"']}
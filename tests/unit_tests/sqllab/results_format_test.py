@@ -0,0 +1,97 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+
+import pyarrow as pa
+import pytest
+from pytest_mock import MockerFixture
+
+TABLE = pa.table({"a": list(range(10)), "b": [str(i) for i in range(10)]})
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_serialize_table(
+    mocker: MockerFixture, app_context: None, compression: str
+) -> None:
+    """
+    Test round-tripping a table through the Arrow IPC file format.
+    """
+    from superset.sqllab import results_format
+    from superset.sqllab.results_format import deserialize_table, serialize_table
+
+    mocker.patch.dict(
+        results_format.config, {"RESULTS_BACKEND_COMPRESSION": compression}
+    )
+    data = serialize_table(TABLE, batch_size=3)
+    assert deserialize_table(data) == TABLE
+
+
+def test_deserialize_table_slice(app_context: None) -> None:
+    """
+    Test reading a range of rows and a subset of columns.
+    """
+    from superset.sqllab.results_format import deserialize_table, serialize_table
+
+    data = serialize_table(TABLE, batch_size=3)
+
+    assert deserialize_table(data, offset=2, limit=5).to_pydict() == {
+        "a": [2, 3, 4, 5, 6],
+        "b": ["2", "3", "4", "5", "6"],
+    }
+    assert deserialize_table(data, offset=8, columns=["b"]).to_pydict() == {
+        "b": ["8", "9"],
+    }
+    assert deserialize_table(data, offset=20).num_rows == 0
+
+
+def test_serialize_results(app_context: None) -> None:
+    """
+    Test serializing a results payload with its header.
+    """
+    from superset.exceptions import SerializationError
+    from superset.sqllab.results_format import (
+        deserialize_results,
+        is_serialized_results,
+        serialize_results,
+        serialize_table,
+    )
+
+    payload = {"status": "success", "data": serialize_table(TABLE)}
+    blob = serialize_results(payload)
+    assert is_serialized_results(blob)
+
+    metadata, table = deserialize_results(blob, limit=2, columns=["a"])
+    assert metadata == {"status": "success", "data": None}
+    assert table.to_pydict() == {"a": [0, 1]}
+
+    metadata, table = deserialize_results(serialize_results({"data": None}))
+    assert table is None
+
+    with pytest.raises(SerializationError):
+        deserialize_results(b"SSRB\x02" + blob[5:])
+
+
+def test_decompress_results(app_context: None) -> None:
+    """
+    Test that only legacy results are decompressed with zlib.
+    """
+    from superset.sqllab.results_format import decompress_results, serialize_results
+    from superset.utils.core import zlib_compress
+
+    blob = serialize_results({"data": None})
+    assert decompress_results(blob, True) is blob
+    assert decompress_results(zlib_compress('{"a": 1}'), False) == '{"a": 1}'
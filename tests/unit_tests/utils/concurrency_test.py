@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel, unused-argument
+
+import threading
+import time
+
+import pytest
+
+
+def test_map_concurrently_preserves_order(app_context: None) -> None:
+    """
+    Test that results are returned in the order of the items.
+    """
+    from superset.utils.concurrency import map_concurrently
+
+    def func(item: int) -> int:
+        time.sleep(0.01 * (5 - item))
+        return item * 2
+
+    assert map_concurrently(func, range(5), max_workers=5) == [0, 2, 4, 6, 8]
+
+
+def test_map_concurrently_copies_context(app_context: None) -> None:
+    """
+    Test that workers run in other threads with a copy of ``g``.
+    """
+    from flask import g
+
+    from superset.utils.concurrency import map_concurrently
+
+    g.user = "admin"
+    main_thread = threading.get_ident()
+
+    def func(item: int) -> bool:
+        return g.user == "admin" and threading.get_ident() != main_thread
+
+    assert all(map_concurrently(func, range(3), max_workers=3))
+
+
+def test_map_concurrently_merges_user(app_context: None) -> None:
+    """
+    Test that workers use a copy of the logged in user bound to their own session.
+    """
+    import sqlalchemy as sa
+    from flask import g
+    from sqlalchemy.orm import make_transient_to_detached
+
+    from superset import db, security_manager
+    from superset.utils.concurrency import map_concurrently
+
+    user = security_manager.user_model(id=1, username="admin")
+    make_transient_to_detached(user)
+    g.user = user
+
+    def func(item: int) -> bool:
+        return (
+            g.user is not user
+            and g.user.username == "admin"
+            and sa.inspect(g.user).session is db.session()
+        )
+
+    assert all(map_concurrently(func, range(3), max_workers=3))
+
+
+def test_map_concurrently_raises_first_error(app_context: None) -> None:
+    """
+    Test that the exception of the first failing item is re-raised.
+    """
+    from superset.utils.concurrency import map_concurrently
+
+    def func(item: int) -> int:
+        if item > 0:
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError, match="1"):
+        map_concurrently(func, range(3), max_workers=3)
+
+
+def test_map_concurrently_nested_runs_serially(app_context: None) -> None:
+    """
+    Test that nested calls run in the worker thread of the outer call.
+    """
+    from superset.utils.concurrency import map_concurrently
+
+    def inner(item: int) -> int:
+        return threading.get_ident()
+
+    def outer(item: int) -> bool:
+        return set(map_concurrently(inner, range(3), max_workers=3)) == {
+            threading.get_ident()
+        }
+
+    assert all(map_concurrently(outer, range(2), max_workers=2))
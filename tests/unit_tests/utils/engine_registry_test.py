@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel
+
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+
+
+def test_engine_registry_reuses_engines(mocker: MockerFixture) -> None:
+    """
+    Test that engines are created once per key and reused afterwards.
+    """
+    from superset.utils.engine_registry import EngineKey, EngineRegistry
+
+    stats_logger = mocker.MagicMock()
+    registry = EngineRegistry(stats_logger=stats_logger)
+    factory = mocker.MagicMock(side_effect=lambda: create_engine("sqlite://"))
+
+    key = EngineKey(1, None, "admin", None, "hash")
+    engine = registry.get(key, factory)
+    assert registry.get(key, factory) is engine
+    factory.assert_called_once()
+    stats_logger.incr.assert_any_call("engine_pool.1.miss")
+    stats_logger.incr.assert_any_call("engine_pool.1.hit")
+
+    other = registry.get(key._replace(effective_username="alpha"), factory)
+    assert other is not engine
+    assert len(registry) == 2
+
+
+def test_engine_registry_evicts_lru(mocker: MockerFixture) -> None:
+    """
+    Test that the least recently used engine is disposed when full.
+    """
+    from superset.utils.engine_registry import EngineKey, EngineRegistry
+
+    registry = EngineRegistry(max_engines=2)
+    engines = [mocker.MagicMock() for _ in range(3)]
+    keys = [EngineKey(i, None, None, None, "hash") for i in range(3)]
+
+    registry.get(keys[0], lambda: engines[0])
+    registry.get(keys[1], lambda: engines[1])
+    registry.get(keys[0], lambda: engines[0])
+    registry.get(keys[2], lambda: engines[2])
+
+    assert keys[0] in registry
+    assert keys[1] not in registry
+    assert keys[2] in registry
+    engines[1].dispose.assert_called_once()
+
+
+def test_engine_registry_dispose(mocker: MockerFixture) -> None:
+    """
+    Test disposing the engines of a single database.
+    """
+    from superset.utils.engine_registry import EngineKey, EngineRegistry
+
+    registry = EngineRegistry()
+    first, second = mocker.MagicMock(), mocker.MagicMock()
+    registry.get(EngineKey(1, None, None, None, "hash"), lambda: first)
+    registry.get(EngineKey(2, None, None, None, "hash"), lambda: second)
+
+    registry.dispose(1)
+    first.dispose.assert_called_once()
+    second.dispose.assert_not_called()
+    assert len(registry) == 1
+
+    registry.dispose()
+    second.dispose.assert_called_once()
+    assert len(registry) == 0
+
+
+def test_engine_registry_after_fork(mocker: MockerFixture) -> None:
+    """
+    Test that engines inherited from a parent process are not reused.
+    """
+    from superset.utils.engine_registry import EngineKey, EngineRegistry
+
+    registry = EngineRegistry()
+    engine = mocker.MagicMock()
+    key = EngineKey(1, None, None, None, "hash")
+    registry.get(key, lambda: engine)
+
+    mocker.patch("superset.utils.engine_registry.os.getpid", return_value=-1)
+    new_engine = mocker.MagicMock()
+    assert registry.get(key, lambda: new_engine) is new_engine
+    engine.dispose.assert_called_once_with(close=False)
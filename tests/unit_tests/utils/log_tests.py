@@ -15,6 +15,10 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import threading
+from typing import Any, Dict, List
+
+from pytest_mock import MockFixture
 
 from superset.utils.log import get_logger_from_status
 
@@ -35,3 +39,98 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_batched_db_event_logger(mocker: MockFixture) -> None:
+    """
+    Test that logs are queued, written in batches, and dropped when the queue is
+    full.
+    """
+    from superset.utils.log import BatchedDBEventLogger
+
+    event_logger = BatchedDBEventLogger(max_queue_size=3, batch_size=2)
+    mocker.patch.object(event_logger, "_start_worker")
+    write = mocker.patch.object(event_logger, "_write")
+    stats_logger = mocker.patch.object(
+        BatchedDBEventLogger, "stats_logger", new_callable=mocker.PropertyMock
+    )
+
+    event_logger.log(
+        user_id=1,
+        action="test",
+        dashboard_id=None,
+        duration_ms=10,
+        slice_id=None,
+        referrer=None,
+        records=[{"a": idx} for idx in range(4)],
+    )
+
+    assert event_logger.dropped == 1
+    stats_logger.return_value.incr.assert_called_once_with("event_logger.dropped")
+    write.assert_not_called()
+
+    event_logger.flush()
+
+    assert [[row["json"] for row in batch] for (batch,), _ in write.call_args_list] == [
+        ['{"a": 0}', '{"a": 1}'],
+        ['{"a": 2}'],
+    ]
+
+
+def test_batched_db_event_logger_worker(mocker: MockFixture) -> None:
+    """
+    Test that the worker survives failing writes, and that closing the logger
+    stops the worker.
+    """
+    from superset.utils.log import BatchedDBEventLogger
+
+    event_logger = BatchedDBEventLogger(batch_size=1)
+    stats_logger = mocker.patch.object(
+        BatchedDBEventLogger, "stats_logger", new_callable=mocker.PropertyMock
+    )
+    mocker.patch("superset.utils.log.current_app")
+    written = threading.Event()
+
+    def write_batch(batch: List[Dict[str, Any]]) -> None:
+        if write.call_count == 1:
+            raise Exception("boom")
+        written.set()
+
+    write = mocker.patch.object(event_logger, "_write", side_effect=write_batch)
+
+    for idx in range(2):
+        event_logger.log(
+            user_id=1,
+            action="test",
+            dashboard_id=None,
+            duration_ms=10,
+            slice_id=None,
+            referrer=None,
+            records=[{"a": idx}],
+        )
+    assert written.wait(5)
+    event_logger.close()
+
+    assert not event_logger._thread.is_alive()  # type: ignore
+    assert write.call_count == 2
+    assert event_logger.dropped == 1
+    stats_logger.return_value.incr.assert_called_once_with("event_logger.dropped")
+
+
+def test_batched_db_event_logger_without_app(
+    mocker: MockFixture, app_context: None
+) -> None:
+    """
+    Test that logs queued outside of an app are dropped and counted.
+    """
+    from superset.utils.log import BatchedDBEventLogger
+
+    event_logger = BatchedDBEventLogger()
+    stats_logger = mocker.patch.object(
+        BatchedDBEventLogger, "stats_logger", new_callable=mocker.PropertyMock
+    )
+
+    event_logger._write([{"action": "a"}, {"action": "b"}])
+
+    assert event_logger.dropped == 2
+    assert stats_logger.return_value.incr.call_count == 2
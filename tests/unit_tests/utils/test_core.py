@@ -19,7 +19,12 @@ from typing import Any, Dict
 
 import pytest
 
-from superset.utils.core import QueryObjectFilterClause, remove_extra_adhoc_filters
+from superset.utils.core import (
+    get_memoized_datasource_queries,
+    memoize_datasource_queries,
+    QueryObjectFilterClause,
+    remove_extra_adhoc_filters,
+)
 
 ADHOC_FILTER: QueryObjectFilterClause = {
     "col": "foo",
@@ -84,3 +89,18 @@ def test_remove_extra_adhoc_filters(
 ) -> None:
     remove_extra_adhoc_filters(original)
     assert expected == original
+
+
+def test_memoize_datasource_queries(app_context: None) -> None:
+    """
+    Test that queries are only memoized within the outermost block.
+    """
+    assert get_memoized_datasource_queries() is None
+    with memoize_datasource_queries():
+        queries = get_memoized_datasource_queries()
+        assert queries == {}
+        queries["key"] = "SELECT 1"
+        with memoize_datasource_queries():
+            assert get_memoized_datasource_queries() is queries
+        assert get_memoized_datasource_queries() == {"key": "SELECT 1"}
+    assert get_memoized_datasource_queries() is None
@@ -0,0 +1,74 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+from unittest.mock import MagicMock
+
+from pytest_mock import MockFixture
+
+
+def test_webdriver_pool_reuses_drivers(mocker: MockFixture) -> None:
+    """
+    Test that drivers are reused for the same user, and recycled after their
+    maximum number of uses.
+    """
+    from superset.utils.webdriver import WebDriverPool
+
+    destroy = mocker.patch("superset.utils.webdriver.WebDriverProxy.destroy")
+    proxy = MagicMock(_driver_type="firefox", _window=(800, 600))
+    proxy.auth.side_effect = lambda user: MagicMock(name=f"driver_{user.id}")
+    pool = WebDriverPool(max_size=4, max_uses=2)
+    user = MagicMock(id=1)
+
+    with pool.driver(proxy, user) as first:
+        pass
+    with pool.driver(proxy, user) as second:
+        pass
+    assert second is first
+    destroy.assert_called_once_with(first)
+
+    with pool.driver(proxy, user) as third:
+        pass
+    assert third is not first
+    with pool.driver(proxy, MagicMock(id=2)) as other:
+        pass
+    assert other is not third
+    assert proxy.auth.call_count == 3
+
+
+def test_webdriver_pool_discards_unhealthy_drivers(mocker: MockFixture) -> None:
+    """
+    Test that unresponsive and idle drivers are destroyed rather than reused.
+    """
+    from superset.utils.webdriver import WebDriverPool
+
+    destroy = mocker.patch("superset.utils.webdriver.WebDriverProxy.destroy")
+    proxy = MagicMock(_driver_type="firefox", _window=(800, 600))
+    proxy.auth.side_effect = lambda user: MagicMock()
+    pool = WebDriverPool(idle_timeout=60)
+    user = MagicMock(id=1)
+
+    with pool.driver(proxy, user) as driver:
+        type(driver).window_handles = mocker.PropertyMock(side_effect=Exception())
+    with pool.driver(proxy, user) as healthy_driver:
+        pass
+    assert healthy_driver is not driver
+    destroy.assert_called_once_with(driver)
+
+    monotonic = mocker.patch("superset.utils.webdriver.monotonic")
+    monotonic.return_value = 1e9
+    pool.evict_idle()
+    destroy.assert_called_with(healthy_driver)
@@ -0,0 +1,57 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+
+from typing import Any, Dict, List
+
+import pyarrow as pa
+from pytest_mock import MockerFixture
+
+
+def test_iter_results_payload_dfs_expanded_columns(
+    mocker: MockerFixture, app_context: None
+) -> None:
+    """
+    Test that every batch of results is laid out with the same expanded columns,
+    even when the nested fields are only set in some of the batches.
+    """
+    from superset.sqllab.results_format import serialize_results, serialize_table
+    from superset.views.utils import _iter_results_payload_dfs
+
+    def expand_data(
+        columns: List[Dict[str, Any]], data: List[Dict[str, Any]]
+    ) -> Any:
+        expanded = [{"name": "a.x", "type": "VARCHAR"}]
+        for row in data:
+            if row["a"] is not None:
+                row["a.x"] = row["a"].upper()
+        return columns + expanded, data, expanded
+
+    table = pa.table({"a": [None, None, "b", None]})
+    payload = serialize_results(
+        {
+            "selected_columns": [{"name": "a", "type": "ROW(x VARCHAR)"}],
+            "data": serialize_table(table, batch_size=2),
+        }
+    )
+    query = mocker.MagicMock()
+    query.database.db_engine_spec.expand_data = expand_data
+
+    dfs = list(_iter_results_payload_dfs(payload, query, use_msgpack=True))
+
+    assert [list(df.columns) for df in dfs] == [["a", "a.x"], ["a", "a.x"]]
+    assert dfs[1]["a.x"].tolist()[0] == "B"